@@ -1,5 +1,3 @@
-from typing import Optional
-
 from pydantic_settings import BaseSettings
 
 
@@ -9,11 +7,49 @@ class Settings(BaseSettings):
 
     # Redis
     redis_url: str = "redis://localhost:6379"
+    redis_cache_enabled: bool = True
+
+    # Principal cache (get_current_user)
+    principal_cache_ttl_seconds: int = 60  # shared Redis tier
+    principal_cache_local_ttl_seconds: int = 10  # per-process LRU tier
+    principal_cache_max_size: int = 10000
+
+    # Project membership cache (Redis sets per project)
+    membership_cache_ttl_seconds: int = 300
+
+    # Project report cache (Redis hash per project, dropped on task writes)
+    report_cache_ttl_seconds: int = 300
 
     # JWT
     secret_key: str = "your-super-secret-key-here-change-in-production"
     algorithm: str = "HS256"
     access_token_expire_minutes: int = 30
+    refresh_token_expire_days: int = 14  # sliding: reset on every refresh
+    token_revocation_refresh_seconds: int = 30
+    # Each refresh re-reads revocations this far back, covering bumps that
+    # committed late or were stamped by a process with a slower clock
+    token_revocation_overlap_seconds: int = 60
+
+    # Password hashing policy (tune with scripts/calibrate_password_hash.py).
+    # Stored hashes that differ from it are upgraded on the next login.
+    password_hash_scheme: str = "bcrypt"  # "bcrypt" or "argon2" (needs argon2-cffi)
+    bcrypt_rounds: int = 12
+    argon2_time_cost: int = 3
+    argon2_memory_cost: int = 65536  # KiB
+    argon2_parallelism: int = 4
+
+    # Password hashing pool (0 workers = hash in the request threadpool)
+    password_hash_workers: int = 2
+    password_hash_queue_depth: int = 32
+
+    # Archival job (scripts/archive_tasks.py): done tasks untouched for this
+    # many days move to the archive tables, this many per transaction
+    archive_after_days: int = 90
+    archive_batch_size: int = 500
+
+    # Tombstone retention (scripts/prune_tombstones.py): deletions are kept
+    # this long for delta sync; clients with an older cursor must resync
+    task_tombstone_retention_days: int = 30
 
     # Application
     debug: bool = True
@@ -0,0 +1,157 @@
+"""Shared caching primitives: Redis client, in-process TTL LRU and hit/miss counters."""
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Hashable, TypeVar
+
+import redis
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# After a Redis error, stay on the local tier for this long before retrying
+REDIS_RETRY_SECONDS = 30
+
+_redis_client: redis.Redis | None = None
+_redis_down_until = 0.0
+
+
+def get_redis() -> redis.Redis | None:
+    """Return the shared Redis client, or None while Redis is disabled or down."""
+    global _redis_client
+    if not settings.redis_cache_enabled or time.monotonic() < _redis_down_until:
+        return None
+    if _redis_client is None:
+        _redis_client = redis.Redis.from_url(
+            settings.redis_url,
+            socket_connect_timeout=0.2,
+            socket_timeout=0.2,
+            decode_responses=True,
+        )
+    return _redis_client
+
+
+def redis_call(op: Callable[[redis.Redis], T], default: T) -> T:
+    """Run `op` against Redis, failing open to `default` if Redis is unavailable."""
+    global _redis_down_until
+    client = get_redis()
+    if client is None:
+        return default
+    try:
+        return op(client)
+    except redis.RedisError as exc:
+        logger.warning("Redis unavailable, using local cache tier only: %s", exc)
+        _redis_down_until = time.monotonic() + REDIS_RETRY_SECONDS
+        return default
+
+
+@dataclass
+class CacheStats:
+    """Hit/miss counters for one named cache."""
+
+    hits: int = 0
+    misses: int = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / total, 4) if total else 0.0,
+        }
+
+
+_stats: dict[str, CacheStats] = {}
+
+
+def get_stats(name: str) -> CacheStats:
+    """Return (creating if needed) the counters registered under `name`."""
+    return _stats.setdefault(name, CacheStats())
+
+
+def all_stats() -> dict[str, dict[str, Any]]:
+    return {name: stats.as_dict() for name, stats in _stats.items()}
+
+
+class LocalTTLCache:
+    """Thread-safe in-process LRU whose entries also expire after `ttl` seconds."""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        _local_caches.append(self)
+
+    def get(self, key: Hashable) -> Any | None:
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+            expires_at, value = item
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+_local_caches: list[LocalTTLCache] = []
+
+
+def reset_caches() -> None:
+    """Clear every in-process cache and counter (used by tests)."""
+    for cache in _local_caches:
+        cache.clear()
+    _stats.clear()
+
+
+# ---------------------------------------------------------------------------
+# Commit-time invalidation
+# ---------------------------------------------------------------------------
+# Invalidating at flush time would let a concurrent reader re-populate a cache
+# from the not-yet-committed old row, so callbacks are queued on the session
+# and only run once the transaction has actually committed.
+
+_AFTER_COMMIT_KEY = "cache_after_commit"
+
+
+def on_commit(db: Session, callback: Callable[[], None]) -> None:
+    """Run `callback` after `db` commits; dropped if the transaction rolls back."""
+    db.info.setdefault(_AFTER_COMMIT_KEY, []).append(callback)
+
+
+@event.listens_for(Session, "after_commit")
+def _run_after_commit(session: Session) -> None:
+    for callback in session.info.pop(_AFTER_COMMIT_KEY, []):
+        try:
+            callback()
+        except Exception:  # a cache must never fail a committed request
+            logger.exception("Cache invalidation callback failed")
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_after_commit(session: Session) -> None:
+    session.info.pop(_AFTER_COMMIT_KEY, None)
@@ -1,3 +1,4 @@
+from dataclasses import dataclass
 from typing import Callable
 
 from fastapi import Depends, HTTPException, status
@@ -6,41 +7,85 @@ from jose import JWTError, jwt
 from sqlalchemy.orm import Session
 
 from app.config import settings
+from app.core import token_revocation
+from app.core.principal_cache import get_principal
 from app.database import get_db
-from app.repositories.user_repository import UserRepository
+from app.models.archive import TaskArchive
+from app.models.task import Task
+from app.models.user import UserRole
+from app.repositories.archive_repository import ArchiveRepository
+from app.repositories.project_member_repository import ProjectMemberRepository
+from app.repositories.project_repository import ProjectRepository
+from app.repositories.task_repository import TaskRepository
 from app.schemas.auth import TokenPayload
 
 # Token URL for Swagger login (not used as form, but required by OAuth2PasswordBearer)
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
 
 
-def get_current_user(
-    db: Session = Depends(get_db), token: str = Depends(oauth2_scheme)
-):
-    """Decode JWT, fetch the current user from DB, and return it."""
-    credentials_exception = HTTPException(
+def credentials_exception() -> HTTPException:
+    return HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
+
+
+def _decode_token(token: str) -> TokenPayload:
     try:
         payload = jwt.decode(
             token, settings.secret_key, algorithms=[settings.algorithm]
         )
-        data = TokenPayload(**payload)
+        return TokenPayload(**payload)
     except (JWTError, ValueError):
-        raise credentials_exception
+        raise credentials_exception()
+
 
-    user = UserRepository.get_by_id(db, int(data.sub))
-    if not user or user.org_id != data.org_id:
-        raise credentials_exception
+def get_current_user(
+    db: Session = Depends(get_db), token: str = Depends(oauth2_scheme)
+):
+    """Decode JWT, resolve the current user via the principal cache, and return it."""
+    data = _decode_token(token)
+
+    user = get_principal(db, int(data.sub))
+    if not user or user.org_id != data.org_id or data.ver < user.token_version:
+        raise credentials_exception()
     return user
 
 
+@dataclass(frozen=True)
+class TokenPrincipal:
+    """Identity and role taken straight from verified token claims."""
+
+    id: int
+    org_id: int
+    role: UserRole
+
+
+def get_token_principal(
+    db: Session = Depends(get_db), token: str = Depends(oauth2_scheme)
+) -> TokenPrincipal:
+    """Claims-only alternative to get_current_user: no users lookup per request.
+
+    Opt in only where id, org and role are enough. Revoked tokens are rejected
+    via the periodically refreshed token-version filter.
+    """
+    data = _decode_token(token)
+    try:
+        principal = TokenPrincipal(
+            id=int(data.sub), org_id=data.org_id, role=UserRole(data.role)
+        )
+    except ValueError:
+        raise credentials_exception()
+    if token_revocation.is_revoked(db, principal.id, data.ver):
+        raise credentials_exception()
+    return principal
+
+
 def require_roles(*roles: str) -> Callable:
     """Dependency factory to enforce role-based access on endpoints."""
 
-    def checker(current_user=Depends(get_current_user)):
+    def checker(current_user=Depends(get_token_principal)):
         if current_user.role.value not in roles:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN, detail="Insufficient permissions"
@@ -48,3 +93,63 @@ def require_roles(*roles: str) -> Callable:
         return current_user
 
     return checker
+
+
+def _authorize_task(db: Session, project_id: int, org_id: int, is_member: bool, user):
+    if org_id != user.org_id:
+        raise HTTPException(status_code=404, detail="Task not found")
+    ProjectMemberRepository.remember(db, project_id, user.id, is_member)
+    if not is_member:
+        raise HTTPException(status_code=403, detail="You are not a project member")
+
+
+def load_task_for_user(
+    db: Session, task_id: int, user, include_archived: bool = False
+) -> Task | TaskArchive:
+    """Load a task the user may access, in a single joined query.
+
+    404 if the task is missing or in another organization, 403 if the user is
+    not a member of its project. The membership answer is remembered for the
+    rest of the request, so later is_member checks cost nothing. With
+    `include_archived`, a task missing from the hot table is looked up in the
+    archive (read-only: callers must not modify it).
+    """
+    found = TaskRepository.get_with_membership(db, task_id, user.id)
+    if found:
+        task, is_member = found
+        org_id = task.project.org_id
+    else:
+        archived = None
+        if include_archived:
+            archived = ArchiveRepository.get_task_with_membership(db, task_id, user.id)
+        if not archived:
+            raise HTTPException(status_code=404, detail="Task not found")
+        task, org_id, is_member = archived
+    _authorize_task(db, task.project_id, org_id, is_member, user)
+    return task
+
+
+def task_cache_state_for_user(db: Session, task_id: int, user):
+    """Like `load_task_for_user`, but only reads the task's ETag inputs."""
+    state = TaskRepository.get_cache_state(db, task_id, user.id)
+    if not state:
+        raise HTTPException(status_code=404, detail="Task not found")
+    _authorize_task(db, state.project_id, state.org_id, state.is_member, user)
+    return state
+
+
+def project_cache_state_for_user(
+    db: Session, project_id: int, user, require_member: bool = True
+):
+    """Authorize access to a project from its ETag inputs (one lookup).
+
+    404 if missing or in another organization; 403 if `require_member` and the
+    user is not a member.
+    """
+    state = ProjectRepository.get_cache_state(db, project_id, user.id)
+    if not state or state.org_id != user.org_id:
+        raise HTTPException(status_code=404, detail="Project not found")
+    ProjectMemberRepository.remember(db, project_id, user.id, state.is_member)
+    if require_member and not state.is_member:
+        raise HTTPException(status_code=403, detail="You are not a project member")
+    return state
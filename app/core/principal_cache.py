@@ -0,0 +1,148 @@
+"""Two-tier cache of authenticated principals (in-process LRU in front of Redis).
+
+`get_current_user` used to load the `User` row on every request even though user
+rows almost never change. The cached `Principal` carries only the columns
+request handlers use for authorization; the password hash is never cached.
+"""
+import json
+from dataclasses import asdict, dataclass
+from typing import cast
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.core.cache import LocalTTLCache, get_stats, on_commit, redis_call
+from app.models.user import User, UserRole
+from app.repositories.user_repository import UserRepository
+
+STATS_NAME = "principal"
+
+_local = LocalTTLCache(
+    maxsize=settings.principal_cache_max_size,
+    ttl=settings.principal_cache_local_ttl_seconds,
+)
+
+
+@dataclass(frozen=True)
+class Principal:
+    """Read-only snapshot of the current user as seen by request handlers."""
+
+    id: int
+    org_id: int
+    email: str
+    full_name: str | None
+    role: UserRole
+    token_version: int = 0
+
+    @classmethod
+    def from_user(cls, user: User) -> "Principal":
+        return cls(
+            id=user.id,
+            org_id=user.org_id,
+            email=user.email,
+            full_name=user.full_name,
+            role=user.role,
+            token_version=user.token_version,
+        )
+
+    def to_json(self) -> str:
+        data = asdict(self)
+        data["role"] = self.role.value
+        return json.dumps(data)
+
+    @classmethod
+    def from_json(cls, raw: str) -> "Principal":
+        data = json.loads(raw)
+        data["role"] = UserRole(data["role"])
+        return cls(**data)
+
+
+# Every committed write to a user raises its generation key. A miss reads the
+# generation together with the principal, before loading the row, and stores
+# the loaded principal only if the generation has not moved since: otherwise a
+# request that read the row just before a password change or revocation could
+# republish the old principal after that change's invalidation had already run.
+_STORE_SCRIPT = """
+if (redis.call('GET', KEYS[2]) or '0') ~= ARGV[1] then
+    return 0
+end
+redis.call('SET', KEYS[1], ARGV[2], 'EX', ARGV[3])
+return 1
+"""
+
+
+def _redis_key(user_id: int) -> str:
+    return f"principal:{user_id}"
+
+
+def _generation_key(user_id: int) -> str:
+    return f"principal:{user_id}:gen"
+
+
+def get_principal(db: Session, user_id: int) -> Principal | None:
+    """Resolve a principal from the local tier, then Redis, then the users table."""
+    stats = get_stats(STATS_NAME)
+
+    principal = _local.get(user_id)
+    if principal is not None:
+        stats.hits += 1
+        return principal
+
+    keys = [_redis_key(user_id), _generation_key(user_id)]
+    no_values: list[str | None] = [None, None]
+    raw, generation = redis_call(
+        lambda r: cast(list[str | None], r.mget(keys)), no_values
+    )
+    if raw is not None:
+        stats.hits += 1
+        principal = Principal.from_json(raw)
+        _local.set(user_id, principal)
+        return principal
+
+    stats.misses += 1
+    user = UserRepository.get_by_id(db, user_id)
+    if user is None:
+        return None
+    principal = Principal.from_user(user)
+    stored = redis_call(
+        lambda r: r.register_script(_STORE_SCRIPT)(
+            keys=[_redis_key(user_id), _generation_key(user_id)],
+            args=[
+                generation or "0",
+                principal.to_json(),
+                settings.principal_cache_ttl_seconds,
+            ],
+        ),
+        None,
+    )
+    # A refused store means a newer write committed while the row was loading;
+    # keep the old principal out of the local tier too
+    if stored != 0:
+        _local.set(user_id, principal)
+    return principal
+
+
+def invalidate(user_id: int) -> None:
+    """Drop a principal from both tiers (other processes expire via local TTL)."""
+    _local.delete(user_id)
+
+    def op(r):
+        pipe = r.pipeline(transaction=False)
+        pipe.incr(_generation_key(user_id))
+        pipe.expire(_generation_key(user_id), settings.principal_cache_ttl_seconds)
+        pipe.delete(_redis_key(user_id))
+        pipe.execute()
+
+    redis_call(op, None)
+
+
+# Any committed insert/update of a user row (created user, password change,
+# role change) evicts that principal, whichever code path made the change.
+@event.listens_for(User, "after_insert")
+@event.listens_for(User, "after_update")
+def _invalidate_on_write(mapper, connection, target: User) -> None:
+    session = Session.object_session(target)
+    user_id = target.id
+    if session is not None:
+        on_commit(session, lambda: invalidate(user_id))
@@ -0,0 +1,83 @@
+"""Redis cache of project reports, invalidated by task writes.
+
+Each project's cached reports live in one Redis hash (`report:{project_id}`),
+one field per report. Field names end with the project's task_seq as read by
+the request, so a result computed before a task write commits is stored under
+the old counter and never served once the write is visible. Reports that
+depend on the date (overdue tasks) also put the day in the field name, and
+the hash expires at the next midnight at the latest, so a cached answer never
+outlives its day. The expiry is set when the hash is created and not extended
+by later fields (EXPIRE NX, Redis 7+). Every task write goes through
+`ProjectRepository.bump_task_seq`, which drops the project's hash once the
+transaction commits, so superseded fields do not pile up.
+
+Without Redis (disabled or down) every read is a miss and goes to the database.
+"""
+from datetime import date, datetime, time, timedelta
+from typing import Any, Callable, Iterable, cast
+
+import orjson
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.core.cache import get_stats, on_commit, redis_call
+
+STATS_NAME = "reports"
+
+
+def _redis_key(project_id: int) -> str:
+    return f"report:{project_id}"
+
+
+def day_field(name: str, day: date) -> str:
+    """Field name of a report computed for `day`."""
+    return f"{name}:{day.isoformat()}"
+
+
+def _ttl_seconds() -> int:
+    now = datetime.now()
+    midnight = datetime.combine(now.date() + timedelta(days=1), time.min)
+    until_midnight = int((midnight - now).total_seconds())
+    return max(1, min(settings.report_cache_ttl_seconds, until_midnight))
+
+
+def get_or_load(
+    project_id: int, task_seq: int, field: str, load: Callable[[], Any]
+) -> Any:
+    """A project's cached report `field` as of `task_seq`, computed by `load`.
+
+    `load` must return JSON-compatible data; hits return it decoded from JSON.
+    """
+    stats = get_stats(STATS_NAME)
+    key = _redis_key(project_id)
+    field = f"{field}:{task_seq}"
+    # decode_responses=True: HGET returns str
+    raw = redis_call(lambda r: cast(str | None, r.hget(key, field)), None)
+    if raw is not None:
+        stats.hits += 1
+        return orjson.loads(raw)
+
+    stats.misses += 1
+    value = load()
+    encoded = orjson.dumps(value).decode()
+
+    def op(r):
+        pipe = r.pipeline(transaction=True)
+        pipe.hset(key, field, encoded)
+        pipe.expire(key, _ttl_seconds(), nx=True)
+        pipe.execute()
+
+    redis_call(op, None)
+    return value
+
+
+def invalidate(project_ids: Iterable[int]) -> None:
+    keys = [_redis_key(project_id) for project_id in project_ids]
+    if keys:
+        redis_call(lambda r: r.delete(*keys), None)
+
+
+def invalidate_on_commit(db: Session, project_ids: Iterable[int]) -> None:
+    """Drop the projects' cached reports once `db` commits."""
+    project_ids = list(project_ids)
+    on_commit(db, lambda: invalidate(project_ids))
@@ -0,0 +1,85 @@
+"""Per-user token-version revocation filter for the claims-only auth path.
+
+Each user row has a `token_version`; access tokens carry the version they were
+issued with (`ver` claim). Bumping the version revokes every older token. The
+claims-only dependency checks tokens against an in-process snapshot of the
+non-zero versions, refreshed periodically, so revocation does not bring back a
+per-request users lookup. Other processes pick up a bump within one refresh
+interval; the process that made it sees it immediately.
+
+The first refresh loads every revoked user; later ones read only users whose
+`token_revoked_at` falls after the previous refresh (minus an overlap), an
+index range over the recent revocations rather than a scan of all of them.
+"""
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.core.cache import on_commit
+from app.models.user import User
+
+_lock = threading.Lock()
+_versions: dict[int, int] = {}
+_loaded_at: float | None = None
+# Wall-clock start of the last refresh; None until the first full load
+_refreshed_since: datetime | None = None
+
+
+def _utcnow() -> datetime:
+    # Timestamp columns are naive and hold UTC
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def _refresh(db: Session) -> None:
+    global _loaded_at, _refreshed_since
+    started = _utcnow()
+    stmt = select(User.id, User.token_version).where(User.token_revoked_at.isnot(None))
+    if _refreshed_since is not None:
+        overlap = timedelta(seconds=settings.token_revocation_overlap_seconds)
+        stmt = stmt.where(User.token_revoked_at >= _refreshed_since - overlap)
+    rows = db.execute(stmt).all()
+    with _lock:
+        for user_id, version in rows:
+            _versions[user_id] = max(version, _versions.get(user_id, 0))
+        _loaded_at = time.monotonic()
+        _refreshed_since = started
+
+
+def current_version(db: Session, user_id: int) -> int:
+    """Return the minimum token version still accepted for `user_id`."""
+    if (
+        _loaded_at is None
+        or time.monotonic() - _loaded_at > settings.token_revocation_refresh_seconds
+    ):
+        _refresh(db)
+    return _versions.get(user_id, 0)
+
+
+def is_revoked(db: Session, user_id: int, token_version: int) -> bool:
+    return token_version < current_version(db, user_id)
+
+
+def revoke_all(db: Session, user: User) -> None:
+    """Bump the user's token version; takes effect locally once `db` commits."""
+    user.token_version += 1
+    user.token_revoked_at = _utcnow()
+    user_id, version = user.id, user.token_version
+
+    def _record() -> None:
+        with _lock:
+            _versions[user_id] = max(version, _versions.get(user_id, 0))
+
+    on_commit(db, _record)
+
+
+def reset() -> None:
+    """Forget the snapshot so the next check reloads it (used by tests)."""
+    global _versions, _loaded_at, _refreshed_since
+    with _lock:
+        _versions = {}
+        _loaded_at = None
+        _refreshed_since = None
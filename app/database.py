@@ -1,23 +1,96 @@
-from sqlalchemy import create_engine
+from typing import Iterator
+
+from fastapi import Request, Response
+from fastapi.routing import APIRoute
+from sqlalchemy import create_engine, event
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import InvalidRequestError
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import ORMExecuteState, Session, sessionmaker
+from starlette.concurrency import run_in_threadpool
 
 from app.config import settings
 
 # Create database engine
 engine = create_engine(settings.database_url)
 
-# Create session factory
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Create session factory. Objects stay loaded after the request's commit, so
+# serializing them afterwards does not re-SELECT every row.
+SessionLocal = sessionmaker(
+    autocommit=False, autoflush=False, expire_on_commit=False, bind=engine
+)
 
 # Create base class for models
 Base = declarative_base()
 
+# Handlers of these methods only read: their session refuses writes and is
+# rolled back instead of committed
+READ_ONLY_METHODS = frozenset({"GET", "HEAD"})
+_READ_ONLY_KEY = "read_only"
+
 
-def get_db():
-    """Dependency to get database session"""
-    db = SessionLocal()
+def request_session(request: Request, factory: sessionmaker) -> Iterator[Session]:
+    """Open the request's unit of work and expose it to `UnitOfWorkRoute`."""
+    db = factory()
+    db.info[_READ_ONLY_KEY] = request.method in READ_ONLY_METHODS
+    request.state.db = db
     try:
         yield db
     finally:
         db.close()
+
+
+def get_db(request: Request):
+    """Dependency to get the request's database session.
+
+    Repositories only add and flush; the whole request is committed once by
+    `UnitOfWorkRoute`.
+    """
+    yield from request_session(request, SessionLocal)
+
+
+class UnitOfWorkRoute(APIRoute):
+    """Commits the request's session once, after the handler succeeded.
+
+    Runs before the response is sent, so a failed commit is reported to the
+    client instead of being lost after a 2xx. Errors (raised or returned as a
+    4xx/5xx response) and read-only sessions are rolled back when the session
+    closes.
+    """
+
+    def get_route_handler(self):
+        handler = super().get_route_handler()
+
+        async def route_handler(request: Request) -> Response:
+            response = await handler(request)
+            db: Session | None = getattr(request.state, "db", None)
+            if (
+                db is not None
+                and not db.info.get(_READ_ONLY_KEY)
+                and response.status_code < 400
+            ):
+                await run_in_threadpool(db.commit)
+            return response
+
+        return route_handler
+
+
+@event.listens_for(Session, "before_flush")
+def _refuse_read_only_flush(session: Session, flush_context, instances) -> None:
+    if session.info.get(_READ_ONLY_KEY):
+        raise InvalidRequestError("Cannot write in a read-only (GET) session")
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _refuse_read_only_dml(state: ORMExecuteState) -> None:
+    if state.session.info.get(_READ_ONLY_KEY) and (
+        state.is_insert or state.is_update or state.is_delete
+    ):
+        raise InvalidRequestError("Cannot write in a read-only (GET) session")
+
+
+def upsert_insert(db: Session, table):
+    """INSERT supporting ON CONFLICT for the session's dialect (PostgreSQL/SQLite)."""
+    if db.get_bind().dialect.name == "sqlite":
+        return sqlite.insert(table)
+    return postgresql.insert(table)
@@ -2,9 +2,19 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 
-from app.config import settings
-from app.routers import (attachments, auth, comments, notifications,
-                         organizations, projects, reports, tasks, users)
+from app.core.cache import all_stats
+from app.routers import (
+    attachments,
+    auth,
+    comments,
+    notifications,
+    organizations,
+    projects,
+    reports,
+    tasks,
+    users,
+)
+from app.services.password_hasher import password_hasher
 
 app = FastAPI(
     title="Task Management API",
@@ -21,6 +31,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "ETag"],
 )
 
 # Mount static files for uploads
@@ -36,6 +47,12 @@ app.include_router(comments.router, prefix="/api/v1", tags=["Comments"])
 app.include_router(attachments.router, prefix="/api/v1", tags=["Attachments"])
 app.include_router(notifications.router, prefix="/api/v1", tags=["Notifications"])
 app.include_router(reports.router, prefix="/api/v1", tags=["Reports"])
+app.include_router(reports.org_router, prefix="/api/v1", tags=["Reports"])
+
+
+@app.on_event("shutdown")
+def shutdown_password_hasher():
+    password_hasher.shutdown()
 
 
 @app.get("/")
@@ -51,3 +68,8 @@ async def root():
 @app.get("/health")
 async def health_check():
     return {"status": "healthy"}
+
+
+@app.get("/metrics/cache")
+async def cache_metrics():
+    return all_stats()
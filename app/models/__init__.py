@@ -1,8 +1,13 @@
 """Aggregate imports so Alembic autogenerate can see all tables."""
+from .archive import AttachmentArchive, CommentArchive, TaskArchive
 from .attachment import Attachment
 from .comment import Comment
 from .notification import Notification, NotificationType
 from .organization import Organization
 from .project import Project, ProjectMember
+from .project_daily_stats import ProjectDailyStats
+from .project_task_stats import ProjectTaskStats
+from .refresh_token import RefreshToken
 from .task import Task, TaskPriority, TaskStatus
+from .task_tombstone import TaskTombstone
 from .user import User, UserRole
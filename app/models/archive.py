@@ -0,0 +1,87 @@
+"""Archive tables for tasks that have been done for a while.
+
+The archival job (scripts/archive_tasks.py) moves such tasks, with their
+comments and attachment metadata, out of the hot tables. Rows keep their ids
+and columns (plus archived_at), so reads that ask for archived rows can UNION
+them with the hot ones.
+"""
+from datetime import date, datetime
+
+from sqlalchemy import Date, DateTime
+from sqlalchemy import Enum as PgEnum
+from sqlalchemy import ForeignKey, Index, Integer, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base
+from app.models.task import TaskPriority, TaskStatus
+
+
+class TaskArchive(Base):
+    """An archived task; same columns as `tasks`."""
+
+    __tablename__ = "tasks_archive"
+    __table_args__ = (
+        Index("ix_tasks_archive_project_created_at", "project_id", "created_at", "id"),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=False)
+    project_id: Mapped[int] = mapped_column(
+        ForeignKey("projects.id", ondelete="CASCADE"), nullable=False
+    )
+    title: Mapped[str] = mapped_column(String(255), nullable=False)
+    description: Mapped[str | None] = mapped_column(Text)
+    status: Mapped[TaskStatus] = mapped_column(
+        PgEnum(TaskStatus, name="task_status"), nullable=False
+    )
+    priority: Mapped[TaskPriority] = mapped_column(
+        PgEnum(TaskPriority, name="task_priority"), nullable=False
+    )
+    due_date: Mapped[date | None] = mapped_column(Date)
+    assignee_id: Mapped[int | None] = mapped_column(
+        ForeignKey("users.id", ondelete="SET NULL")
+    )
+    version: Mapped[int] = mapped_column(Integer, nullable=False)
+    change_seq: Mapped[int] = mapped_column(Integer, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    completed_at: Mapped[datetime | None] = mapped_column(DateTime)
+    archived_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+
+
+class CommentArchive(Base):
+    """A comment of an archived task; same columns as `comments`."""
+
+    __tablename__ = "comments_archive"
+    __table_args__ = (
+        Index("ix_comments_archive_task_created_at", "task_id", "created_at"),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=False)
+    task_id: Mapped[int] = mapped_column(
+        ForeignKey("tasks_archive.id", ondelete="CASCADE"), nullable=False
+    )
+    user_id: Mapped[int] = mapped_column(
+        ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+    )
+    content: Mapped[str] = mapped_column(Text, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    archived_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+
+
+class AttachmentArchive(Base):
+    """Metadata of an archived task's attachment; the file stays where it was."""
+
+    __tablename__ = "attachments_archive"
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=False)
+    task_id: Mapped[int] = mapped_column(
+        ForeignKey("tasks_archive.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+    user_id: Mapped[int] = mapped_column(
+        ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+    )
+    file_name: Mapped[str] = mapped_column(String(255), nullable=False)
+    file_path: Mapped[str] = mapped_column(String(1024), nullable=False)
+    file_size: Mapped[int] = mapped_column(Integer, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    archived_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
@@ -3,7 +3,7 @@ from enum import Enum
 
 from sqlalchemy import Boolean, DateTime
 from sqlalchemy import Enum as PgEnum
-from sqlalchemy import ForeignKey, String, Text
+from sqlalchemy import ForeignKey, Index, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
@@ -19,6 +19,10 @@ class Notification(Base):
     """A simple per-user notification stored in DB (can mirror to Redis)."""
 
     __tablename__ = "notifications"
+    __table_args__ = (
+        # Unread feed: WHERE user_id = ? AND is_read = false ORDER BY created_at DESC
+        Index("ix_notifications_user_unread", "user_id", "is_read", "created_at"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     user_id: Mapped[int] = mapped_column(
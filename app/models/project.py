@@ -1,10 +1,14 @@
 from datetime import datetime, timezone
+from typing import TYPE_CHECKING
 
-from sqlalchemy import DateTime, ForeignKey, String, Text, UniqueConstraint
+from sqlalchemy import DateTime, ForeignKey, Integer, String, Text, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
 
+if TYPE_CHECKING:
+    from app.models.task import Task
+
 
 class Project(Base):
     """A project belongs to an organization and contains tasks."""
@@ -21,6 +25,19 @@ class Project(Base):
     created_at: Mapped[datetime] = mapped_column(
         DateTime, default=lambda: datetime.now(timezone.utc), nullable=False
     )
+    # Change counters behind the ETags of the task and member lists; bumped in
+    # the same transaction as every write to the project's tasks / members
+    task_seq: Mapped[int] = mapped_column(
+        Integer, default=0, server_default="0", nullable=False
+    )
+    member_seq: Mapped[int] = mapped_column(
+        Integer, default=0, server_default="0", nullable=False
+    )
+    # Newest change_seq whose tombstones were pruned: delta sync cursors
+    # older than it can no longer be answered
+    tombstone_seq: Mapped[int] = mapped_column(
+        Integer, default=0, server_default="0", nullable=False
+    )
 
     organization = relationship("Organization", back_populates="projects")
     tasks: Mapped[list["Task"]] = relationship(
@@ -43,8 +60,9 @@ class ProjectMember(Base):
     project_id: Mapped[int] = mapped_column(
         ForeignKey("projects.id", ondelete="CASCADE"), nullable=False
     )
+    # The unique constraint covers project_id lookups; this covers user_id
     user_id: Mapped[int] = mapped_column(
-        ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+        ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
     )
 
     project = relationship("Project", back_populates="members")
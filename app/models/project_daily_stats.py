@@ -0,0 +1,41 @@
+from datetime import date
+
+from sqlalchemy import Date, ForeignKey, Integer
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base
+
+
+def _counter() -> Mapped[int]:
+    return mapped_column(Integer, default=0, server_default="0", nullable=False)
+
+
+def _snapshot() -> Mapped[int | None]:
+    # NULL when the day was backfilled: its counts were never observed
+    return mapped_column(Integer)
+
+
+class ProjectDailyStats(Base):
+    """One project's task aggregates for one (UTC) day.
+
+    Written by the daily snapshot job (scripts/snapshot_task_stats.py) and
+    read by the burndown and throughput reports. Status and priority counts
+    are the project_task_stats counters as of the snapshot, taken only for the
+    day that just ended; `created` and `completed` count tasks created / done
+    during the day.
+    """
+
+    __tablename__ = "project_daily_stats"
+
+    project_id: Mapped[int] = mapped_column(
+        ForeignKey("projects.id", ondelete="CASCADE"), primary_key=True
+    )
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    todo: Mapped[int | None] = _snapshot()
+    in_progress: Mapped[int | None] = _snapshot()
+    done: Mapped[int | None] = _snapshot()
+    low: Mapped[int | None] = _snapshot()
+    medium: Mapped[int | None] = _snapshot()
+    high: Mapped[int | None] = _snapshot()
+    created: Mapped[int] = _counter()
+    completed: Mapped[int] = _counter()
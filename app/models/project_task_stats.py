@@ -0,0 +1,30 @@
+from sqlalchemy import ForeignKey, Integer
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base
+
+
+def _counter() -> Mapped[int]:
+    return mapped_column(Integer, default=0, server_default="0", nullable=False)
+
+
+class ProjectTaskStats(Base):
+    """Task counts of a project per status and per priority.
+
+    Updated in the same transaction as every task create, status or priority
+    change and delete, so reports read one row instead of grouping the tasks.
+    Archived tasks stay counted. Column names are the TaskStatus and
+    TaskPriority member names.
+    """
+
+    __tablename__ = "project_task_stats"
+
+    project_id: Mapped[int] = mapped_column(
+        ForeignKey("projects.id", ondelete="CASCADE"), primary_key=True
+    )
+    todo: Mapped[int] = _counter()
+    in_progress: Mapped[int] = _counter()
+    done: Mapped[int] = _counter()
+    low: Mapped[int] = _counter()
+    medium: Mapped[int] = _counter()
+    high: Mapped[int] = _counter()
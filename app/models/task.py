@@ -1,13 +1,18 @@
 from datetime import date, datetime, timezone
 from enum import Enum
+from typing import TYPE_CHECKING
 
 from sqlalchemy import Date, DateTime
 from sqlalchemy import Enum as PgEnum
-from sqlalchemy import ForeignKey, Index, String, Text
+from sqlalchemy import ForeignKey, Index, Integer, String, Text, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
 
+if TYPE_CHECKING:
+    from app.models.attachment import Attachment
+    from app.models.comment import Comment
+
 
 class TaskStatus(str, Enum):
     todo = "todo"
@@ -15,6 +20,10 @@ class TaskStatus(str, Enum):
     done = "done"
 
 
+# Workflow position of each status; a task's status may only move forward
+STATUS_ORDER = {TaskStatus.todo: 1, TaskStatus.in_progress: 2, TaskStatus.done: 3}
+
+
 class TaskPriority(str, Enum):
     low = "low"
     medium = "medium"
@@ -26,9 +35,50 @@ class Task(Base):
 
     __tablename__ = "tasks"
     __table_args__ = (
+        # Status filters and per-status counts always scope to one project first
+        Index("ix_tasks_project_status", "project_id", "status"),
+        # Overdue report: only open tasks are ever candidates; (due_date, id)
+        # is its keyset order
+        Index(
+            "ix_tasks_project_overdue",
+            "project_id",
+            "due_date",
+            "id",
+            postgresql_where=text("status <> 'done'"),
+            sqlite_where=text("status <> 'done'"),
+        ),
+        # Keyset pagination: one index per sort key of the project task list
+        Index("ix_tasks_project_due_date", "project_id", "due_date", "id"),
+        Index("ix_tasks_project_priority", "project_id", "priority", "id"),
+        Index("ix_tasks_project_created_at", "project_id", "created_at", "id"),
+        Index("ix_tasks_project_updated_at", "project_id", "updated_at", "id"),
+        # "My tasks" across projects; the leading column also serves the
+        # assignee lookups (filters, ON DELETE SET NULL) a plain index would
+        Index(
+            "ix_tasks_assignee_status_due_date",
+            "assignee_id",
+            "status",
+            "due_date",
+            "id",
+        ),
+        # Archival job: done tasks by age of their last write
         Index(
-            "ix_tasks_status_project", "status", "project_id"
-        ),  # required by review criteria
+            "ix_tasks_done_updated_at",
+            "updated_at",
+            "id",
+            postgresql_where=text("status = 'done'"),
+            sqlite_where=text("status = 'done'"),
+        ),
+        # Delta sync: changes of a project after a cursor
+        Index("ix_tasks_project_change_seq", "project_id", "change_seq", "id"),
+        # Daily snapshot: tasks of a project done during a day
+        Index(
+            "ix_tasks_project_completed_at",
+            "project_id",
+            "completed_at",
+            postgresql_where=text("completed_at IS NOT NULL"),
+            sqlite_where=text("completed_at IS NOT NULL"),
+        ),
     )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
@@ -52,6 +102,19 @@ class Task(Base):
         ForeignKey("users.id", ondelete="SET NULL")
     )
 
+    # Optimistic concurrency: every ORM UPDATE is "... WHERE id = ? AND
+    # version = ?" and bumps it; a lost race raises StaleDataError
+    version: Mapped[int] = mapped_column(
+        Integer, default=1, server_default="1", nullable=False
+    )
+    __mapper_args__ = {"version_id_col": version}
+    # Project.task_seq as of this task's last write, stamped as the writing
+    # transaction commits; monotonic per project because the counter's row
+    # lock orders writers (see delta sync)
+    change_seq: Mapped[int] = mapped_column(
+        Integer, default=0, server_default="0", nullable=False
+    )
+
     created_at: Mapped[datetime] = mapped_column(
         DateTime, default=lambda: datetime.now(timezone.utc), nullable=False
     )
@@ -61,6 +124,8 @@ class Task(Base):
         onupdate=lambda: datetime.now(timezone.utc),
         nullable=False,
     )
+    # When the status became done (a done task never moves back)
+    completed_at: Mapped[datetime | None] = mapped_column(DateTime)
 
     project = relationship("Project", back_populates="tasks")
     assignee = relationship("User", back_populates="assigned_tasks")
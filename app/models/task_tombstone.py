@@ -0,0 +1,29 @@
+from datetime import datetime, timezone
+
+from sqlalchemy import DateTime, ForeignKey, Index, Integer
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base
+
+
+class TaskTombstone(Base):
+    """Marks a deleted task so delta sync can tell clients to drop it."""
+
+    __tablename__ = "task_tombstones"
+    __table_args__ = (
+        Index("ix_task_tombstones_project_change_seq", "project_id", "change_seq"),
+        # Retention job: oldest tombstones first
+        Index("ix_task_tombstones_deleted_at", "deleted_at"),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    project_id: Mapped[int] = mapped_column(
+        ForeignKey("projects.id", ondelete="CASCADE"), nullable=False
+    )
+    # Not a foreign key: the task row is gone
+    task_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    # 0 until the deleting transaction stamps it as it commits
+    change_seq: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    deleted_at: Mapped[datetime] = mapped_column(
+        DateTime, default=lambda: datetime.now(timezone.utc), nullable=False
+    )
@@ -1,13 +1,18 @@
 from datetime import datetime, timezone
 from enum import Enum
+from typing import TYPE_CHECKING
 
 from sqlalchemy import DateTime
 from sqlalchemy import Enum as PgEnum
-from sqlalchemy import ForeignKey, Index, String
+from sqlalchemy import ForeignKey, Index, Integer, String, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
 
+if TYPE_CHECKING:
+    from app.models.notification import Notification
+    from app.models.task import Task
+
 
 class UserRole(str, Enum):
     """Global role inside the organization."""
@@ -25,6 +30,12 @@ class User(Base):
         Index(
             "ix_users_email_unique", "email", unique=True
         ),  # required by review criteria
+        Index(
+            "ix_users_token_revoked_at",
+            "token_revoked_at",
+            postgresql_where=text("token_revoked_at IS NOT NULL"),
+            sqlite_where=text("token_revoked_at IS NOT NULL"),
+        ),
     )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
@@ -38,6 +49,13 @@ class User(Base):
     role: Mapped[UserRole] = mapped_column(
         PgEnum(UserRole, name="user_role"), default=UserRole.member, nullable=False
     )
+    # Bumped to revoke every access token issued before the change
+    token_version: Mapped[int] = mapped_column(
+        Integer, default=0, server_default="0", nullable=False
+    )
+    # When token_version was last bumped (UTC): revocation filters reload
+    # only the users revoked since their previous refresh
+    token_revoked_at: Mapped[datetime | None] = mapped_column(DateTime)
 
     created_at: Mapped[datetime] = mapped_column(
         DateTime, default=lambda: datetime.now(timezone.utc), nullable=False
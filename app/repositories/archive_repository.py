@@ -0,0 +1,105 @@
+from collections import defaultdict
+from datetime import datetime
+
+from sqlalchemy import Row, delete, exists, insert, literal, select
+from sqlalchemy.orm import Session
+
+from app.models.archive import AttachmentArchive, CommentArchive, TaskArchive
+from app.models.attachment import Attachment
+from app.models.comment import Comment
+from app.models.project import Project, ProjectMember
+from app.models.task import Task, TaskStatus
+from app.models.task_tombstone import TaskTombstone
+from app.repositories.project_repository import ProjectRepository
+
+# (hot table, archive table) in insert order; deletes run in reverse
+# (live model, archive model, column holding the task id)
+_MOVES = (
+    (Task, TaskArchive, Task.id),
+    (Comment, CommentArchive, Comment.task_id),
+    (Attachment, AttachmentArchive, Attachment.task_id),
+)
+
+
+def _copy(db: Session, source, target, where, archived_at: datetime) -> None:
+    """INSERT INTO target SELECT <source columns>, :archived_at FROM source."""
+    names = [column.name for column in source.__table__.columns]
+    stmt = insert(target).from_select(
+        [*names, "archived_at"],
+        select(
+            *(source.__table__.c[name] for name in names),
+            literal(archived_at, type_=target.archived_at.type),
+        ).where(where),
+    )
+    db.execute(stmt)
+
+
+class ArchiveRepository:
+    @staticmethod
+    def archivable_task_ids(db: Session, cutoff: datetime, limit: int) -> list[int]:
+        """Ids of up to `limit` tasks done and last written before `cutoff`.
+
+        Locks the rows (skipping ones another archiver or writer holds) so the
+        batch cannot change between the copy and the delete.
+        """
+        stmt = (
+            select(Task.id)
+            .where(Task.status == TaskStatus.done, Task.updated_at < cutoff)
+            .order_by(Task.updated_at, Task.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        return list(db.execute(stmt).scalars())
+
+    @staticmethod
+    def move_tasks(db: Session, task_ids: list[int], archived_at: datetime) -> None:
+        """Move tasks with their comments and attachment metadata to the archive.
+
+        Set-based INSERT ... SELECT and DELETE per table, plus a tombstone per
+        task so delta sync clients drop it; does not commit.
+        """
+        by_project: dict[int, set[int]] = defaultdict(set)
+        for task_id, project_id in db.execute(
+            select(Task.id, Task.project_id).where(Task.id.in_(task_ids))
+        ):
+            by_project[project_id].add(task_id)
+        for source, target, key in _MOVES:
+            _copy(db, source, target, key.in_(task_ids), archived_at)
+        db.execute(
+            insert(TaskTombstone).from_select(
+                ["project_id", "task_id", "change_seq", "deleted_at"],
+                select(
+                    Task.project_id,
+                    Task.id,
+                    literal(0),  # stamped as the transaction commits
+                    literal(archived_at, type_=TaskTombstone.deleted_at.type),
+                ).where(Task.id.in_(task_ids)),
+            )
+        )
+        for source, _, key in reversed(_MOVES):
+            db.execute(
+                delete(source)
+                .where(key.in_(task_ids))
+                .execution_options(synchronize_session=False)
+            )
+        # Default task lists and delta sync no longer contain these rows
+        for project_id, moved_ids in by_project.items():
+            ProjectRepository.task_changes(db, project_id).deleted.update(moved_ids)
+
+    @staticmethod
+    def get_task_with_membership(db: Session, task_id: int, user_id: int) -> Row | None:
+        """(archived task, org_id, is_member) in one query, like the hot lookup."""
+        is_member = (
+            exists()
+            .where(
+                ProjectMember.project_id == TaskArchive.project_id,
+                ProjectMember.user_id == user_id,
+            )
+            .label("is_member")
+        )
+        stmt = (
+            select(TaskArchive, Project.org_id, is_member)
+            .join(Project, Project.id == TaskArchive.project_id)
+            .where(TaskArchive.id == task_id)
+        )
+        return db.execute(stmt).one_or_none()
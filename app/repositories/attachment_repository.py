@@ -1,5 +1,6 @@
 from sqlalchemy.orm import Session
 
+from app.models.archive import AttachmentArchive
 from app.models.attachment import Attachment
 
 
@@ -21,10 +22,15 @@ class AttachmentRepository:
             file_size=file_size,
         )
         db.add(att)
-        db.commit()
-        db.refresh(att)
+        db.flush()
         return att
 
     @staticmethod
-    def list_by_task(db: Session, task_id: int) -> list[Attachment]:
-        return db.query(Attachment).filter(Attachment.task_id == task_id).all()
+    def list_by_task(
+        db: Session, task_id: int, archived: bool = False
+    ) -> list[Attachment | AttachmentArchive]:
+        """Attachments of a task; `archived` reads those of an archived task."""
+        if archived:
+            archive = db.query(AttachmentArchive)
+            return list(archive.filter(AttachmentArchive.task_id == task_id))
+        return list(db.query(Attachment).filter(Attachment.task_id == task_id))
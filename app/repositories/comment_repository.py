@@ -1,5 +1,7 @@
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
+from app.models.archive import CommentArchive
 from app.models.comment import Comment
 
 
@@ -8,15 +10,34 @@ class CommentRepository:
     def create(db: Session, task_id: int, user_id: int, content: str) -> Comment:
         comment = Comment(task_id=task_id, user_id=user_id, content=content)
         db.add(comment)
-        db.commit()
-        db.refresh(comment)
+        db.flush()
         return comment
 
     @staticmethod
-    def list_by_task(db: Session, task_id: int) -> list[Comment]:
-        return (
-            db.query(Comment)
-            .filter(Comment.task_id == task_id)
-            .order_by(Comment.created_at.asc())
-            .all()
+    def list_by_task(
+        db: Session,
+        task_id: int,
+        columns: tuple[str, ...] | None = None,
+        archived: bool = False,
+    ) -> list:
+        """Comments of a task, oldest first; plain rows of `columns` when given.
+
+        `archived` reads the comments of an archived task.
+        """
+        model: type[Comment] | type[CommentArchive] = (
+            CommentArchive if archived else Comment
+        )
+        cols = model.__table__.c
+        if columns is None:
+            return (
+                db.query(model)
+                .filter(cols.task_id == task_id)
+                .order_by(cols.created_at.asc())
+                .all()
+            )
+        stmt = (
+            select(*(getattr(model, name) for name in columns))
+            .where(cols.task_id == task_id)
+            .order_by(cols.created_at.asc())
         )
+        return list(db.execute(stmt))
@@ -1,3 +1,4 @@
+from sqlalchemy import insert, select
 from sqlalchemy.orm import Session
 
 from app.models.notification import Notification, NotificationType
@@ -21,18 +22,53 @@ class NotificationRepository:
             task_id=task_id,
         )
         db.add(notif)
-        db.commit()
-        db.refresh(notif)
+        db.flush()
         return notif
 
     @staticmethod
-    def get_unread(db: Session, user_id: int) -> list[Notification]:
-        return (
-            db.query(Notification)
-            .filter(Notification.user_id == user_id, Notification.is_read == False)
+    def create_many(db: Session, values: list[dict]) -> None:
+        """Insert many notifications in one statement.
+
+        Each dict takes the keyword arguments of `create`.
+        """
+        if not values:
+            return
+        rows = [
+            {
+                "user_id": v["user_id"],
+                "type": v["notif_type"],
+                "message": v["message"],
+                "project_id": v.get("project_id"),
+                "task_id": v.get("task_id"),
+            }
+            for v in values
+        ]
+        db.execute(insert(Notification), rows)
+
+    @staticmethod
+    def get_unread(
+        db: Session, user_id: int, columns: tuple[str, ...] | None = None
+    ) -> list:
+        """Unread notifications, newest first; plain rows of `columns` when given."""
+        if columns is None:
+            return (
+                db.query(Notification)
+                .filter(
+                    Notification.user_id == user_id,
+                    Notification.is_read == False,  # noqa: E712
+                )
+                .order_by(Notification.created_at.desc())
+                .all()
+            )
+        stmt = (
+            select(*(getattr(Notification, name) for name in columns))
+            .where(
+                Notification.user_id == user_id,
+                Notification.is_read == False,  # noqa: E712
+            )
             .order_by(Notification.created_at.desc())
-            .all()
         )
+        return list(db.execute(stmt))
 
     @staticmethod
     def mark_read(db: Session, notif_id: int, user_id: int) -> Notification | None:
@@ -43,16 +79,17 @@ class NotificationRepository:
         )
         if notif:
             notif.is_read = True
-            db.commit()
-            db.refresh(notif)
+            db.flush()
         return notif
 
     @staticmethod
     def mark_all_read(db: Session, user_id: int) -> int:
         result = (
             db.query(Notification)
-            .filter(Notification.user_id == user_id, Notification.is_read == False)
+            .filter(
+                Notification.user_id == user_id,
+                Notification.is_read == False,  # noqa: E712
+            )
             .update({"is_read": True})
         )
-        db.commit()
         return result
@@ -0,0 +1,108 @@
+from datetime import date, datetime, time, timedelta
+
+from sqlalchemy import Row, func, select
+from sqlalchemy.orm import Session
+
+from app.database import upsert_insert
+from app.models.project import Project
+from app.models.project_daily_stats import ProjectDailyStats
+from app.models.project_task_stats import ProjectTaskStats
+from app.models.task import Task
+from app.repositories.project_task_stats_repository import COUNTER_COLUMNS
+
+FLOW_COLUMNS = ("created", "completed")
+
+
+class ProjectDailyStatsRepository:
+    @staticmethod
+    def snapshot(
+        db: Session, day: date, after_id: int, limit: int, *, counters: bool
+    ) -> list[int]:
+        """Write `day`'s row for the next `limit` projects by id after `after_id`.
+
+        created/completed are counted over the day on the live table (archived
+        tasks were done long before any day worth snapshotting). With
+        `counters`, status/priority counts are copied from project_task_stats
+        as they are now; otherwise they are left as stored (NULL for a new
+        row). Re-running overwrites what it writes. Returns the project ids
+        written, none once past the last project. Does not commit.
+        """
+        project_ids = list(
+            db.execute(
+                select(Project.id)
+                .where(Project.id > after_id)
+                .order_by(Project.id)
+                .limit(limit)
+            ).scalars()
+        )
+        if not project_ids:
+            return []
+        start = datetime.combine(day, time.min)
+        end = start + timedelta(days=1)
+
+        columns: tuple[str, ...] = FLOW_COLUMNS
+        current = {}
+        if counters:
+            columns = COUNTER_COLUMNS + FLOW_COLUMNS
+            current = {
+                row.project_id: row
+                for row in db.execute(
+                    select(
+                        ProjectTaskStats.project_id,
+                        *(getattr(ProjectTaskStats, name) for name in COUNTER_COLUMNS),
+                    ).where(ProjectTaskStats.project_id.in_(project_ids))
+                )
+            }
+
+        def per_project(column) -> dict[int, int]:
+            stmt = (
+                select(Task.project_id, func.count())
+                .where(Task.project_id.in_(project_ids), column >= start, column < end)
+                .group_by(Task.project_id)
+            )
+            return dict(db.execute(stmt).tuples().all())
+
+        created = per_project(Task.created_at)
+        completed = per_project(Task.completed_at)
+
+        rows = [
+            {
+                "project_id": project_id,
+                "day": day,
+                "created": created.get(project_id, 0),
+                "completed": completed.get(project_id, 0),
+            }
+            for project_id in project_ids
+        ]
+        if counters:
+            for row in rows:
+                stats = current.get(row["project_id"])
+                row.update({name: getattr(stats, name, 0) for name in COUNTER_COLUMNS})
+        stmt = upsert_insert(db, ProjectDailyStats).values(rows)
+        db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=["project_id", "day"],
+                set_={name: stmt.excluded[name] for name in columns},
+            )
+        )
+        return project_ids
+
+    @staticmethod
+    def list_between(
+        db: Session,
+        project_id: int,
+        start: date,
+        end: date,
+        columns: tuple[str, ...],
+    ) -> list[Row]:
+        """Snapshot rows of `columns` for days in [start, end], oldest first."""
+        stmt = (
+            select(*(getattr(ProjectDailyStats, name) for name in columns))
+            .where(
+                ProjectDailyStats.project_id == project_id,
+                ProjectDailyStats.day >= start,
+                ProjectDailyStats.day <= end,
+            )
+            .order_by(ProjectDailyStats.day)
+        )
+        return list(db.execute(stmt))
@@ -1,8 +1,123 @@
-from sqlalchemy import delete, select
+from typing import Any
+
+from sqlalchemy import Row, delete, select
 from sqlalchemy.orm import Session
 
-from app.models.project import ProjectMember
+from app.config import settings
+from app.core.cache import get_stats, on_commit, redis_call
+from app.database import upsert_insert
+from app.models.project import Project, ProjectMember
 from app.models.user import User
+from app.repositories.project_repository import ProjectRepository
+
+STATS_NAME = "membership"
+# Per-request memo, kept on the session: project_id -> member user ids
+_MEMO_KEY = "membership_memo"
+# Single (project_id, user_id) answers learned from other queries
+_PAIRS_KEY = "membership_pairs"
+# Projects whose membership this session changed but has not committed yet;
+# their sets must not be published to Redis
+_DIRTY_KEY = "membership_dirty"
+# Redis cannot store an empty set; this marker (never a user id) makes
+# "cached, no members" distinguishable from "not cached"
+_SENTINEL = "0"
+
+
+# Sets are tagged with the Project.member_seq they were read at. After each
+# committed change the project's generation key is raised to the new
+# member_seq, and a set read at an older generation is never stored: without
+# the check, a reader that loaded before a concurrent add/remove could publish
+# the old set after that change's invalidation had already run.
+_STORE_SCRIPT = """
+local generation = tonumber(redis.call('GET', KEYS[2]) or '-1')
+if generation > tonumber(ARGV[1]) then
+    return 0
+end
+redis.call('DEL', KEYS[1])
+redis.call('SADD', KEYS[1], unpack(ARGV, 3))
+redis.call('EXPIRE', KEYS[1], ARGV[2])
+return 1
+"""
+_INVALIDATE_SCRIPT = """
+local generation = tonumber(redis.call('GET', KEYS[2]) or '-1')
+if tonumber(ARGV[1]) > generation then
+    redis.call('SET', KEYS[2], ARGV[1], 'EX', ARGV[2])
+end
+redis.call('DEL', KEYS[1])
+"""
+
+
+def _redis_key(project_id: int) -> str:
+    return f"project:{project_id}:members"
+
+
+def _generation_key(project_id: int) -> str:
+    return f"project:{project_id}:members:gen"
+
+
+def _memo(db: Session) -> dict[int, frozenset[int]]:
+    return db.info.setdefault(_MEMO_KEY, {})
+
+
+def _read_redis(project_ids: list[int]) -> dict[int, frozenset[int]]:
+    def op(r):
+        pipe = r.pipeline(transaction=False)
+        for project_id in project_ids:
+            pipe.smembers(_redis_key(project_id))
+        return pipe.execute()
+
+    found: dict[int, frozenset[int]] = {}
+    no_sets: list[set[str]] = []
+    for project_id, members in zip(project_ids, redis_call(op, no_sets)):
+        if members:
+            found[project_id] = frozenset(int(m) for m in members if m != _SENTINEL)
+    return found
+
+
+def _write_redis(sets: dict[int, tuple[int, frozenset[int]]]) -> None:
+    """Store (member_seq, members) per project, unless a newer one committed."""
+
+    def op(r):
+        store = r.register_script(_STORE_SCRIPT)
+        pipe = r.pipeline(transaction=False)
+        for project_id, (member_seq, members) in sets.items():
+            store(
+                keys=[_redis_key(project_id), _generation_key(project_id)],
+                args=[
+                    member_seq,
+                    settings.membership_cache_ttl_seconds,
+                    _SENTINEL,
+                    *members,
+                ],
+                client=pipe,
+            )
+        pipe.execute()
+
+    if sets:
+        redis_call(op, None)
+
+
+def _invalidate(db: Session, project_id: int) -> None:
+    """Drop cached membership of a project and bump its member list ETag."""
+    member_seq = ProjectRepository.bump_member_seq(db, project_id)
+    _memo(db).pop(project_id, None)
+    pairs = db.info.get(_PAIRS_KEY, {})
+    for key in [key for key in pairs if key[0] == project_id]:
+        del pairs[key]
+    dirty = db.info.setdefault(_DIRTY_KEY, set())
+    dirty.add(project_id)
+
+    def _after_commit() -> None:
+        dirty.discard(project_id)
+        redis_call(
+            lambda r: r.register_script(_INVALIDATE_SCRIPT)(
+                keys=[_redis_key(project_id), _generation_key(project_id)],
+                args=[member_seq, settings.membership_cache_ttl_seconds],
+            ),
+            None,
+        )
+
+    on_commit(db, _after_commit)
 
 
 class ProjectMemberRepository:
@@ -10,30 +125,124 @@ class ProjectMemberRepository:
     def add_member(db: Session, *, project_id: int, user_id: int):
         member = ProjectMember(project_id=project_id, user_id=user_id)
         db.add(member)
-        db.commit()
-        db.refresh(member)
+        _invalidate(db, project_id)
+        db.flush()
         return member
 
+    @staticmethod
+    def add_members(
+        db: Session, *, project_id: int, user_ids: list[int], org_id: int
+    ) -> list[User]:
+        """Add every user of `org_id` among `user_ids` in one transaction.
+
+        One IN query validates the users, one multi-row INSERT ... ON CONFLICT
+        DO NOTHING RETURNING adds them; rows that already existed are not
+        returned. Returns the newly added users in request order.
+        """
+        wanted = list(dict.fromkeys(user_ids))
+        if not wanted:
+            return []
+        users = {
+            user.id: user
+            for user in db.execute(
+                select(User).where(User.id.in_(wanted), User.org_id == org_id)
+            ).scalars()
+        }
+        if not users:
+            return []
+
+        stmt = (
+            upsert_insert(db, ProjectMember)
+            .values([{"project_id": project_id, "user_id": uid} for uid in users])
+            .on_conflict_do_nothing(index_elements=["project_id", "user_id"])
+            .returning(ProjectMember.user_id)
+        )
+        added_ids = set(db.execute(stmt).scalars())
+        _invalidate(db, project_id)
+        return [users[uid] for uid in wanted if uid in added_ids]
+
     @staticmethod
     def remove_member(db: Session, *, project_id: int, user_id: int):
         stmt = delete(ProjectMember).where(
             ProjectMember.project_id == project_id, ProjectMember.user_id == user_id
         )
         db.execute(stmt)
-        db.commit()
+        _invalidate(db, project_id)
 
     @staticmethod
-    def list_members(db: Session, project_id: int) -> list[User]:
-        stmt = (
-            select(User)
+    def list_members(
+        db: Session, project_id: int, columns: tuple[str, ...] | None = None
+    ) -> list[User] | list[Row[Any]]:
+        """Member users; plain rows of just `columns` of User when given."""
+        if columns is None:
+            users = (
+                select(User)
+                .join(ProjectMember, ProjectMember.user_id == User.id)
+                .where(ProjectMember.project_id == project_id)
+            )
+            return list(db.execute(users).scalars())
+        rows = (
+            select(*(getattr(User, n) for n in columns))
             .join(ProjectMember, ProjectMember.user_id == User.id)
             .where(ProjectMember.project_id == project_id)
         )
-        return list(db.execute(stmt).scalars().all())
+        return list(db.execute(rows).all())
+
+    @staticmethod
+    def members_of(db: Session, project_ids: list[int]) -> dict[int, frozenset[int]]:
+        """Member user ids per project: request memo, then Redis, then one query."""
+        stats = get_stats(STATS_NAME)
+        memo = _memo(db)
+        unique_ids = list(dict.fromkeys(project_ids))
+        result = {pid: memo[pid] for pid in unique_ids if pid in memo}
+
+        missing = [pid for pid in unique_ids if pid not in result]
+        if missing:
+            from_redis = _read_redis(missing)
+            result.update(from_redis)
+            missing = [pid for pid in missing if pid not in from_redis]
+
+        stats.hits += len(unique_ids) - len(missing)
+        if missing:
+            stats.misses += len(missing)
+            # member_seq comes from the same statement, so it is the
+            # generation these members were read at
+            loaded: dict[int, set[int]] = {pid: set() for pid in missing}
+            seqs: dict[int, int] = {}
+            stmt = (
+                select(Project.id, Project.member_seq, ProjectMember.user_id)
+                .outerjoin(ProjectMember, ProjectMember.project_id == Project.id)
+                .where(Project.id.in_(missing))
+            )
+            for project_id, member_seq, user_id in db.execute(stmt):
+                seqs[project_id] = member_seq
+                if user_id is not None:
+                    loaded[project_id].add(user_id)
+            fresh = {pid: frozenset(ids) for pid, ids in loaded.items()}
+            dirty = db.info.get(_DIRTY_KEY, set())
+            _write_redis(
+                {
+                    pid: (seq, fresh[pid])
+                    for pid, seq in seqs.items()
+                    if pid not in dirty
+                }
+            )
+            result.update(fresh)
+
+        memo.update(result)
+        return result
+
+    @staticmethod
+    def remember(db: Session, project_id: int, user_id: int, is_member: bool) -> None:
+        """Record a membership answer obtained elsewhere (e.g. a joined query)."""
+        db.info.setdefault(_PAIRS_KEY, {})[(project_id, user_id)] = is_member
 
     @staticmethod
     def is_member(db: Session, project_id: int, user_id: int) -> bool:
-        stmt = select(ProjectMember).where(
-            ProjectMember.project_id == project_id, ProjectMember.user_id == user_id
+        known = db.info.get(_PAIRS_KEY, {}).get((project_id, user_id))
+        if known is not None:
+            get_stats(STATS_NAME).hits += 1
+            return known
+        return (
+            user_id in ProjectMemberRepository.members_of(db, [project_id])[project_id]
         )
-        return db.execute(stmt).scalar_one_or_none() is not None
@@ -1,7 +1,29 @@
-from sqlalchemy import select
-from sqlalchemy.orm import Session
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Iterable
 
-from app.models.project import Project
+from sqlalchemy import Row, event, exists, select, update
+from sqlalchemy.orm import Session, SessionTransaction
+
+from app.core import report_cache
+from app.models.project import Project, ProjectMember
+from app.models.task import Task
+from app.models.task_tombstone import TaskTombstone
+from app.repositories.project_task_stats_repository import ProjectTaskStatsRepository
+
+# Task writes of the open transaction, project_id -> TaskChanges. The project
+# row lock that orders them is only taken when the transaction commits, so
+# task writers of one project do not queue behind each other's whole request.
+_TASK_CHANGES_KEY = "task_changes"
+
+
+@dataclass
+class TaskChanges:
+    """A transaction's writes to one project's tasks, stamped at commit."""
+
+    changed: set[int] = field(default_factory=set)  # created or updated tasks
+    deleted: set[int] = field(default_factory=set)  # tasks left as tombstones
+    deltas: Counter[str] = field(default_factory=Counter)  # project_task_stats
 
 
 class ProjectRepository:
@@ -11,8 +33,7 @@ class ProjectRepository:
     ) -> Project:
         project = Project(name=name, description=description, org_id=org_id)
         db.add(project)
-        db.commit()
-        db.refresh(project)
+        db.flush()
         return project
 
     @staticmethod
@@ -20,6 +41,127 @@ class ProjectRepository:
         return db.get(Project, project_id)
 
     @staticmethod
-    def list_by_org(db: Session, org_id: int) -> list[Project]:
-        stmt = select(Project).where(Project.org_id == org_id)
-        return list(db.execute(stmt).scalars().all())
+    def list_by_org(
+        db: Session, org_id: int, columns: tuple[str, ...] | None = None
+    ) -> list:
+        """Projects of an org; plain rows of just `columns` when given."""
+        if columns is None:
+            stmt = select(Project).where(Project.org_id == org_id)
+            return list(db.execute(stmt).scalars().all())
+        stmt = select(*(getattr(Project, name) for name in columns)).where(
+            Project.org_id == org_id
+        )
+        return list(db.execute(stmt))
+
+    @staticmethod
+    def get_cache_state(db: Session, project_id: int, user_id: int) -> Row | None:
+        """Project.org_id, the change counters and is_member in one PK lookup."""
+        is_member = (
+            exists()
+            .where(
+                ProjectMember.project_id == Project.id,
+                ProjectMember.user_id == user_id,
+            )
+            .label("is_member")
+        )
+        stmt = select(
+            Project.org_id,
+            Project.task_seq,
+            Project.member_seq,
+            Project.tombstone_seq,
+            is_member,
+        ).where(Project.id == project_id)
+        return db.execute(stmt).one_or_none()
+
+    @staticmethod
+    def task_changes(db: Session, project_id: int) -> TaskChanges:
+        """The open transaction's pending writes to a project's tasks.
+
+        Task writers record what they wrote here instead of taking the
+        project row lock themselves; `stamp_task_changes` applies it all as
+        the transaction's last statements, right before it commits.
+        """
+        pending = db.info.setdefault(_TASK_CHANGES_KEY, {})
+        return pending.setdefault(project_id, TaskChanges())
+
+    @staticmethod
+    def bump_task_seq(db: Session, project_ids: Iterable[int]) -> dict[int, int]:
+        """Advance the task change counters; returns project_id -> new value.
+
+        The UPDATE holds the project row lock until commit, so writers of one
+        project get increasing values in commit order. Projects are bumped in
+        id order so concurrent transactions cannot deadlock.
+        """
+        seqs = {}
+        for project_id in sorted(set(project_ids)):
+            stmt = (
+                update(Project)
+                .where(Project.id == project_id)
+                .values(task_seq=Project.task_seq + 1)
+                .returning(Project.task_seq)
+                .execution_options(synchronize_session=False)
+            )
+            seqs[project_id] = db.execute(stmt).scalar_one()
+        report_cache.invalidate_on_commit(db, seqs)
+        return seqs
+
+    @staticmethod
+    def stamp_task_changes(db: Session, changes: dict[int, TaskChanges]) -> None:
+        """Bump the projects' task_seq and stamp it on the recorded writes.
+
+        The new value becomes change_seq of the written tasks and tombstones
+        (invalidating task list ETags and, on commit, cached reports), and
+        the counter deltas go to project_task_stats under the same lock.
+        """
+        seqs = ProjectRepository.bump_task_seq(db, changes)
+        for project_id, seq in seqs.items():
+            pending = changes[project_id]
+            if pending.changed:
+                db.execute(
+                    update(Task).where(Task.id.in_(pending.changed))
+                    # Not a user-visible write: keep updated_at as it is
+                    .values(change_seq=seq, updated_at=Task.updated_at)
+                )
+            if pending.deleted:
+                db.execute(
+                    update(TaskTombstone)
+                    .where(
+                        TaskTombstone.project_id == project_id,
+                        TaskTombstone.change_seq == 0,
+                        TaskTombstone.task_id.in_(pending.deleted),
+                    )
+                    .values(change_seq=seq)
+                    .execution_options(synchronize_session=False)
+                )
+        ProjectTaskStatsRepository.apply(
+            db, {project_id: pending.deltas for project_id, pending in changes.items()}
+        )
+
+    @staticmethod
+    def bump_member_seq(db: Session, project_id: int) -> int:
+        """Invalidate member list ETags; call inside the writing transaction.
+
+        Returns the new value, the generation of the membership cache.
+        """
+        stmt = (
+            update(Project)
+            .where(Project.id == project_id)
+            .values(member_seq=Project.member_seq + 1)
+            .returning(Project.member_seq)
+            .execution_options(synchronize_session=False)
+        )
+        return db.execute(stmt).scalar_one()
+
+
+@event.listens_for(Session, "before_commit")
+def _stamp_task_changes(session: Session) -> None:
+    changes = session.info.pop(_TASK_CHANGES_KEY, None)
+    if changes:
+        session.flush()
+        ProjectRepository.stamp_task_changes(session, changes)
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _discard_task_changes(session: Session, transaction: SessionTransaction) -> None:
+    if transaction.parent is None:
+        session.info.pop(_TASK_CHANGES_KEY, None)
@@ -0,0 +1,119 @@
+from collections import Counter
+from typing import Iterable
+
+from sqlalchemy import Row, case, func, select, union_all
+from sqlalchemy.orm import Session
+
+from app.database import upsert_insert
+from app.models.archive import TaskArchive
+from app.models.project import Project
+from app.models.project_task_stats import ProjectTaskStats
+from app.models.task import Task, TaskPriority, TaskStatus
+
+STATUS_COLUMNS = tuple(status.name for status in TaskStatus)
+PRIORITY_COLUMNS = tuple(priority.name for priority in TaskPriority)
+COUNTER_COLUMNS = STATUS_COLUMNS + PRIORITY_COLUMNS
+
+
+def count_task(
+    deltas: Counter[str], status: TaskStatus, priority: TaskPriority, sign: int = 1
+) -> None:
+    """Add (or with sign=-1 remove) one task's contribution to `deltas`."""
+    deltas[status.name] += sign
+    deltas[priority.name] += sign
+
+
+class ProjectTaskStatsRepository:
+    @staticmethod
+    def apply(db: Session, deltas: dict[int, Counter[str]]) -> None:
+        """Add per-project counter deltas inside the caller's transaction.
+
+        One INSERT ... ON CONFLICT DO UPDATE per project, in id order; task
+        writes reach it through `ProjectRepository.stamp_task_changes`, under
+        the project row lock, so concurrent increments cannot be lost.
+        """
+        table = ProjectTaskStats.__table__
+        for project_id in sorted(deltas):
+            delta = {name: n for name, n in deltas[project_id].items() if n}
+            if not delta:
+                continue
+            stmt = upsert_insert(db, ProjectTaskStats).values(
+                project_id=project_id, **delta
+            )
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["project_id"],
+                set_={name: table.c[name] + n for name, n in delta.items()},
+            )
+            db.execute(stmt)
+
+    @staticmethod
+    def get(db: Session, project_id: int) -> Row | None:
+        """The project's counters (a primary-key read), None if it has none yet."""
+        stmt = select(
+            *(getattr(ProjectTaskStats, name) for name in COUNTER_COLUMNS)
+        ).where(ProjectTaskStats.project_id == project_id)
+        return db.execute(stmt).one_or_none()
+
+    @staticmethod
+    def rebuild(db: Session, project_ids: Iterable[int]) -> list[int]:
+        """Recount the given projects from their tasks; return the drifted ones.
+
+        Locks the project rows first, which every task writer takes to apply
+        its deltas as it commits, so each write lands either wholly before the
+        recount or on top of it. Does not commit.
+        """
+        project_ids = sorted(set(project_ids))
+        if not project_ids:
+            return []
+        db.execute(
+            select(Project.id)
+            .where(Project.id.in_(project_ids))
+            .order_by(Project.id)
+            .with_for_update()
+        )
+
+        tasks = union_all(
+            *(
+                select(table.c.project_id, table.c.status, table.c.priority).where(
+                    table.c.project_id.in_(project_ids)
+                )
+                for table in (Task.__table__, TaskArchive.__table__)
+            )
+        ).subquery()
+        counts = [
+            func.count(case((tasks.c.status == status, 1))).label(status.name)
+            for status in TaskStatus
+        ] + [
+            func.count(case((tasks.c.priority == priority, 1))).label(priority.name)
+            for priority in TaskPriority
+        ]
+        actual = {
+            row.project_id: {name: getattr(row, name) for name in COUNTER_COLUMNS}
+            for row in db.execute(
+                select(tasks.c.project_id, *counts).group_by(tasks.c.project_id)
+            )
+        }
+        stored = {
+            row.project_id: {name: getattr(row, name) for name in COUNTER_COLUMNS}
+            for row in db.execute(
+                select(
+                    ProjectTaskStats.project_id,
+                    *(getattr(ProjectTaskStats, name) for name in COUNTER_COLUMNS),
+                ).where(ProjectTaskStats.project_id.in_(project_ids))
+            )
+        }
+
+        zero = dict.fromkeys(COUNTER_COLUMNS, 0)
+        drifted = []
+        for project_id in project_ids:
+            expected = actual.get(project_id, zero)
+            if stored.get(project_id, zero) == expected:
+                continue
+            drifted.append(project_id)
+            stmt = upsert_insert(db, ProjectTaskStats).values(
+                project_id=project_id, **expected
+            )
+            db.execute(
+                stmt.on_conflict_do_update(index_elements=["project_id"], set_=expected)
+            )
+        return drifted
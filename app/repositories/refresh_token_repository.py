@@ -0,0 +1,74 @@
+from datetime import datetime
+
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+
+from app.models.refresh_token import RefreshToken
+from app.models.user import User
+
+
+class RefreshTokenRepository:
+    @staticmethod
+    def create(
+        db: Session,
+        *,
+        user_id: int,
+        token_hash: str,
+        family_id: str,
+        expires_at: datetime
+    ) -> RefreshToken:
+        token = RefreshToken(
+            user_id=user_id,
+            token_hash=token_hash,
+            family_id=family_id,
+            expires_at=expires_at,
+        )
+        db.add(token)
+        db.flush()
+        return token
+
+    @staticmethod
+    def get_with_user(db: Session, token_hash: str) -> tuple[RefreshToken, User] | None:
+        """Fetch a token and its owner in one lookup on the unique hash index."""
+        stmt = (
+            select(RefreshToken, User)
+            .join(User, User.id == RefreshToken.user_id)
+            .where(RefreshToken.token_hash == token_hash)
+        )
+        row = db.execute(stmt).one_or_none()
+        return tuple(row) if row else None
+
+    @staticmethod
+    def claim(db: Session, token_id: int, now: datetime) -> bool:
+        """Revoke a live token; False if it was already revoked.
+
+        A single conditional UPDATE, so of two concurrent rotations of the
+        same token exactly one claims it.
+        """
+        stmt = (
+            update(RefreshToken)
+            .where(RefreshToken.id == token_id, RefreshToken.revoked_at.is_(None))
+            .values(revoked_at=now)
+            .execution_options(synchronize_session=False)
+        )
+        return db.execute(stmt).rowcount == 1
+
+    @staticmethod
+    def revoke_family(db: Session, family_id: str, now: datetime) -> None:
+        stmt = (
+            update(RefreshToken)
+            .where(
+                RefreshToken.family_id == family_id, RefreshToken.revoked_at.is_(None)
+            )
+            .values(revoked_at=now)
+        )
+        db.execute(stmt)
+
+    @staticmethod
+    def revoke_all_for_user(db: Session, user_id: int, now: datetime) -> None:
+        stmt = (
+            update(RefreshToken)
+            .where(RefreshToken.user_id == user_id, RefreshToken.revoked_at.is_(None))
+            .values(revoked_at=now)
+        )
+        db.execute(stmt)
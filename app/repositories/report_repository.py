@@ -1,28 +1,125 @@
-from sqlalchemy import func
+from datetime import date
+from typing import Iterator, Sequence
+
+from sqlalchemy import Row, case, func, select
 from sqlalchemy.orm import Session
 
-from app.models.task import Task
+from app.models.project import Project
+from app.models.project_task_stats import ProjectTaskStats
+from app.models.task import Task, TaskStatus
+from app.repositories.project_task_stats_repository import (
+    PRIORITY_COLUMNS,
+    STATUS_COLUMNS,
+    ProjectTaskStatsRepository,
+)
+from app.utils.pagination import keyset_after, keyset_order
 
 
 class ReportRepository:
     @staticmethod
     def count_tasks_by_status(db: Session, project_id: int):
-        rows = (
-            db.query(Task.status, func.count(Task.id))
-            .filter(Task.project_id == project_id)
-            .group_by(Task.status)
-            .all()
-        )
-        return {status.value: count for status, count in rows}
+        """Counts per status, archived tasks included; one primary-key read."""
+        stats = ProjectTaskStatsRepository.get(db, project_id)
+        return {name: getattr(stats, name, 0) for name in STATUS_COLUMNS}
 
     @staticmethod
-    def get_overdue_tasks(db: Session, project_id: int, today):
+    def count_tasks_by_priority(db: Session, project_id: int):
+        """Counts per priority, archived tasks included; one primary-key read."""
+        stats = ProjectTaskStatsRepository.get(db, project_id)
+        return {name: getattr(stats, name, 0) for name in PRIORITY_COLUMNS}
+
+    @staticmethod
+    def _overdue(project_id: int, today: date, columns: tuple[str, ...]):
         return (
-            db.query(Task)
-            .filter(
+            select(*(getattr(Task, name) for name in columns))
+            .where(
                 Task.project_id == project_id,
                 Task.due_date < today,
-                Task.status != "done",
+                Task.status != TaskStatus.done,
+            )
+            .order_by(*keyset_order(Task.due_date, Task.id, False))
+        )
+
+    @staticmethod
+    def get_overdue_tasks(
+        db: Session,
+        project_id: int,
+        today: date,
+        columns: tuple[str, ...],
+        after: tuple[date, int] | None = None,
+        limit: int | None = None,
+    ) -> list[Row]:
+        """Open tasks due before `today`, oldest due date first.
+
+        A page after the (due_date, id) of the last row seen; plain rows of
+        `columns`.
+        """
+        stmt = ReportRepository._overdue(project_id, today, columns)
+        if after is not None:
+            stmt = stmt.where(keyset_after(Task.due_date, Task.id, *after, False))
+        if limit is not None:
+            stmt = stmt.limit(limit)
+        return list(db.execute(stmt))
+
+    @staticmethod
+    def stream_overdue_tasks(
+        db: Session,
+        project_id: int,
+        today: date,
+        columns: tuple[str, ...],
+        batch_size: int = 1000,
+    ) -> Iterator[Sequence[Row]]:
+        """Every overdue task in batches, read through a server-side cursor."""
+        stmt = ReportRepository._overdue(project_id, today, columns)
+        result = db.execute(stmt.execution_options(yield_per=batch_size))
+        yield from result.partitions()
+
+    @staticmethod
+    def org_summary(
+        db: Session, org_id: int, today: date, after_id: int | None, limit: int
+    ) -> list[Row]:
+        """Dashboard rows for a page of an org's projects, in one statement.
+
+        The first `limit` projects by id after `after_id`, each joined to its
+        counter row (status counts) and to its open tasks grouped by assignee
+        (open and overdue counts). Yields one row per (project, assignee with
+        open tasks), or a single row with a NULL `open` for a project that has
+        none; rows are ordered by project id.
+        """
+        projects = select(Project.id, Project.name).where(Project.org_id == org_id)
+        if after_id is not None:
+            projects = projects.where(Project.id > after_id)
+        page = projects.order_by(Project.id).limit(limit).subquery()
+
+        open_tasks = (
+            select(
+                Task.project_id,
+                Task.assignee_id,
+                func.count().label("open"),
+                func.count(case((Task.due_date < today, 1))).label("overdue"),
+            )
+            .where(
+                Task.project_id.in_(select(page.c.id)),
+                Task.status != TaskStatus.done,
+            )
+            .group_by(Task.project_id, Task.assignee_id)
+            .subquery()
+        )
+        stmt = (
+            select(
+                page.c.id,
+                page.c.name,
+                *(
+                    func.coalesce(getattr(ProjectTaskStats, name), 0).label(name)
+                    for name in STATUS_COLUMNS
+                ),
+                open_tasks.c.assignee_id,
+                open_tasks.c.open,
+                open_tasks.c.overdue,
             )
-            .all()
+            .select_from(page)
+            .outerjoin(ProjectTaskStats, ProjectTaskStats.project_id == page.c.id)
+            .outerjoin(open_tasks, open_tasks.c.project_id == page.c.id)
+            .order_by(page.c.id, open_tasks.c.assignee_id.asc().nulls_last())
         )
+        return list(db.execute(stmt))
@@ -1,8 +1,148 @@
-from sqlalchemy import select
-from sqlalchemy.orm import Session
+from datetime import date, datetime, timezone
+from typing import Any
 
+from sqlalchemy import (
+    Double,
+    Row,
+    and_,
+    case,
+    cast,
+    delete,
+    exists,
+    func,
+    insert,
+    literal,
+    literal_column,
+    or_,
+    select,
+    tuple_,
+    union_all,
+    update,
+)
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import Session, contains_eager
+from sqlalchemy.orm.attributes import instance_state, set_committed_value
+from sqlalchemy.sql.elements import ColumnElement
+
+from app.models.archive import TaskArchive
+from app.models.project import Project, ProjectMember
 from app.models.task import Task, TaskPriority, TaskStatus
-from app.schemas.task import TaskCreate, TaskUpdate
+from app.models.task_tombstone import TaskTombstone
+from app.repositories.project_repository import ProjectRepository
+from app.repositories.project_task_stats_repository import count_task
+from app.schemas.task import SortOrder, TaskCreate, TaskSortKey, TaskUpdate
+from app.utils.pagination import (
+    decode_cursor,
+    encode_cursor,
+    keyset_after,
+    keyset_order,
+)
+
+
+def _dump_sort_value(sort: TaskSortKey, value: Any) -> Any:
+    if value is None:
+        return None
+    if sort == TaskSortKey.priority:
+        return value.name
+    return value.isoformat()
+
+
+def _load_sort_value(sort: TaskSortKey, raw: Any) -> Any:
+    if raw is None:
+        return None
+    if sort == TaskSortKey.priority:
+        return TaskPriority[raw]
+    if sort == TaskSortKey.due_date:
+        return date.fromisoformat(raw)
+    return datetime.fromisoformat(raw)
+
+
+def encode_task_cursor(task: Any, sort: TaskSortKey, order: SortOrder) -> str:
+    """Cursor after `task`: a Task or any row with `id` and the sort column."""
+    value = getattr(task, sort.value)
+    return encode_cursor(
+        {
+            "s": sort.value,
+            "o": order.value,
+            "v": _dump_sort_value(sort, value),
+            "id": task.id,
+        }
+    )
+
+
+def decode_task_cursor(
+    cursor: str, sort: TaskSortKey, order: SortOrder
+) -> tuple[Any, int]:
+    """Return the (sort value, id) a cursor points after; ValueError if unusable."""
+    payload = decode_cursor(cursor)
+    if payload.get("s") != sort.value or payload.get("o") != order.value:
+        raise ValueError("Cursor does not match the requested sort")
+    try:
+        return _load_sort_value(sort, payload.get("v")), int(payload["id"])
+    except (KeyError, TypeError) as exc:
+        raise ValueError("Invalid cursor") from exc
+
+
+def encode_search_cursor(q: str, rank: float, task_id: int) -> str:
+    return encode_cursor({"q": q, "r": rank, "id": task_id})
+
+
+def decode_search_cursor(cursor: str, q: str) -> tuple[float, int]:
+    """Return the (rank, id) a search cursor points after; ValueError if unusable."""
+    payload = decode_cursor(cursor)
+    if payload.get("q") != q:
+        raise ValueError("Cursor does not match the search query")
+    try:
+        return float(payload["r"]), int(payload["id"])
+    except (KeyError, TypeError, ValueError) as exc:
+        raise ValueError("Invalid cursor") from exc
+
+
+def encode_change_cursor(change_seq: int, task_id: int | None) -> str:
+    return encode_cursor({"cs": change_seq, "id": task_id})
+
+
+def decode_change_cursor(cursor: str) -> tuple[int, int | None]:
+    """Return the (change_seq, id) a delta sync cursor points after."""
+    payload = decode_cursor(cursor)
+    try:
+        task_id = payload["id"]
+        return int(payload["cs"]), None if task_id is None else int(task_id)
+    except (KeyError, TypeError, ValueError) as exc:
+        raise ValueError("Invalid cursor") from exc
+
+
+# Generated by the database (see migration 7a2c9e4b1d60) and deliberately not
+# mapped on Task: it only exists on PostgreSQL and is never written by the app.
+SEARCH_VECTOR = literal_column("tasks.search_vector", type_=TSVECTOR)
+SEARCH_CONFIG = "english"
+
+
+def _search_match(db: Session, q: str) -> tuple[ColumnElement, ColumnElement]:
+    """(WHERE clause, rank expression) for a text query on this dialect.
+
+    PostgreSQL uses the GIN-indexed tsvector. Other dialects (the SQLite test
+    database) fall back to matching every word with LIKE, ranking title hits
+    above description-only hits like the A/B weights do.
+    """
+    if db.get_bind().dialect.name == "postgresql":
+        query = func.websearch_to_tsquery(SEARCH_CONFIG, q)
+        # float8 so the rank round-trips through the cursor exactly
+        rank = cast(func.ts_rank_cd(SEARCH_VECTOR, query), Double)
+        return SEARCH_VECTOR.bool_op("@@")(query), rank
+
+    words = q.split()
+    in_title = and_(*(Task.title.icontains(w, autoescape=True) for w in words))
+    in_description = and_(
+        *(Task.description.icontains(w, autoescape=True) for w in words)
+    )
+    return or_(in_title, in_description), case((in_title, 1.0), else_=0.5)
+
+
+def mark_completion(task: Task, old_status: TaskStatus) -> None:
+    """Stamp `completed_at` if this write moved the task to done."""
+    if task.status == TaskStatus.done and old_status != TaskStatus.done:
+        task.completed_at = datetime.now(timezone.utc)
 
 
 class TaskRepository:
@@ -17,14 +157,167 @@ class TaskRepository:
             due_date=payload.due_date,
         )
         db.add(task)
-        db.commit()
-        db.refresh(task)
+        db.flush()
+        changes = ProjectRepository.task_changes(db, project_id)
+        changes.changed.add(task.id)
+        count_task(changes.deltas, task.status, task.priority)
         return task
 
     @staticmethod
     def get_by_id(db: Session, task_id: int) -> Task | None:
         return db.get(Task, task_id)
 
+    @staticmethod
+    def create_many(
+        db: Session, project_id: int, payloads: list[TaskCreate]
+    ) -> list[Task]:
+        """Insert tasks with one multi-row INSERT ... RETURNING.
+
+        Returns the new tasks in payload order.
+        """
+        rows = [
+            {
+                "project_id": project_id,
+                "title": payload.title,
+                "description": payload.description,
+                "assignee_id": payload.assignee_id,
+                "priority": payload.priority,
+                "due_date": payload.due_date,
+            }
+            for payload in payloads
+        ]
+        stmt = insert(Task).returning(Task, sort_by_parameter_order=True)
+        tasks = list(db.scalars(stmt, rows).all())
+        changes = ProjectRepository.task_changes(db, project_id)
+        for task in tasks:
+            changes.changed.add(task.id)
+            count_task(changes.deltas, task.status, task.priority)
+        return tasks
+
+    @staticmethod
+    def update_many(db: Session, tasks: list[Task]) -> bool:
+        """Write the pending attribute changes of `tasks` in one statement.
+
+        UPDATE ... FROM a CTE of one row per changed task, each a
+        compare-and-swap on the version the task was loaded at, which the
+        statement bumps. A versioned ORM flush cannot batch these (it needs
+        every row's own rowcount). Returns False if any task was modified
+        concurrently; the caller must roll back, as some rows may be written.
+        """
+        columns = Task.__table__.c
+        changed = []
+        for task in tasks:
+            keys = [
+                attr.key
+                for attr in instance_state(task).attrs
+                if attr.key in columns and attr.history.has_changes()
+            ]
+            if keys:
+                changed.append((task, keys))
+        if not changed:
+            return True
+        fields = sorted({key for _, keys in changed for key in keys})
+        postgresql = db.get_bind().dialect.name == "postgresql"
+
+        def value(task: Task, key: str) -> ColumnElement:
+            bound = literal(getattr(task, key), columns[key].type)
+            # PostgreSQL types a UNION of bare parameters as text, which does
+            # not assign to enum columns. SQLite stores what it is given, and
+            # a CAST there would turn dates into numbers.
+            return cast(bound, columns[key].type) if postgresql else bound
+
+        batch = union_all(
+            *(
+                select(
+                    *(value(task, key).label(key) for key in ("id", "version", *fields))
+                )
+                for task, _ in changed
+            )
+        ).cte("batch")
+        stmt = (
+            update(Task)
+            .where(Task.id == batch.c.id, Task.version == batch.c.version)
+            .values({**{f: batch.c[f] for f in fields}, "version": Task.version + 1})
+            .returning(Task.id, Task.version, Task.updated_at)
+            .execution_options(synchronize_session=False)
+        )
+        written = {row.id: row for row in db.execute(stmt)}
+        if len(written) < len(changed):
+            return False
+        # The rows are written: record the new values as the tasks' loaded
+        # state so the next flush does not write them again
+        for task, keys in changed:
+            row = written[task.id]
+            for key in keys:
+                set_committed_value(task, key, getattr(task, key))
+            set_committed_value(task, "version", row.version)
+            set_committed_value(task, "updated_at", row.updated_at)
+        return True
+
+    @staticmethod
+    def get_with_membership(
+        db: Session, task_id: int, user_id: int
+    ) -> tuple[Task, bool] | None:
+        """Load a task, its project and the user's membership in one query."""
+        is_member = (
+            exists()
+            .where(
+                ProjectMember.project_id == Task.project_id,
+                ProjectMember.user_id == user_id,
+            )
+            .label("is_member")
+        )
+        stmt = (
+            select(Task, is_member)
+            .join(Task.project)
+            .options(contains_eager(Task.project))
+            .where(Task.id == task_id)
+        )
+        row = db.execute(stmt).one_or_none()
+        return (row[0], bool(row[1])) if row else None
+
+    @staticmethod
+    def get_cache_state(db: Session, task_id: int, user_id: int) -> Row | None:
+        """(project_id, org_id, version, is_member) for ETag checks.
+
+        One primary-key lookup; no Task object is loaded.
+        """
+        is_member = (
+            exists()
+            .where(
+                ProjectMember.project_id == Task.project_id,
+                ProjectMember.user_id == user_id,
+            )
+            .label("is_member")
+        )
+        stmt = (
+            select(Task.project_id, Project.org_id, Task.version, is_member)
+            .join(Project, Project.id == Task.project_id)
+            .where(Task.id == task_id)
+        )
+        return db.execute(stmt).one_or_none()
+
+    @staticmethod
+    def get_many_with_membership(
+        db: Session, task_ids: list[int], user_id: int
+    ) -> dict[int, tuple[Task, bool]]:
+        """`get_with_membership` for many tasks in one query, keyed by task id."""
+        is_member = (
+            exists()
+            .where(
+                ProjectMember.project_id == Task.project_id,
+                ProjectMember.user_id == user_id,
+            )
+            .label("is_member")
+        )
+        stmt = (
+            select(Task, is_member)
+            .join(Task.project)
+            .options(contains_eager(Task.project))
+            .where(Task.id.in_(task_ids))
+        )
+        return {task.id: (task, bool(member)) for task, member in db.execute(stmt)}
+
     @staticmethod
     def list_by_project(
         db: Session,
@@ -32,22 +325,263 @@ class TaskRepository:
         status: TaskStatus | None = None,
         assignee_id: int | None = None,
         priority: TaskPriority | None = None,
-    ) -> list[Task]:
-        stmt = select(Task).where(Task.project_id == project_id)
+        *,
+        sort: TaskSortKey = TaskSortKey.created_at,
+        order: SortOrder = SortOrder.asc,
+        after: tuple[Any, int] | None = None,
+        limit: int | None = None,
+        columns: tuple[str, ...] | None = None,
+        include_archived: bool = False,
+    ) -> list:
+        """List a project's tasks in (sort, id) order, starting after `after`.
+
+        Pass `limit + 1` to find out whether another page exists. With
+        `columns`, returns plain rows of just those columns (plus id and the
+        sort key, needed for the cursor) instead of Task objects.
+        `include_archived` (requires `columns`) merges in tasks_archive: each
+        table contributes its own first `limit` rows, which are then merged.
+        """
+        descending = order == SortOrder.desc
+
+        def page(model):
+            # On tasks, each sort is backed by an index on (project_id, <column>, id)
+            column = getattr(model, sort.value)
+            if columns is None:
+                stmt = select(model)
+            else:
+                names = dict.fromkeys((*columns, "id", sort.value))
+                stmt = select(*(getattr(model, name) for name in names))
+            stmt = stmt.where(model.project_id == project_id)
 
+            if status:
+                stmt = stmt.where(model.status == status)
+            if assignee_id:
+                stmt = stmt.where(model.assignee_id == assignee_id)
+            if priority:
+                stmt = stmt.where(model.priority == priority)
+            if after is not None:
+                value, last_id = after
+                stmt = stmt.where(
+                    keyset_after(
+                        column,
+                        model.id,
+                        value,
+                        last_id,
+                        descending,
+                        nullable=sort == TaskSortKey.due_date,
+                    )
+                )
+
+            stmt = stmt.order_by(*keyset_order(column, model.id, descending))
+            if limit is not None:
+                stmt = stmt.limit(limit)
+            return stmt
+
+        if not include_archived:
+            result = db.execute(page(Task))
+            return list(result.scalars() if columns is None else result)
+        if columns is None:
+            raise ValueError("include_archived needs columns")
+        merged = union_all(
+            *(select(page(model).subquery()) for model in (Task, TaskArchive))
+        ).subquery()
+        stmt = select(merged).order_by(
+            *keyset_order(merged.c[sort.value], merged.c.id, descending)
+        )
+        if limit is not None:
+            stmt = stmt.limit(limit)
+        return list(db.execute(stmt))
+
+    @staticmethod
+    def list_for_assignee(
+        db: Session,
+        user_id: int,
+        status: TaskStatus | None = None,
+        priority: TaskPriority | None = None,
+        due_from: date | None = None,
+        due_to: date | None = None,
+        *,
+        after: tuple[Any, int] | None = None,
+        limit: int | None = None,
+        columns: tuple[str, ...],
+    ) -> list:
+        """Rows of tasks assigned to the user, across every project they belong to.
+
+        Ordered by (due_date, id), undated last, starting after `after`; runs
+        on ix_tasks_assignee_status_due_date. Membership is one join, not a
+        check per project. `columns` always gets id and due_date appended for
+        the cursor.
+        """
+        names = dict.fromkeys((*columns, "id", "due_date"))
+        stmt = (
+            select(*(getattr(Task, name) for name in names))
+            .join(
+                ProjectMember,
+                and_(
+                    ProjectMember.project_id == Task.project_id,
+                    ProjectMember.user_id == user_id,
+                ),
+            )
+            .where(Task.assignee_id == user_id)
+        )
         if status:
             stmt = stmt.where(Task.status == status)
-        if assignee_id:
-            stmt = stmt.where(Task.assignee_id == assignee_id)
         if priority:
             stmt = stmt.where(Task.priority == priority)
-
-        return list(db.execute(stmt).scalars().all())
+        if due_from:
+            stmt = stmt.where(Task.due_date >= due_from)
+        if due_to:
+            stmt = stmt.where(Task.due_date <= due_to)
+        if after is not None:
+            value, last_id = after
+            stmt = stmt.where(
+                keyset_after(
+                    Task.due_date, Task.id, value, last_id, False, nullable=True
+                )
+            )
+        stmt = stmt.order_by(*keyset_order(Task.due_date, Task.id, False))
+        if limit is not None:
+            stmt = stmt.limit(limit)
+        return list(db.execute(stmt))
 
     @staticmethod
     def update(db: Session, task: Task, payload: TaskUpdate) -> Task:
+        old_status, old_priority = task.status, task.priority
         for field, value in payload.model_dump(exclude_unset=True).items():
             setattr(task, field, value)
-        db.commit()
-        db.refresh(task)
+        mark_completion(task, old_status)
+        if db.is_modified(task):
+            changes = ProjectRepository.task_changes(db, task.project_id)
+            changes.changed.add(task.id)
+            count_task(changes.deltas, old_status, old_priority, -1)
+            count_task(changes.deltas, task.status, task.priority)
+        # Flushed here so a lost compare-and-swap raises to the caller
+        db.flush()
         return task
+
+    @staticmethod
+    def delete(db: Session, task: Task) -> None:
+        """Delete a task, leaving a tombstone for delta sync."""
+        db.add(TaskTombstone(project_id=task.project_id, task_id=task.id))
+        db.delete(task)
+        db.flush()
+        changes = ProjectRepository.task_changes(db, task.project_id)
+        changes.deleted.add(task.id)
+        count_task(changes.deltas, task.status, task.priority, -1)
+
+    @staticmethod
+    def list_changes(
+        db: Session,
+        project_id: int,
+        *,
+        upto: int,
+        after: tuple[int, int | None] | None,
+        limit: int,
+        columns: tuple[str, ...],
+    ) -> list:
+        """Rows of tasks written after `after` and no later than seq `upto`.
+
+        `after` is (change_seq, id) of the last row already sent, or
+        (change_seq, None) for "everything through change_seq". Ordered by
+        (change_seq, id) on ix_tasks_project_change_seq. `columns` always
+        gets change_seq and id appended for the cursor.
+        """
+        names = dict.fromkeys((*columns, "change_seq", "id"))
+        stmt = select(*(getattr(Task, name) for name in names)).where(
+            Task.project_id == project_id, Task.change_seq <= upto
+        )
+        if after is not None:
+            seq, last_id = after
+            if last_id is None:
+                stmt = stmt.where(Task.change_seq > seq)
+            else:
+                stmt = stmt.where(tuple_(Task.change_seq, Task.id) > (seq, last_id))
+        stmt = stmt.order_by(Task.change_seq, Task.id).limit(limit)
+        return list(db.execute(stmt))
+
+    @staticmethod
+    def deleted_between(db: Session, project_id: int, lower: int, upper: int):
+        """Ids of tasks deleted with lower < change_seq <= upper."""
+        stmt = (
+            select(TaskTombstone.task_id)
+            .where(
+                TaskTombstone.project_id == project_id,
+                TaskTombstone.change_seq > lower,
+                TaskTombstone.change_seq <= upper,
+            )
+            .order_by(TaskTombstone.change_seq)
+        )
+        return list(db.execute(stmt).scalars())
+
+    @staticmethod
+    def prune_tombstones(db: Session, cutoff: datetime, limit: int) -> int:
+        """Delete up to `limit` tombstones written before `cutoff`.
+
+        Raises each affected project's tombstone_seq to the newest change_seq
+        removed, so delta sync can refuse cursors the remaining tombstones no
+        longer cover. Returns how many were deleted; does not commit.
+        """
+        rows = db.execute(
+            select(TaskTombstone.id, TaskTombstone.project_id, TaskTombstone.change_seq)
+            .where(TaskTombstone.deleted_at < cutoff)
+            .order_by(TaskTombstone.deleted_at, TaskTombstone.id)
+            .limit(limit)
+        ).all()
+        if not rows:
+            return 0
+        floors: dict[int, int] = {}
+        for _, project_id, change_seq in rows:
+            floors[project_id] = max(floors.get(project_id, 0), change_seq)
+        # Id order, like task writers, so the two cannot deadlock
+        for project_id in sorted(floors):
+            db.execute(
+                update(Project)
+                .where(
+                    Project.id == project_id,
+                    Project.tombstone_seq < floors[project_id],
+                )
+                .values(tombstone_seq=floors[project_id])
+                .execution_options(synchronize_session=False)
+            )
+        db.execute(
+            delete(TaskTombstone)
+            .where(TaskTombstone.id.in_([row.id for row in rows]))
+            .execution_options(synchronize_session=False)
+        )
+        return len(rows)
+
+    @staticmethod
+    def search(
+        db: Session,
+        q: str,
+        *,
+        org_id: int,
+        user_id: int,
+        project_id: int | None = None,
+        after: tuple[float, int] | None = None,
+        limit: int = 50,
+    ) -> list[tuple[Task, float]]:
+        """Tasks matching `q`, best match first, as (task, rank) pairs.
+
+        Scoped to one project, or to every project of `org_id` the user is a
+        member of. Pages by (rank, id) starting after `after`.
+        """
+        match, rank = _search_match(db, q)
+        stmt = select(Task, rank.label("rank")).where(match)
+        if project_id is not None:
+            stmt = stmt.where(Task.project_id == project_id)
+        else:
+            stmt = stmt.join(Project, Project.id == Task.project_id).where(
+                Project.org_id == org_id,
+                exists().where(
+                    ProjectMember.project_id == Task.project_id,
+                    ProjectMember.user_id == user_id,
+                ),
+            )
+        if after is not None:
+            last_rank, last_id = after
+            stmt = stmt.where(
+                or_(rank < last_rank, and_(rank == last_rank, Task.id < last_id))
+            )
+        stmt = stmt.order_by(rank.desc(), Task.id.desc()).limit(limit)
+        return [(task, float(score)) for task, score in db.execute(stmt).all()]
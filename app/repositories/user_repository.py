@@ -2,7 +2,6 @@ from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from app.models.user import User, UserRole
-from app.utils.security import hash_password
 
 
 class UserRepository:
@@ -18,9 +17,25 @@ class UserRepository:
         return db.execute(stmt).scalar_one_or_none()
 
     @staticmethod
-    def list_by_org(db: Session, org_id: int) -> list[User]:
-        stmt = select(User).where(User.org_id == org_id)
-        return list(db.execute(stmt).scalars().all())
+    def list_by_org(
+        db: Session, org_id: int, columns: tuple[str, ...] | None = None
+    ) -> list:
+        """Users of an org; plain rows of just `columns` when given."""
+        if columns is None:
+            stmt = select(User).where(User.org_id == org_id)
+            return list(db.execute(stmt).scalars().all())
+        stmt = select(*(getattr(User, name) for name in columns)).where(
+            User.org_id == org_id
+        )
+        return list(db.execute(stmt))
+
+    @staticmethod
+    def ids_in_org(db: Session, org_id: int, user_ids: set[int]) -> set[int]:
+        """The subset of `user_ids` that exist in `org_id`, in one query."""
+        if not user_ids:
+            return set()
+        stmt = select(User.id).where(User.id.in_(user_ids), User.org_id == org_id)
+        return set(db.execute(stmt).scalars())
 
     @staticmethod
     def create_in_org(
@@ -28,18 +43,17 @@ class UserRepository:
         *,
         org_id: int,
         email: str,
-        password: str,
+        password_hash: str,
         full_name: str | None,
         role: str
     ) -> User:
         user = User(
             org_id=org_id,
             email=email,
-            password_hash=hash_password(password),
+            password_hash=password_hash,
             full_name=full_name,
             role=UserRole(role),
         )
         db.add(user)
-        db.commit()
-        db.refresh(user)
+        db.flush()
         return user
@@ -1,14 +1,13 @@
 from fastapi import APIRouter, Depends, File, HTTPException, UploadFile
 from sqlalchemy.orm import Session
 
-from app.core.deps import get_current_user
-from app.database import get_db
-from app.models.task import Task
-from app.repositories.project_member_repository import ProjectMemberRepository
+from app.core.deps import get_current_user, load_task_for_user
+from app.database import UnitOfWorkRoute, get_db
+from app.models.archive import TaskArchive
 from app.schemas.attachment import AttachmentRead
 from app.services.attachment_service import AttachmentService
 
-router = APIRouter()
+router = APIRouter(route_class=UnitOfWorkRoute)
 
 
 @router.post("/tasks/{task_id}/attachments", response_model=AttachmentRead)
@@ -18,9 +17,7 @@ def upload_attachment(
     db: Session = Depends(get_db),
     current_user=Depends(get_current_user),
 ):
-    task = db.query(Task).filter(Task.id == task_id).first()
-    if not task:
-        raise HTTPException(status_code=404, detail="Task not found")
+    task = load_task_for_user(db, task_id, current_user)
     try:
         return AttachmentService.upload_attachment(db, task, current_user, file)
     except PermissionError as e:
@@ -29,11 +26,12 @@ def upload_attachment(
 
 @router.get("/tasks/{task_id}/attachments", response_model=list[AttachmentRead])
 def list_attachments(
-    task_id: int, db: Session = Depends(get_db), current_user=Depends(get_current_user)
+    task_id: int,
+    include_archived: bool = False,
+    db: Session = Depends(get_db),
+    current_user=Depends(get_current_user),
 ):
-    task = db.query(Task).filter(Task.id == task_id).first()
-    if not task:
-        raise HTTPException(status_code=404, detail="Task not found")
-    if not ProjectMemberRepository.is_member(db, task.project_id, current_user.id):
-        raise HTTPException(status_code=403, detail="You are not a project member")
-    return AttachmentService.list_attachments(db, task_id)
+    task = load_task_for_user(db, task_id, current_user, include_archived)
+    return AttachmentService.list_attachments(
+        db, task_id, archived=isinstance(task, TaskArchive)
+    )
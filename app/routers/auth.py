@@ -1,20 +1,44 @@
 from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
 
-from app.database import get_db
-from app.schemas.auth import (LoginRequest, RegisterRequest, RegisterResponse,
-                              Token)
+from app.core import token_revocation
+from app.core.deps import credentials_exception, get_current_user
+from app.database import UnitOfWorkRoute, get_db
+from app.repositories.user_repository import UserRepository
+from app.schemas.auth import (
+    LoginRequest,
+    RefreshRequest,
+    RegisterRequest,
+    RegisterResponse,
+    Token,
+)
 from app.schemas.org import OrgOut
 from app.schemas.user import UserOut
 from app.services.auth_service import AuthService
 
-router = APIRouter()
+router = APIRouter(route_class=UnitOfWorkRoute)
 
 
 @router.post("/auth/login", response_model=Token)
-def login(payload: LoginRequest, db: Session = Depends(get_db)):
-    token = AuthService.authenticate(db, email=payload.email, password=payload.password)
-    return {"access_token": token, "token_type": "bearer"}
+async def login(payload: LoginRequest, db: Session = Depends(get_db)):
+    access_token, refresh_token = await AuthService.authenticate(
+        db, email=payload.email, password=payload.password
+    )
+    return {
+        "access_token": access_token,
+        "token_type": "bearer",
+        "refresh_token": refresh_token,
+    }
+
+
+@router.post("/auth/refresh", response_model=Token, summary="Rotate a refresh token")
+def refresh(payload: RefreshRequest, db: Session = Depends(get_db)):
+    access_token, refresh_token = AuthService.refresh(db, payload.refresh_token)
+    return {
+        "access_token": access_token,
+        "token_type": "bearer",
+        "refresh_token": refresh_token,
+    }
 
 
 @router.post(
@@ -22,8 +46,8 @@ def login(payload: LoginRequest, db: Session = Depends(get_db)):
     response_model=RegisterResponse,
     summary="Register and create organization",
 )
-def register(payload: RegisterRequest, db: Session = Depends(get_db)):
-    org, user, token = AuthService.register_and_create_org(
+async def register(payload: RegisterRequest, db: Session = Depends(get_db)):
+    org, user, token = await AuthService.register_and_create_org(
         db,
         org_name=payload.org_name,
         email=payload.email,
@@ -35,3 +59,13 @@ def register(payload: RegisterRequest, db: Session = Depends(get_db)):
         "admin": UserOut.model_validate(user),
         "token": {"access_token": token, "token_type": "bearer"},
     }
+
+
+@router.post("/auth/logout-all", status_code=204, summary="Revoke all my tokens")
+def logout_all(db: Session = Depends(get_db), current_user=Depends(get_current_user)):
+    user = UserRepository.get_by_id(db, current_user.id)
+    if user is None:  # deleted while its principal was still cached
+        raise credentials_exception()
+    token_revocation.revoke_all(db, user)
+    AuthService.revoke_refresh_tokens(db, user.id)
+    return
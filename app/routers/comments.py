@@ -1,14 +1,14 @@
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 
-from app.core.deps import get_current_user
-from app.database import get_db
-from app.models.task import Task
-from app.repositories.project_member_repository import ProjectMemberRepository
+from app.core.deps import get_current_user, load_task_for_user
+from app.database import UnitOfWorkRoute, get_db
+from app.models.archive import TaskArchive
 from app.schemas.comment import CommentCreate, CommentRead
 from app.services.comment_service import CommentService
+from app.utils.fast_json import model_fields, rows_response
 
-router = APIRouter()
+router = APIRouter(route_class=UnitOfWorkRoute)
 
 
 @router.post("/tasks/{task_id}/comments", response_model=CommentRead)
@@ -18,9 +18,7 @@ def add_comment(
     db: Session = Depends(get_db),
     current_user=Depends(get_current_user),
 ):
-    task = db.query(Task).filter(Task.id == task_id).first()
-    if not task:
-        raise HTTPException(status_code=404, detail="Task not found")
+    task = load_task_for_user(db, task_id, current_user)
 
     try:
         return CommentService.add_comment(db, task, current_user, comment_in)
@@ -30,11 +28,14 @@ def add_comment(
 
 @router.get("/tasks/{task_id}/comments", response_model=list[CommentRead])
 def list_comments(
-    task_id: int, db: Session = Depends(get_db), current_user=Depends(get_current_user)
+    task_id: int,
+    include_archived: bool = False,
+    db: Session = Depends(get_db),
+    current_user=Depends(get_current_user),
 ):
-    task = db.query(Task).filter(Task.id == task_id).first()
-    if not task:
-        raise HTTPException(status_code=404, detail="Task not found")
-    if not ProjectMemberRepository.is_member(db, task.project_id, current_user.id):
-        raise HTTPException(status_code=403, detail="You are not a project member")
-    return CommentService.list_comments(db, task_id)
+    task = load_task_for_user(db, task_id, current_user, include_archived)
+    columns = model_fields(CommentRead)
+    comments = CommentService.list_comments(
+        db, task_id, columns, archived=isinstance(task, TaskArchive)
+    )
+    return rows_response(columns, comments)
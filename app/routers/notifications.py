@@ -2,12 +2,15 @@ from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 
 from app.core.deps import get_current_user
-from app.database import get_db
+from app.database import UnitOfWorkRoute, get_db
 from app.models.user import User
 from app.schemas.notification import NotificationRead
 from app.services.notification_service import NotificationService
+from app.utils.fast_json import model_fields, rows_response
 
-router = APIRouter(prefix="/notifications", tags=["Notifications"])
+router = APIRouter(
+    route_class=UnitOfWorkRoute, prefix="/notifications", tags=["Notifications"]
+)
 
 
 @router.get("/unread", response_model=list[NotificationRead])
@@ -15,7 +18,10 @@ def get_unread_notifications(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    return NotificationService.get_unread(db, current_user)
+    columns = model_fields(NotificationRead)
+    return rows_response(
+        columns, NotificationService.get_unread(db, current_user, columns)
+    )
 
 
 @router.patch("/{notif_id}/read", response_model=NotificationRead)
@@ -1,16 +1,17 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
 from sqlalchemy.orm import Session
 
-from app.core.deps import get_current_user, require_roles
-from app.database import get_db
+from app.core.deps import get_current_user, project_cache_state_for_user, require_roles
+from app.database import UnitOfWorkRoute, get_db
 from app.repositories.project_member_repository import ProjectMemberRepository
 from app.repositories.project_repository import ProjectRepository
-from app.repositories.user_repository import UserRepository
-from app.schemas.project import (ProjectAddMembersRequest, ProjectCreate,
-                                 ProjectOut)
+from app.schemas.project import ProjectAddMembersRequest, ProjectCreate, ProjectOut
 from app.schemas.user import UserOut
+from app.utils.fast_json import model_fields, rows_response
+from app.utils.fieldsets import parse_fields
+from app.utils.http_cache import cache_headers, etag_matches, make_etag, not_modified
 
-router = APIRouter()
+router = APIRouter(route_class=UnitOfWorkRoute)
 
 
 @router.post("/projects", response_model=ProjectOut)
@@ -33,9 +34,16 @@ def create_project(
 
 @router.get("/projects", response_model=list[ProjectOut])
 def list_projects(
-    db: Session = Depends(get_db), current_user=Depends(get_current_user)
+    fields: str | None = Query(None, description="Comma-separated ProjectOut fields"),
+    db: Session = Depends(get_db),
+    current_user=Depends(get_current_user),
 ):
-    return ProjectRepository.list_by_org(db, current_user.org_id)
+    try:
+        columns = parse_fields(fields, ProjectOut)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    projects = ProjectRepository.list_by_org(db, current_user.org_id, columns)
+    return rows_response(columns, projects)
 
 
 @router.get("/projects/{project_id}", response_model=ProjectOut)
@@ -61,16 +69,12 @@ def add_project_members(
     if not project or project.org_id != current_user.org_id:
         raise HTTPException(status_code=404, detail="Project not found")
 
-    added_users = []
-    for user_id in payload.user_ids:
-        user = UserRepository.get_by_id(db, user_id)
-        if not user or user.org_id != current_user.org_id:
-            continue
-        if not ProjectMemberRepository.is_member(db, project_id, user_id):
-            ProjectMemberRepository.add_member(
-                db, project_id=project_id, user_id=user_id
-            )
-            added_users.append(user)
+    added_users = ProjectMemberRepository.add_members(
+        db,
+        project_id=project_id,
+        user_ids=payload.user_ids,
+        org_id=current_user.org_id,
+    )
     if not added_users:
         raise HTTPException(status_code=400, detail="No valid users added")
     return added_users
@@ -96,11 +100,16 @@ def remove_project_member(
 @router.get("/projects/{project_id}/members", response_model=list[UserOut])
 def list_project_members(
     project_id: int,
+    if_none_match: str | None = Header(None),
     db: Session = Depends(get_db),
     current_user=Depends(get_current_user),
 ):
-    project = ProjectRepository.get_by_id(db, project_id)
-    if not project or project.org_id != current_user.org_id:
-        raise HTTPException(status_code=404, detail="Project not found")
-
-    return ProjectMemberRepository.list_members(db, project_id=project_id)
+    state = project_cache_state_for_user(
+        db, project_id, current_user, require_member=False
+    )
+    etag = make_etag("members", project_id, state.member_seq)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    columns = model_fields(UserOut)
+    members = ProjectMemberRepository.list_members(db, project_id, columns)
+    return rows_response(columns, members, headers=cache_headers(etag))
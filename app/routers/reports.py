@@ -1,31 +1,52 @@
-from fastapi import APIRouter, Depends, HTTPException
+from datetime import date
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
-from app.core.deps import get_current_user
-from app.database import get_db
+from app.core.deps import TokenPrincipal, get_token_principal
+from app.database import UnitOfWorkRoute, get_db
 from app.models.project import Project
-from app.models.user import User
-from app.schemas.report import OverdueTaskOut, TaskStatusCount
+from app.repositories.task_repository import decode_task_cursor
+from app.schemas.report import (
+    BurndownPoint,
+    OverdueTaskOut,
+    ProjectSummary,
+    ReportFormat,
+    TaskPriorityCount,
+    TaskStatusCount,
+    ThroughputPoint,
+)
+from app.schemas.task import SortOrder, TaskSortKey
 from app.services.report_service import ReportService
+from app.utils.pagination import decode_cursor, encode_cursor
 
-router = APIRouter(prefix="/projects/{project_id}/report", tags=["Reports"])
+router = APIRouter(
+    route_class=UnitOfWorkRoute,
+    prefix="/projects/{project_id}/report",
+    tags=["Reports"],
+)
+EXPORT_MEDIA_TYPES = {
+    ReportFormat.csv: "text/csv",
+    ReportFormat.ndjson: "application/x-ndjson",
+}
+org_router = APIRouter(route_class=UnitOfWorkRoute, prefix="/reports", tags=["Reports"])
 
 
-def check_report_permission(current_user: User):
+def check_report_permission(current_user: TokenPrincipal):
     if current_user.role.value not in ("admin", "manager"):
         raise HTTPException(
             status_code=403, detail="Only Admin/Manager can access reports"
         )
 
 
-@router.get("/status-count", response_model=TaskStatusCount)
-def get_status_count(
+def report_project(
     project_id: int,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
-):
+    current_user: TokenPrincipal = Depends(get_token_principal),
+) -> Project:
+    """The project of a report route, once the caller may read its reports."""
     check_report_permission(current_user)
-
     project = (
         db.query(Project)
         .filter(Project.id == project_id, Project.org_id == current_user.org_id)
@@ -33,24 +54,115 @@ def get_status_count(
     )
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
+    return project
 
-    return ReportService.status_count(db, project_id)
 
+@router.get("/status-count", response_model=TaskStatusCount)
+def get_status_count(
+    project: Project = Depends(report_project), db: Session = Depends(get_db)
+):
+    return ReportService.status_count(db, project.id, project.task_seq)
 
-@router.get("/overdue-tasks", response_model=list[OverdueTaskOut])
+
+@router.get("/priority-count", response_model=TaskPriorityCount)
+def get_priority_count(
+    project: Project = Depends(report_project), db: Session = Depends(get_db)
+):
+    return ReportService.priority_count(db, project.id, project.task_seq)
+
+
+@router.get(
+    "/overdue-tasks",
+    response_model=list[OverdueTaskOut],
+    responses={
+        200: {"content": {media_type: {} for media_type in EXPORT_MEDIA_TYPES.values()}}
+    },
+)
 def get_overdue_tasks(
-    project_id: int,
+    response: Response,
+    cursor: str | None = None,
+    limit: int = Query(100, ge=1, le=500),
+    fmt: ReportFormat = Query(ReportFormat.json, alias="format"),
+    project: Project = Depends(report_project),
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
 ):
-    check_report_permission(current_user)
+    """Oldest due date first, paged via X-Next-Cursor.
 
-    project = (
-        db.query(Project)
-        .filter(Project.id == project_id, Project.org_id == current_user.org_id)
-        .first()
+    `format=csv|ndjson` streams every overdue task instead (cursor and limit
+    do not apply).
+    """
+    after = None
+    if cursor:
+        try:
+            after = decode_task_cursor(cursor, TaskSortKey.due_date, SortOrder.asc)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+    if fmt != ReportFormat.json:
+        return StreamingResponse(
+            ReportService.export_overdue_tasks(db, project.id, fmt),
+            media_type=EXPORT_MEDIA_TYPES[fmt],
+            headers={
+                "Content-Disposition": (
+                    f'attachment; filename="overdue-tasks-{project.id}.{fmt.value}"'
+                )
+            },
+        )
+    tasks, next_cursor = ReportService.overdue_tasks(
+        db, project.id, project.task_seq, after, limit
     )
-    if not project:
-        raise HTTPException(status_code=404, detail="Project not found")
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return tasks
+
+
+@router.get("/burndown", response_model=list[BurndownPoint])
+def get_burndown(
+    start: date | None = None,
+    end: date | None = None,
+    project: Project = Depends(report_project),
+    db: Session = Depends(get_db),
+):
+    """Open and done task counts per day over [start, end] (default: last 30 days)."""
+    return ReportService.burndown(db, project.id, start, end)
+
 
-    return ReportService.overdue_tasks(db, project_id)
+@router.get("/throughput", response_model=list[ThroughputPoint])
+def get_throughput(
+    start: date | None = None,
+    end: date | None = None,
+    project: Project = Depends(report_project),
+    db: Session = Depends(get_db),
+):
+    """Tasks created and completed per day over [start, end] (default: last 30 days)."""
+    return ReportService.throughput(db, project.id, start, end)
+
+
+@org_router.get("/org-summary", response_model=list[ProjectSummary])
+def get_org_summary(
+    response: Response,
+    cursor: str | None = None,
+    limit: int = Query(50, ge=1, le=200),
+    db: Session = Depends(get_db),
+    current_user: TokenPrincipal = Depends(get_token_principal),
+):
+    """Dashboard counts for every project of the org, by project id.
+
+    One query per page; the next page's cursor is in X-Next-Cursor.
+    """
+    check_report_permission(current_user)
+
+    after_id = None
+    if cursor:
+        try:
+            after_id = int(decode_cursor(cursor)["id"])
+        except (KeyError, TypeError, ValueError):
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    summaries = ReportService.org_summary(db, current_user.org_id, after_id, limit + 1)
+    if len(summaries) > limit:
+        summaries = summaries[:limit]
+        response.headers["X-Next-Cursor"] = encode_cursor(
+            {"id": summaries[-1]["project_id"]}
+        )
+    return summaries
@@ -1,17 +1,51 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response
+from fastapi.responses import JSONResponse
 from sqlalchemy.orm import Session
+from sqlalchemy.orm.exc import StaleDataError
 
-from app.core.deps import get_current_user
-from app.database import get_db
-from app.models.task import TaskPriority, TaskStatus
+from app.core.deps import (
+    get_current_user,
+    load_task_for_user,
+    project_cache_state_for_user,
+    task_cache_state_for_user,
+)
+from app.database import UnitOfWorkRoute, get_db
+from app.models.task import STATUS_ORDER, TaskPriority, TaskStatus
 from app.repositories.project_member_repository import ProjectMemberRepository
 from app.repositories.project_repository import ProjectRepository
-from app.repositories.task_repository import TaskRepository
+from app.repositories.task_repository import (
+    TaskRepository,
+    decode_change_cursor,
+    decode_search_cursor,
+    decode_task_cursor,
+    encode_change_cursor,
+    encode_search_cursor,
+    encode_task_cursor,
+)
 from app.repositories.user_repository import UserRepository
-from app.schemas.task import TaskCreate, TaskOut, TaskUpdate
+from app.schemas.task import (
+    SortOrder,
+    TaskBatchRequest,
+    TaskBatchResult,
+    TaskChanges,
+    TaskCreate,
+    TaskOut,
+    TaskSortKey,
+    TaskUpdate,
+)
 from app.services.notification_service import NotificationService
+from app.services.task_batch_service import TaskBatchService
+from app.utils.fast_json import json_response, model_fields, row_encoder, rows_response
+from app.utils.fieldsets import parse_fields
+from app.utils.http_cache import (
+    cache_headers,
+    etag_matches,
+    if_match_satisfied,
+    make_etag,
+    not_modified,
+)
 
-router = APIRouter()
+router = APIRouter(route_class=UnitOfWorkRoute)
 
 
 @router.post("/projects/{project_id}/tasks", response_model=TaskOut)
@@ -49,33 +83,270 @@ def create_task(
     return task
 
 
+def _batch_response(result: TaskBatchResult):
+    if result.applied:
+        return result
+    return JSONResponse(status_code=422, content=result.model_dump(mode="json"))
+
+
+@router.post(
+    "/projects/{project_id}/tasks:batch",
+    response_model=TaskBatchResult,
+    responses={422: {"model": TaskBatchResult}},
+)
+def create_tasks_batch(
+    project_id: int,
+    payload: TaskBatchRequest,
+    db: Session = Depends(get_db),
+    current_user=Depends(get_current_user),
+):
+    """Create many tasks in one transaction; 422 with per-item errors if any fail."""
+    return _batch_response(
+        TaskBatchService.create_tasks(db, project_id, payload.items, current_user)
+    )
+
+
+@router.patch(
+    "/tasks:batch",
+    response_model=TaskBatchResult,
+    responses={422: {"model": TaskBatchResult}},
+)
+def update_tasks_batch(
+    payload: TaskBatchRequest,
+    db: Session = Depends(get_db),
+    current_user=Depends(get_current_user),
+):
+    """Update many tasks (each item carries its id) in one transaction."""
+    return _batch_response(
+        TaskBatchService.update_tasks(db, payload.items, current_user)
+    )
+
+
 @router.get("/projects/{project_id}/tasks", response_model=list[TaskOut])
 def list_tasks(
     project_id: int,
+    request: Request,
     status: TaskStatus | None = None,
     assignee_id: int | None = None,
     priority: TaskPriority | None = None,
+    sort: TaskSortKey = TaskSortKey.created_at,
+    order: SortOrder = SortOrder.asc,
+    cursor: str | None = None,
+    limit: int = Query(100, ge=1, le=500),
+    fields: str | None = Query(None, description="Comma-separated TaskOut fields"),
+    include_archived: bool = False,
+    if_none_match: str | None = Header(None),
+    db: Session = Depends(get_db),
+    current_user=Depends(get_current_user),
+):
+    """List tasks one page at a time; the next page's cursor is in X-Next-Cursor.
+
+    Rows are selected as plain columns and encoded without ORM objects;
+    `fields` (e.g. `id,title,status`) narrows the columns and the output. The
+    ETag covers the project's task counter and the query string; a matching
+    If-None-Match gets 304 without any task read. Archived tasks are only
+    listed with `include_archived=true`.
+    """
+    try:
+        columns = parse_fields(fields, TaskOut)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    # Read before the rows: a write racing the listing can only make the ETag
+    # older than the body, which costs the client one extra full response
+    state = project_cache_state_for_user(db, project_id, current_user)
+    etag = make_etag(
+        "tasks", project_id, state.task_seq, sorted(request.query_params.multi_items())
+    )
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+
+    after = None
+    if cursor:
+        try:
+            after = decode_task_cursor(cursor, sort, order)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+    tasks = TaskRepository.list_by_project(
+        db,
+        project_id,
+        status,
+        assignee_id,
+        priority,
+        sort=sort,
+        order=order,
+        after=after,
+        limit=limit + 1,
+        columns=columns,
+        include_archived=include_archived,
+    )
+    headers = cache_headers(etag)
+    if len(tasks) > limit:
+        tasks = tasks[:limit]
+        headers["X-Next-Cursor"] = encode_task_cursor(tasks[-1], sort, order)
+    return rows_response(columns, tasks, headers=headers)
+
+
+@router.get("/projects/{project_id}/tasks/changes", response_model=TaskChanges)
+def list_task_changes(
+    project_id: int,
+    since: str | None = None,
+    limit: int = Query(200, ge=1, le=1000),
     db: Session = Depends(get_db),
     current_user=Depends(get_current_user),
 ):
+    """Delta sync: tasks created or updated, and ids deleted, since `since`.
+
+    Omit `since` for a full sync. Store the returned `cursor` and pass it as
+    `since` next time; while `has_more` is true, call again straight away.
+    Changes are ordered by the project's task counter rather than updated_at,
+    which concurrent transactions can commit out of order. Deletions are kept
+    for `task_tombstone_retention_days`; an older cursor gets 410 Gone.
+    """
+    after = None
+    if since:
+        try:
+            after = decode_change_cursor(since)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+    state = project_cache_state_for_user(db, project_id, current_user)
+    if after and after[0] < state.tombstone_seq:
+        raise HTTPException(
+            status_code=410,
+            detail="Cursor is older than the deletions still kept; sync without since",
+        )
+    # Upper bound for this sync: changes committed later carry a higher seq
+    upto = state.task_seq
+
+    columns = model_fields(TaskOut)
+    rows = TaskRepository.list_changes(
+        db, project_id, upto=upto, after=after, limit=limit + 1, columns=columns
+    )
+    has_more = len(rows) > limit
+    if has_more:
+        rows = rows[:limit]
+        end_seq = rows[-1].change_seq
+        cursor = encode_change_cursor(end_seq, rows[-1].id)
+    else:
+        end_seq = upto
+        cursor = encode_change_cursor(upto, None)
+    # A full sync lists only live tasks, so there is nothing to delete yet
+    deleted = (
+        TaskRepository.deleted_between(db, project_id, after[0], end_seq)
+        if after
+        else []
+    )
+    return json_response(
+        {
+            "tasks": row_encoder(columns).dicts(rows),
+            "deleted": deleted,
+            "cursor": cursor,
+            "has_more": has_more,
+        }
+    )
+
+
+def _search_page(
+    db: Session,
+    response: Response,
+    q: str,
+    cursor: str | None,
+    limit: int,
+    **scope,
+):
+    q = q.strip()
+    if not q:
+        raise HTTPException(status_code=400, detail="Search query is empty")
+    after = None
+    if cursor:
+        try:
+            after = decode_search_cursor(cursor, q)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+    rows = TaskRepository.search(db, q, after=after, limit=limit + 1, **scope)
+    if len(rows) > limit:
+        rows = rows[:limit]
+        task, rank = rows[-1]
+        response.headers["X-Next-Cursor"] = encode_search_cursor(q, rank, task.id)
+    return [task for task, _ in rows]
+
+
+@router.get("/projects/{project_id}/tasks/search", response_model=list[TaskOut])
+def search_project_tasks(
+    project_id: int,
+    response: Response,
+    q: str = Query(..., min_length=1, max_length=200),
+    cursor: str | None = None,
+    limit: int = Query(50, ge=1, le=200),
+    db: Session = Depends(get_db),
+    current_user=Depends(get_current_user),
+):
+    """Full-text search in one project, best match first; paged via X-Next-Cursor."""
     project = ProjectRepository.get_by_id(db, project_id)
     if not project or project.org_id != current_user.org_id:
         raise HTTPException(status_code=404, detail="Project not found")
     if not ProjectMemberRepository.is_member(db, project_id, current_user.id):
         raise HTTPException(status_code=403, detail="You are not a project member")
 
-    return TaskRepository.list_by_project(db, project_id, status, assignee_id, priority)
+    return _search_page(
+        db,
+        response,
+        q,
+        cursor,
+        limit,
+        org_id=current_user.org_id,
+        user_id=current_user.id,
+        project_id=project_id,
+    )
+
+
+# Declared before /tasks/{task_id} so "search" is not parsed as a task id
+@router.get("/tasks/search", response_model=list[TaskOut])
+def search_tasks(
+    response: Response,
+    q: str = Query(..., min_length=1, max_length=200),
+    cursor: str | None = None,
+    limit: int = Query(50, ge=1, le=200),
+    db: Session = Depends(get_db),
+    current_user=Depends(get_current_user),
+):
+    """Full-text search across every project of the org the caller belongs to."""
+    return _search_page(
+        db,
+        response,
+        q,
+        cursor,
+        limit,
+        org_id=current_user.org_id,
+        user_id=current_user.id,
+    )
+
+
+def _task_etag(task_id: int, version: int) -> str:
+    return make_etag("task", task_id, version)
 
 
 @router.get("/tasks/{task_id}", response_model=TaskOut)
 def get_task(
-    task_id: int, db: Session = Depends(get_db), current_user=Depends(get_current_user)
+    task_id: int,
+    response: Response,
+    include_archived: bool = False,
+    if_none_match: str | None = Header(None),
+    db: Session = Depends(get_db),
+    current_user=Depends(get_current_user),
 ):
-    task = TaskRepository.get_by_id(db, task_id)
-    if not task or task.project.org_id != current_user.org_id:
-        raise HTTPException(status_code=404, detail="Task not found")
-    if not ProjectMemberRepository.is_member(db, task.project_id, current_user.id):
-        raise HTTPException(status_code=403, detail="You are not a project member")
+    if if_none_match and not include_archived:
+        # Revalidation: answer from the version columns alone when unchanged
+        state = task_cache_state_for_user(db, task_id, current_user)
+        etag = _task_etag(task_id, state.version)
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag)
+    task = load_task_for_user(db, task_id, current_user, include_archived)
+    etag = _task_etag(task_id, task.version)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    response.headers.update(cache_headers(etag))
     return task
 
 
@@ -83,14 +354,22 @@ def get_task(
 def update_task(
     task_id: int,
     payload: TaskUpdate,
+    response: Response,
+    if_match: str | None = Header(None),
     db: Session = Depends(get_db),
     current_user=Depends(get_current_user),
 ):
-    task = TaskRepository.get_by_id(db, task_id)
-    if not task or task.project.org_id != current_user.org_id:
-        raise HTTPException(status_code=404, detail="Task not found")
-    if not ProjectMemberRepository.is_member(db, task.project_id, current_user.id):
-        raise HTTPException(status_code=403, detail="You are not a project member")
+    """Update a task; with If-Match, only if it still has that ETag (else 412).
+
+    The write is a compare-and-swap on Task.version, so checks made here on
+    the loaded row (e.g. status order) cannot be invalidated by a concurrent
+    update: the loser gets 412 (If-Match sent) or 409 and can re-read.
+    """
+    task = load_task_for_user(db, task_id, current_user)
+    if if_match is not None and not if_match_satisfied(
+        if_match, _task_etag(task_id, task.version)
+    ):
+        raise HTTPException(status_code=412, detail="Task has been modified")
     if current_user.role.value == "member":
         if any(
             getattr(payload, field) is not None
@@ -113,13 +392,18 @@ def update_task(
             raise HTTPException(status_code=404, detail="Assignee not found")
 
     # Status progression check
-    status_order = {"todo": 1, "in-progress": 2, "done": 3}
     if payload.status:
-        if status_order[payload.status.value] < status_order[task.status.value]:
+        if STATUS_ORDER[payload.status] < STATUS_ORDER[task.status]:
             raise HTTPException(status_code=400, detail="Status cannot move backward")
-        NotificationService.create_status_change_notification(db, task)
 
-    task = TaskRepository.update(db, task, payload)
+    try:
+        task = TaskRepository.update(db, task, payload)
+    except StaleDataError:
+        db.rollback()
+        raise HTTPException(
+            status_code=412 if if_match is not None else 409,
+            detail="Task was modified concurrently",
+        )
 
     # Notifications
     if assignee and task.assignee_id != old_assignee_id:
@@ -128,4 +412,31 @@ def update_task(
     if payload.status is not None and task.status.value != old_status_value:
         NotificationService.create_status_change_notification(db, task)
 
+    response.headers.update(cache_headers(_task_etag(task.id, task.version)))
     return task
+
+
+@router.delete("/tasks/{task_id}", status_code=204)
+def delete_task(
+    task_id: int,
+    if_match: str | None = Header(None),
+    db: Session = Depends(get_db),
+    current_user=Depends(get_current_user),
+):
+    """Delete a task; with If-Match, only if it still has that ETag (else 412)."""
+    task = load_task_for_user(db, task_id, current_user)
+    if current_user.role.value == "member":
+        raise HTTPException(status_code=403, detail="Members cannot delete tasks")
+    if if_match is not None and not if_match_satisfied(
+        if_match, _task_etag(task_id, task.version)
+    ):
+        raise HTTPException(status_code=412, detail="Task has been modified")
+    try:
+        TaskRepository.delete(db, task)
+    except StaleDataError:
+        db.rollback()
+        raise HTTPException(
+            status_code=412 if if_match is not None else 409,
+            detail="Task was modified concurrently",
+        )
+    return
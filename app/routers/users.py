@@ -1,15 +1,28 @@
+from datetime import date
 from typing import List
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
-from app.core.deps import get_current_user, require_roles
-from app.database import get_db
+from app.core import token_revocation
+from app.core.deps import credentials_exception, get_current_user, require_roles
+from app.database import UnitOfWorkRoute, get_db
+from app.models.task import TaskPriority, TaskStatus
+from app.repositories.task_repository import (
+    TaskRepository,
+    decode_task_cursor,
+    encode_task_cursor,
+)
 from app.repositories.user_repository import UserRepository
+from app.schemas.task import SortOrder, TaskOut, TaskSortKey
 from app.schemas.user import PasswordUpdate, UserCreate, UserOut
-from app.utils.security import hash_password, verify_password
+from app.services.auth_service import AuthService
+from app.services.password_hasher import password_hasher
+from app.utils.fast_json import model_fields, rows_response
+from app.utils.fieldsets import parse_fields
 
-router = APIRouter()
+router = APIRouter(route_class=UnitOfWorkRoute)
 
 
 @router.get("/users/me", response_model=UserOut, summary="Get current user profile")
@@ -17,6 +30,57 @@ def get_me(current_user=Depends(get_current_user)):
     return current_user
 
 
+@router.get(
+    "/users/me/tasks",
+    response_model=List[TaskOut],
+    summary="Tasks assigned to me across my projects",
+)
+def list_my_tasks(
+    status: TaskStatus | None = None,
+    priority: TaskPriority | None = None,
+    due_from: date | None = None,
+    due_to: date | None = None,
+    cursor: str | None = None,
+    limit: int = Query(100, ge=1, le=500),
+    fields: str | None = Query(None, description="Comma-separated TaskOut fields"),
+    db: Session = Depends(get_db),
+    current_user=Depends(get_current_user),
+):
+    """Soonest due first (undated last); the next page's cursor is in X-Next-Cursor.
+
+    Only projects the caller is still a member of are included.
+    """
+    try:
+        columns = parse_fields(fields, TaskOut)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    after = None
+    if cursor:
+        try:
+            after = decode_task_cursor(cursor, TaskSortKey.due_date, SortOrder.asc)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+    tasks = TaskRepository.list_for_assignee(
+        db,
+        current_user.id,
+        status,
+        priority,
+        due_from,
+        due_to,
+        after=after,
+        limit=limit + 1,
+        columns=columns,
+    )
+    headers = {}
+    if len(tasks) > limit:
+        tasks = tasks[:limit]
+        headers["X-Next-Cursor"] = encode_task_cursor(
+            tasks[-1], TaskSortKey.due_date, SortOrder.asc
+        )
+    return rows_response(columns, tasks, headers=headers)
+
+
 @router.get(
     "/users", response_model=List[UserOut], summary="List users in my organization"
 )
@@ -24,23 +88,28 @@ def list_users(
     db: Session = Depends(get_db),
     current_user=Depends(require_roles("admin", "manager")),
 ):
-    return UserRepository.list_by_org(db, current_user.org_id)
+    columns = model_fields(UserOut)
+    return rows_response(
+        columns, UserRepository.list_by_org(db, current_user.org_id, columns)
+    )
 
 
 @router.post(
     "/users", response_model=UserOut, summary="Admin: create a user in my organization"
 )
-def create_user(
+async def create_user(
     payload: UserCreate,
     db: Session = Depends(get_db),
     current_user=Depends(require_roles("admin")),
 ):
-    # Admin creates users in their own organization; org_id comes from token/current user
-    user = UserRepository.create_in_org(
+    # Admin creates users in their own organization; org_id comes from the token
+    password_hash = await password_hasher.hash(payload.password)
+    user = await run_in_threadpool(
+        UserRepository.create_in_org,
         db,
         org_id=current_user.org_id,
         email=payload.email,
-        password=payload.password,
+        password_hash=password_hash,
         full_name=payload.full_name,
         role=payload.role,
     )
@@ -48,14 +117,20 @@ def create_user(
 
 
 @router.patch("/users/me/password", summary="Change my password")
-def change_password(
+async def change_password(
     payload: PasswordUpdate,
     db: Session = Depends(get_db),
     current_user=Depends(get_current_user),
 ):
-    if not verify_password(payload.current_password, current_user.password_hash):
+    # The cached principal never carries the password hash, so load the row
+    user = await run_in_threadpool(UserRepository.get_by_id, db, current_user.id)
+    if user is None:  # deleted while its principal was still cached
+        raise credentials_exception()
+    if not await password_hasher.verify(payload.current_password, user.password_hash):
         raise HTTPException(status_code=400, detail="Current password is incorrect")
-    current_user.password_hash = hash_password(payload.new_password)
-    db.add(current_user)
-    db.commit()
+    user.password_hash = await password_hasher.hash(payload.new_password)
+    # Tokens issued with the old password stop working
+    token_revocation.revoke_all(db, user)
+    await run_in_threadpool(AuthService.revoke_refresh_tokens, db, user.id)
+    db.add(user)
     return {"msg": "Password updated successfully"}
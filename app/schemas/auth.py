@@ -12,12 +12,18 @@ class LoginRequest(BaseModel):
 class Token(BaseModel):
     access_token: str
     token_type: str = "bearer"
+    refresh_token: str | None = None
+
+
+class RefreshRequest(BaseModel):
+    refresh_token: str
 
 
 class TokenPayload(BaseModel):
     sub: str
     org_id: int
     role: str
+    ver: int = 0  # tokens issued before this claim existed are version 0
 
 
 class RegisterRequest(BaseModel):
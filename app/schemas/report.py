@@ -1,14 +1,54 @@
 from datetime import date
+from enum import Enum
 
 from pydantic import BaseModel
 
 
+class ReportFormat(str, Enum):
+    json = "json"
+    csv = "csv"
+    ndjson = "ndjson"
+
+
 class TaskStatusCount(BaseModel):
     todo: int | None = 0
     in_progress: int | None = 0
     done: int | None = 0
 
 
+class TaskPriorityCount(BaseModel):
+    low: int = 0
+    medium: int = 0
+    high: int = 0
+
+
+class AssigneeOpenCount(BaseModel):
+    assignee_id: int | None  # None: open tasks nobody is assigned to
+    open: int
+
+
+class ProjectSummary(BaseModel):
+    project_id: int
+    name: str
+    status_count: TaskStatusCount
+    overdue: int
+    open_by_assignee: list[AssigneeOpenCount]
+
+
+class BurndownPoint(BaseModel):
+    day: date
+    todo: int
+    in_progress: int
+    done: int
+    remaining: int  # todo + in_progress
+
+
+class ThroughputPoint(BaseModel):
+    day: date
+    created: int
+    completed: int
+
+
 class OverdueTaskOut(BaseModel):
     id: int
     title: str
@@ -1,12 +1,25 @@
 # app/schemas/task.py
 from datetime import date
-from typing import Optional
+from enum import Enum
+from typing import Any, Optional
 
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel, Field, field_validator
 
 from app.models.task import TaskPriority, TaskStatus
 
 
+class TaskSortKey(str, Enum):
+    due_date = "due_date"
+    priority = "priority"
+    created_at = "created_at"
+    updated_at = "updated_at"
+
+
+class SortOrder(str, Enum):
+    asc = "asc"
+    desc = "desc"
+
+
 class TaskCreate(BaseModel):
     title: str
     description: Optional[str] = None
@@ -47,5 +60,43 @@ class TaskOut(BaseModel):
     priority: TaskPriority
     status: TaskStatus
     due_date: Optional[date]
+    version: int
 
     model_config = {"from_attributes": True}
+
+
+class TaskChanges(BaseModel):
+    tasks: list[TaskOut]
+    # Ids of tasks deleted since the cursor
+    deleted: list[int]
+    # Pass as `since` on the next call
+    cursor: str
+    has_more: bool
+
+
+# Upper bound on items per batch request
+MAX_BATCH_ITEMS = 500
+
+
+class TaskBatchUpdateItem(TaskUpdate):
+    id: int
+    # Optional per-item If-Match: reject the item unless the task is unchanged
+    version: Optional[int] = None
+
+
+class TaskBatchRequest(BaseModel):
+    # Items are validated one by one (as TaskCreate / TaskBatchUpdateItem) so
+    # that errors are reported per item instead of failing the whole body
+    items: list[dict[str, Any]] = Field(..., min_length=1, max_length=MAX_BATCH_ITEMS)
+
+
+class TaskBatchItemResult(BaseModel):
+    index: int
+    ok: bool
+    task: Optional[TaskOut] = None
+    error: Optional[str] = None
+
+
+class TaskBatchResult(BaseModel):
+    applied: bool
+    results: list[TaskBatchItemResult]
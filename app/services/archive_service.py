@@ -0,0 +1,64 @@
+import logging
+import time
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy.orm import Session
+
+from app.repositories.archive_repository import ArchiveRepository
+from app.repositories.task_repository import TaskRepository
+
+logger = logging.getLogger(__name__)
+
+
+def _utcnow() -> datetime:
+    # Timestamp columns are naive and hold UTC
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+class ArchiveService:
+    @staticmethod
+    def archive_done_tasks(
+        db: Session,
+        *,
+        older_than_days: int,
+        batch_size: int,
+        max_batches: int | None = None,
+        pause_seconds: float = 0.0,
+    ) -> int:
+        """Move tasks done for more than `older_than_days` to the archive.
+
+        One transaction per batch of `batch_size` tasks, so locks stay short
+        and an interrupted run loses at most one batch. Returns how many tasks
+        were moved.
+        """
+        cutoff = _utcnow() - timedelta(days=older_than_days)
+        moved = batches = 0
+        while max_batches is None or batches < max_batches:
+            task_ids = ArchiveRepository.archivable_task_ids(db, cutoff, batch_size)
+            if not task_ids:
+                break
+            ArchiveRepository.move_tasks(db, task_ids, _utcnow())
+            db.commit()
+            moved += len(task_ids)
+            batches += 1
+            logger.info("Archived %d tasks (%d so far)", len(task_ids), moved)
+            if pause_seconds:
+                time.sleep(pause_seconds)
+        return moved
+
+    @staticmethod
+    def prune_tombstones(db: Session, *, older_than_days: int, batch_size: int) -> int:
+        """Delete task tombstones older than `older_than_days`.
+
+        One transaction per batch; returns how many were deleted. Delta sync
+        answers cursors older than what was pruned with 410.
+        """
+        cutoff = _utcnow() - timedelta(days=older_than_days)
+        pruned = 0
+        while True:
+            deleted = TaskRepository.prune_tombstones(db, cutoff, batch_size)
+            db.commit()
+            if not deleted:
+                return pruned
+            pruned += deleted
+            logger.info("Pruned %d tombstones (%d so far)", deleted, pruned)
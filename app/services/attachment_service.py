@@ -15,7 +15,7 @@ class AttachmentService:
     @staticmethod
     def upload_attachment(db: Session, task: Task, user: User, file: UploadFile):
         # Permission: only project members can upload
-        if not ProjectMemberRepository.is_member(db, task.project.id, user.id):
+        if not ProjectMemberRepository.is_member(db, task.project_id, user.id):
             raise HTTPException(status_code=403, detail="You are not a project member")
 
         contents = file.file.read()
@@ -46,5 +46,5 @@ class AttachmentService:
         return AttachmentRepository.create(db, task.id, user.id, safe_name, path, size)
 
     @staticmethod
-    def list_attachments(db: Session, task_id: int):
-        return AttachmentRepository.list_by_task(db, task_id)
+    def list_attachments(db: Session, task_id: int, archived: bool = False):
+        return AttachmentRepository.list_by_task(db, task_id, archived)
@@ -1,41 +1,149 @@
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
 from fastapi import HTTPException, status
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
+from app.config import settings
+from app.models.user import User
 from app.repositories.organization_repository import OrganizationRepository
+from app.repositories.refresh_token_repository import RefreshTokenRepository
 from app.repositories.user_repository import UserRepository
-from app.utils.security import create_access_token, verify_password
+from app.services.password_hasher import password_hasher
+from app.utils.security import (
+    create_access_token,
+    generate_refresh_token,
+    hash_refresh_token,
+)
+
+
+def _utcnow() -> datetime:
+    # Timestamp columns are naive and hold UTC
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def _access_token_for(user: User) -> str:
+    return create_access_token(
+        sub=str(user.id),
+        org_id=user.org_id,
+        role=user.role.value,
+        ver=user.token_version,
+    )
 
 
 class AuthService:
     @staticmethod
-    def authenticate(db: Session, *, email: str, password: str) -> str:
-        user = UserRepository.get_by_email(db, email)
-        if not user or not verify_password(password, user.password_hash):
+    async def authenticate(
+        db: Session, *, email: str, password: str
+    ) -> tuple[str, str]:
+        """Verify credentials and return (access_token, refresh_token)."""
+        user = await run_in_threadpool(UserRepository.get_by_email, db, email)
+        verified, new_hash = (
+            await password_hasher.verify_and_update(password, user.password_hash)
+            if user
+            else (False, None)
+        )
+        if user is None or not verified:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Incorrect email or password",
             )
-        token = create_access_token(
-            sub=str(user.id), org_id=user.org_id, role=user.role.value
+        if new_hash:
+            # Stored hash predates the current scheme/cost policy: upgrade it
+            # now, while the plaintext is at hand. Committed with the request.
+            user.password_hash = new_hash
+        access_token = _access_token_for(user)
+        refresh_token = await run_in_threadpool(
+            AuthService.issue_refresh_token, db, user.id
+        )
+        return access_token, refresh_token
+
+    @staticmethod
+    def issue_refresh_token(
+        db: Session, user_id: int, family_id: str | None = None
+    ) -> str:
+        raw, token_hash = generate_refresh_token()
+        RefreshTokenRepository.create(
+            db,
+            user_id=user_id,
+            token_hash=token_hash,
+            family_id=family_id or uuid4().hex,
+            expires_at=_utcnow() + timedelta(days=settings.refresh_token_expire_days),
         )
-        return token
+        return raw
 
     @staticmethod
-    def register_and_create_org(
+    def refresh(db: Session, refresh_token: str) -> tuple[str, str]:
+        """Rotate a refresh token; return a new (access_token, refresh_token).
+
+        Costs one indexed lookup instead of a password hash. Presenting an
+        already rotated token means it leaked, so its whole family is revoked.
+        """
+        invalid = HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid refresh token",
+        )
+        now = _utcnow()
+        found = RefreshTokenRepository.get_with_user(
+            db, hash_refresh_token(refresh_token)
+        )
+        if not found:
+            raise invalid
+        token, user = found
+        if token.revoked_at is None and token.expires_at <= now:
+            raise invalid
+        # Claimed with a conditional UPDATE rather than checked, then set: a
+        # concurrent rotation of the same token finds it already claimed
+        if not RefreshTokenRepository.claim(db, token.id, now):
+            RefreshTokenRepository.revoke_family(db, token.family_id, now)
+            # Committed here: the request fails, so its unit of work won't be
+            db.commit()
+            raise invalid
+
+        access_token = _access_token_for(user)
+        new_refresh_token = AuthService.issue_refresh_token(
+            db, user.id, family_id=token.family_id
+        )
+        return access_token, new_refresh_token
+
+    @staticmethod
+    def revoke_refresh_tokens(db: Session, user_id: int) -> None:
+        RefreshTokenRepository.revoke_all_for_user(db, user_id, _utcnow())
+
+    @staticmethod
+    async def register_and_create_org(
         db: Session, *, org_name: str, email: str, password: str, full_name: str | None
     ):
-        if UserRepository.get_by_email(db, email):
+        if await run_in_threadpool(UserRepository.get_by_email, db, email):
             raise HTTPException(status_code=409, detail="Email already registered")
+        password_hash = await password_hasher.hash(password)
+        return await run_in_threadpool(
+            AuthService._create_org_with_admin,
+            db,
+            org_name=org_name,
+            email=email,
+            password_hash=password_hash,
+            full_name=full_name,
+        )
+
+    @staticmethod
+    def _create_org_with_admin(
+        db: Session,
+        *,
+        org_name: str,
+        email: str,
+        password_hash: str,
+        full_name: str | None
+    ):
         org = OrganizationRepository.create(db, name=org_name)
         user = UserRepository.create_in_org(
             db,
             org_id=org.id,
             email=email,
-            password=password,
+            password_hash=password_hash,
             full_name=full_name,
             role="admin",
         )
-        token = create_access_token(
-            sub=str(user.id), org_id=user.org_id, role=user.role.value
-        )
+        token = _access_token_for(user)
         return org, user, token
@@ -13,7 +13,7 @@ class CommentService:
     @staticmethod
     def add_comment(db: Session, task: Task, user: User, comment_in: CommentCreate):
         # Permission: only project members can upload
-        if not ProjectMemberRepository.is_member(db, task.project.id, user.id):
+        if not ProjectMemberRepository.is_member(db, task.project_id, user.id):
             raise HTTPException(status_code=403, detail="You are not a project member")
 
         comment = CommentRepository.create(db, task.id, user.id, comment_in.content)
@@ -24,5 +24,10 @@ class CommentService:
         return comment
 
     @staticmethod
-    def list_comments(db: Session, task_id: int):
-        return CommentRepository.list_by_task(db, task_id)
+    def list_comments(
+        db: Session,
+        task_id: int,
+        columns: tuple[str, ...] | None = None,
+        archived: bool = False,
+    ):
+        return CommentRepository.list_by_task(db, task_id, columns, archived)
@@ -8,27 +8,43 @@ from app.repositories.notification_repository import NotificationRepository
 
 class NotificationService:
     @staticmethod
-    def create_assignment_notification(db: Session, task: Task, assignee: User):
-        return NotificationRepository.create(
-            db,
-            user_id=assignee.id,
+    def assignment_values(task: Task, assignee_id: int) -> dict:
+        return dict(
+            user_id=assignee_id,
             notif_type=NotificationType.assignment,
             message=f"You have been assigned to task '{task.title}'",
             project_id=task.project_id,
             task_id=task.id,
         )
 
+    @staticmethod
+    def status_change_values(task: Task) -> dict | None:
+        if not task.assignee_id:
+            return None
+        return dict(
+            user_id=task.assignee_id,
+            notif_type=NotificationType.status_change,
+            message=f"Task '{task.title}' status changed to {task.status}",
+            project_id=task.project_id,
+            task_id=task.id,
+        )
+
+    @staticmethod
+    def create_assignment_notification(db: Session, task: Task, assignee: User):
+        return NotificationRepository.create(
+            db, **NotificationService.assignment_values(task, assignee.id)
+        )
+
     @staticmethod
     def create_status_change_notification(db: Session, task: Task):
-        if task.assignee_id:
-            return NotificationRepository.create(
-                db,
-                user_id=task.assignee_id,
-                notif_type=NotificationType.status_change,
-                message=f"Task '{task.title}' status changed to {task.status}",
-                project_id=task.project_id,
-                task_id=task.id,
-            )
+        values = NotificationService.status_change_values(task)
+        if values:
+            return NotificationRepository.create(db, **values)
+
+    @staticmethod
+    def create_many(db: Session, values: list[dict]) -> None:
+        """Insert notifications built by the *_values helpers in one statement."""
+        NotificationRepository.create_many(db, values)
 
     @staticmethod
     def create_comment_notification(db: Session, task: Task, commenter: User):
@@ -43,8 +59,8 @@ class NotificationService:
             )
 
     @staticmethod
-    def get_unread(db: Session, user: User):
-        return NotificationRepository.get_unread(db, user.id)
+    def get_unread(db: Session, user: User, columns: tuple[str, ...] | None = None):
+        return NotificationRepository.get_unread(db, user.id, columns)
 
     @staticmethod
     def mark_read(db: Session, notif_id: int, user: User):
@@ -0,0 +1,91 @@
+"""Bounded process pool for bcrypt so hashing never occupies request threads."""
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable
+
+from fastapi import HTTPException, status
+from starlette.concurrency import run_in_threadpool
+
+from app.config import settings
+from app.utils.security import (
+    hash_password,
+    verify_and_update_password,
+    verify_password,
+)
+
+
+class PasswordHasher:
+    """Async facade over a process pool running the CPU-bound passlib calls.
+
+    At most `workers + queue_depth` operations are admitted at once; anything
+    beyond that is rejected immediately with 429 instead of queueing behind a
+    login spike. `workers=0` runs hashing in the threadpool (old behaviour).
+    """
+
+    def __init__(self, workers: int, queue_depth: int):
+        self.workers = workers
+        self.queue_depth = queue_depth
+        self._in_flight = 0
+        self._pool: ProcessPoolExecutor | None = None
+
+    def _executor(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            # spawn: forking a process that already runs threads is unsafe
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._pool
+
+    async def _submit(self, fn: Callable[..., Any], *args: Any) -> Any:
+        if self._in_flight >= self.workers + self.queue_depth:
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail="Too many concurrent authentication requests",
+                headers={"Retry-After": "1"},
+            )
+        self._in_flight += 1
+        try:
+            if self.workers <= 0:
+                return await run_in_threadpool(fn, *args)
+            pool = self._executor()
+            try:
+                return await asyncio.wrap_future(pool.submit(fn, *args))
+            except BrokenProcessPool:
+                # A worker died (e.g. OOM-killed) and the executor refuses all
+                # further work. Replace it once, unless a concurrent call
+                # already did, and retry: the hashing calls are pure.
+                self._discard(pool)
+                return await asyncio.wrap_future(self._executor().submit(fn, *args))
+        finally:
+            self._in_flight -= 1
+
+    async def hash(self, password: str) -> str:
+        return await self._submit(hash_password, password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return await self._submit(verify_password, plain_password, hashed_password)
+
+    async def verify_and_update(
+        self, plain_password: str, hashed_password: str
+    ) -> tuple[bool, str | None]:
+        return await self._submit(
+            verify_and_update_password, plain_password, hashed_password
+        )
+
+    def _discard(self, pool: ProcessPoolExecutor) -> None:
+        if self._pool is pool:
+            self._pool = None
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    def shutdown(self) -> None:
+        if self._pool is not None:
+            self._discard(self._pool)
+
+
+password_hasher = PasswordHasher(
+    workers=settings.password_hash_workers,
+    queue_depth=settings.password_hash_queue_depth,
+)
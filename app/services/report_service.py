@@ -1,16 +1,185 @@
-from datetime import date
+import csv
+import io
+from datetime import date, datetime, timedelta, timezone
+from typing import Iterator
 
+import orjson
+from fastapi import HTTPException
 from sqlalchemy.orm import Session
 
+from app.core import report_cache
+from app.repositories.project_daily_stats_repository import (
+    FLOW_COLUMNS,
+    ProjectDailyStatsRepository,
+)
+from app.repositories.project_task_stats_repository import STATUS_COLUMNS
 from app.repositories.report_repository import ReportRepository
+from app.repositories.task_repository import encode_task_cursor
+from app.schemas.report import OverdueTaskOut, ReportFormat
+from app.schemas.task import SortOrder, TaskSortKey
+from app.utils.fast_json import model_fields, row_encoder
+
+OVERDUE_COLUMNS = model_fields(OverdueTaskOut)
+# Chart ranges: the last DEFAULT_RANGE_DAYS days unless given, at most a year
+DEFAULT_RANGE_DAYS = 30
+MAX_RANGE_DAYS = 366
+
+
+def _snapshot_range(start: date | None, end: date | None) -> tuple[date, date]:
+    # Snapshot days are UTC dates
+    end = end or datetime.now(timezone.utc).date()
+    start = start or end - timedelta(days=DEFAULT_RANGE_DAYS - 1)
+    if start > end:
+        raise HTTPException(status_code=400, detail="start must not be after end")
+    if (end - start).days >= MAX_RANGE_DAYS:
+        raise HTTPException(
+            status_code=400, detail=f"Range is limited to {MAX_RANGE_DAYS} days"
+        )
+    return start, end
 
 
 class ReportService:
+    """Project reports, served from the report cache (app.core.report_cache)."""
+
+    @staticmethod
+    def status_count(db: Session, project_id: int, task_seq: int):
+        return report_cache.get_or_load(
+            project_id,
+            task_seq,
+            "status_count",
+            lambda: ReportRepository.count_tasks_by_status(db, project_id),
+        )
+
     @staticmethod
-    def status_count(db: Session, project_id: int):
-        return ReportRepository.count_tasks_by_status(db, project_id)
+    def priority_count(db: Session, project_id: int, task_seq: int):
+        return report_cache.get_or_load(
+            project_id,
+            task_seq,
+            "priority_count",
+            lambda: ReportRepository.count_tasks_by_priority(db, project_id),
+        )
 
     @staticmethod
-    def overdue_tasks(db: Session, project_id: int):
+    def overdue_tasks(
+        db: Session,
+        project_id: int,
+        task_seq: int,
+        after: tuple[date, int] | None,
+        limit: int,
+    ) -> tuple[list[dict], str | None]:
+        """A page of overdue tasks and the cursor of the next one (None if last).
+
+        First pages are cached; later ones are keyset reads on the partial
+        index ix_tasks_project_overdue.
+        """
         today = date.today()
-        return ReportRepository.get_overdue_tasks(db, project_id, today)
+
+        def load() -> dict:
+            rows = ReportRepository.get_overdue_tasks(
+                db, project_id, today, OVERDUE_COLUMNS, after=after, limit=limit + 1
+            )
+            next_cursor = None
+            if len(rows) > limit:
+                rows = rows[:limit]
+                next_cursor = encode_task_cursor(
+                    rows[-1], TaskSortKey.due_date, SortOrder.asc
+                )
+            return {
+                "tasks": row_encoder(OVERDUE_COLUMNS).dicts(rows),
+                "next_cursor": next_cursor,
+            }
+
+        if after is None:
+            field = report_cache.day_field(f"overdue_tasks:{limit}", today)
+            page = report_cache.get_or_load(project_id, task_seq, field, load)
+        else:
+            page = load()
+        return page["tasks"], page["next_cursor"]
+
+    @staticmethod
+    def export_overdue_tasks(
+        db: Session, project_id: int, fmt: ReportFormat
+    ) -> Iterator[bytes]:
+        """Every overdue task as CSV (with a header row) or NDJSON, in chunks.
+
+        Rows are read through a server-side cursor a batch at a time, so
+        memory stays constant however large the backlog is.
+        """
+        batches = ReportRepository.stream_overdue_tasks(
+            db, project_id, date.today(), OVERDUE_COLUMNS
+        )
+        if fmt == ReportFormat.ndjson:
+            encoder = row_encoder(OVERDUE_COLUMNS)
+            for rows in batches:
+                yield b"".join(orjson.dumps(row) + b"\n" for row in encoder.dicts(rows))
+            return
+
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(OVERDUE_COLUMNS)
+        for rows in batches:
+            writer.writerows(
+                (task_id, title, due_date.isoformat(), status.value)
+                for task_id, title, due_date, status in rows
+            )
+            yield buffer.getvalue().encode()
+            buffer.seek(0)
+            buffer.truncate()
+        if buffer.tell():  # header only: no overdue tasks
+            yield buffer.getvalue().encode()
+
+    @staticmethod
+    def burndown(
+        db: Session, project_id: int, start: date | None, end: date | None
+    ) -> list[dict]:
+        """Open vs done tasks per day, from the daily snapshots.
+
+        Days without counts (before the job first ran, backfilled, or today)
+        are left out rather than guessed.
+        """
+        start, end = _snapshot_range(start, end)
+        rows = ProjectDailyStatsRepository.list_between(
+            db, project_id, start, end, ("day", *STATUS_COLUMNS)
+        )
+        return [
+            {**row._asdict(), "remaining": row.todo + row.in_progress}
+            for row in rows
+            if row.todo is not None
+        ]
+
+    @staticmethod
+    def throughput(
+        db: Session, project_id: int, start: date | None, end: date | None
+    ) -> list[dict]:
+        """Tasks created and completed per day, from the daily snapshots."""
+        start, end = _snapshot_range(start, end)
+        rows = ProjectDailyStatsRepository.list_between(
+            db, project_id, start, end, ("day", *FLOW_COLUMNS)
+        )
+        return [row._asdict() for row in rows]
+
+    @staticmethod
+    def org_summary(
+        db: Session, org_id: int, after_id: int | None, limit: int
+    ) -> list[dict]:
+        """Status, overdue and per-assignee open counts for a page of projects."""
+        rows = ReportRepository.org_summary(db, org_id, date.today(), after_id, limit)
+        summaries: dict[int, dict] = {}
+        for row in rows:
+            summary = summaries.get(row.id)
+            if summary is None:
+                summary = summaries[row.id] = {
+                    "project_id": row.id,
+                    "name": row.name,
+                    "status_count": {
+                        name: getattr(row, name) for name in STATUS_COLUMNS
+                    },
+                    "overdue": 0,
+                    "open_by_assignee": [],
+                }
+            if row.open is not None:
+                summary["overdue"] += row.overdue
+                summary["open_by_assignee"].append(
+                    {"assignee_id": row.assignee_id, "open": row.open}
+                )
+        return list(summaries.values())
@@ -0,0 +1,38 @@
+import logging
+from datetime import date, datetime, timedelta, timezone
+
+from sqlalchemy.orm import Session
+
+from app.repositories.project_daily_stats_repository import ProjectDailyStatsRepository
+
+logger = logging.getLogger(__name__)
+
+
+class SnapshotService:
+    @staticmethod
+    def snapshot_day(db: Session, day: date, *, chunk_size: int) -> int:
+        """Write every project's aggregates for `day` to project_daily_stats.
+
+        Meant to run just after the day ends (UTC). Status and priority counts
+        are only known as of the run, so they are taken for that day alone;
+        an older day (a backfill) gets created/completed only and keeps the
+        counts it has. ValueError for a day that has not ended. One
+        transaction per `chunk_size` projects. Returns how many projects were
+        snapshotted.
+        """
+        today = datetime.now(timezone.utc).date()
+        if day >= today:
+            raise ValueError(f"{day} has not ended yet (UTC)")
+        counters = day == today - timedelta(days=1)
+        after_id, projects = 0, 0
+        while True:
+            project_ids = ProjectDailyStatsRepository.snapshot(
+                db, day, after_id, chunk_size, counters=counters
+            )
+            if not project_ids:
+                break
+            db.commit()
+            projects += len(project_ids)
+            after_id = project_ids[-1]
+            logger.info("Snapshotted %s for %d projects", day, projects)
+        return projects
@@ -0,0 +1,176 @@
+from fastapi import HTTPException
+from pydantic import ValidationError
+from sqlalchemy.orm import Session
+
+from app.models.task import STATUS_ORDER, Task
+from app.repositories.project_member_repository import ProjectMemberRepository
+from app.repositories.project_repository import ProjectRepository
+from app.repositories.project_task_stats_repository import count_task
+from app.repositories.task_repository import TaskRepository, mark_completion
+from app.repositories.user_repository import UserRepository
+from app.schemas.task import (
+    TaskBatchItemResult,
+    TaskBatchResult,
+    TaskBatchUpdateItem,
+    TaskCreate,
+    TaskOut,
+)
+from app.services.notification_service import NotificationService
+
+MEMBER_EDITABLE_FIELDS = {"id", "version", "status"}
+
+
+def _validation_message(exc: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in err['loc']) or 'item'}: {err['msg']}"
+        for err in exc.errors()
+    )
+
+
+def _rejected(count: int, errors: dict[int, str]) -> TaskBatchResult:
+    return TaskBatchResult(
+        applied=False,
+        results=[
+            TaskBatchItemResult(index=i, ok=i not in errors, error=errors.get(i))
+            for i in range(count)
+        ],
+    )
+
+
+def _applied(tasks: list[Task]) -> TaskBatchResult:
+    return TaskBatchResult(
+        applied=True,
+        results=[
+            TaskBatchItemResult(index=i, ok=True, task=TaskOut.model_validate(task))
+            for i, task in enumerate(tasks)
+        ],
+    )
+
+
+class TaskBatchService:
+    """All-or-nothing batch create/update.
+
+    Every item is validated before anything is written. If any item fails,
+    nothing is applied and each failing item carries its error; otherwise the
+    whole batch and its notifications are written in the request's
+    transaction.
+    """
+
+    @staticmethod
+    def create_tasks(
+        db: Session, project_id: int, items: list[dict], user
+    ) -> TaskBatchResult:
+        project = ProjectRepository.get_by_id(db, project_id)
+        if not project or project.org_id != user.org_id:
+            raise HTTPException(status_code=404, detail="Project not found")
+        if not ProjectMemberRepository.is_member(db, project_id, user.id):
+            raise HTTPException(status_code=403, detail="You are not a project member")
+        if user.role.value == "member":
+            raise HTTPException(status_code=403, detail="Members cannot create tasks")
+
+        errors: dict[int, str] = {}
+        payloads: dict[int, TaskCreate] = {}
+        for i, raw in enumerate(items):
+            try:
+                payloads[i] = TaskCreate.model_validate(raw)
+            except ValidationError as e:
+                errors[i] = _validation_message(e)
+
+        assignee_ids = {p.assignee_id for p in payloads.values() if p.assignee_id}
+        valid_assignees = UserRepository.ids_in_org(db, user.org_id, assignee_ids)
+        for i, payload in payloads.items():
+            if payload.assignee_id and payload.assignee_id not in valid_assignees:
+                errors[i] = "Assignee not found"
+        if errors:
+            return _rejected(len(items), errors)
+
+        tasks = TaskRepository.create_many(
+            db, project_id, [payloads[i] for i in range(len(items))]
+        )
+        NotificationService.create_many(
+            db,
+            [
+                NotificationService.assignment_values(task, task.assignee_id)
+                for task in tasks
+                if task.assignee_id
+            ],
+        )
+        return _applied(tasks)
+
+    @staticmethod
+    def update_tasks(db: Session, items: list[dict], user) -> TaskBatchResult:
+        errors: dict[int, str] = {}
+        payloads: dict[int, TaskBatchUpdateItem] = {}
+        seen_ids: set[int] = set()
+        for i, raw in enumerate(items):
+            try:
+                payload = TaskBatchUpdateItem.model_validate(raw)
+            except ValidationError as e:
+                errors[i] = _validation_message(e)
+                continue
+            if payload.id in seen_ids:
+                errors[i] = "Task appears more than once in the batch"
+                continue
+            seen_ids.add(payload.id)
+            payloads[i] = payload
+
+        found = TaskRepository.get_many_with_membership(db, list(seen_ids), user.id)
+        assignee_ids = {p.assignee_id for p in payloads.values() if p.assignee_id}
+        valid_assignees = UserRepository.ids_in_org(db, user.org_id, assignee_ids)
+
+        for i, payload in payloads.items():
+            task, is_member = found.get(payload.id, (None, False))
+            if task is None or task.project.org_id != user.org_id:
+                errors[i] = "Task not found"
+                continue
+            ProjectMemberRepository.remember(db, task.project_id, user.id, is_member)
+            if not is_member:
+                errors[i] = "You are not a project member"
+            elif user.role.value == "member" and any(
+                getattr(payload, field) is not None
+                for field in payload.model_fields_set - MEMBER_EDITABLE_FIELDS
+            ):
+                errors[i] = "Members can only update status"
+            elif payload.version is not None and payload.version != task.version:
+                errors[i] = "Task has been modified"
+            elif payload.assignee_id and payload.assignee_id not in valid_assignees:
+                errors[i] = "Assignee not found"
+            elif (
+                payload.status
+                and STATUS_ORDER[payload.status] < STATUS_ORDER[task.status]
+            ):
+                errors[i] = "Status cannot move backward"
+        if errors:
+            return _rejected(len(items), errors)
+
+        tasks, notifications = [], []
+        for i in range(len(items)):
+            payload = payloads[i]
+            task = found[payload.id][0]
+            old_assignee_id, old_status = task.assignee_id, task.status
+            changes = ProjectRepository.task_changes(db, task.project_id)
+            changes.changed.add(task.id)
+            count_task(changes.deltas, task.status, task.priority, -1)
+            for field, value in payload.model_dump(
+                exclude_unset=True, exclude={"id", "version"}
+            ).items():
+                setattr(task, field, value)
+            mark_completion(task, old_status)
+            if task.assignee_id and task.assignee_id != old_assignee_id:
+                notifications.append(
+                    NotificationService.assignment_values(task, task.assignee_id)
+                )
+            if task.status != old_status:
+                values = NotificationService.status_change_values(task)
+                if values:
+                    notifications.append(values)
+            count_task(changes.deltas, task.status, task.priority)
+            tasks.append(task)
+
+        if not TaskRepository.update_many(db, tasks):
+            db.rollback()
+            raise HTTPException(
+                status_code=409, detail="Tasks were modified concurrently"
+            )
+        NotificationService.create_many(db, notifications)
+        return _applied(tasks)
@@ -0,0 +1,59 @@
+"""Zero-hydration JSON for list endpoints.
+
+List endpoints select exactly their response model's columns with a Core
+`select()` and encode the row tuples straight to JSON with orjson, skipping
+ORM identity-map hydration and per-object Pydantic validation. The output is
+byte-for-byte what the `response_model` path produces for these models
+(orjson writes enums by value and dates/datetimes in ISO 8601, like Pydantic).
+"""
+from functools import lru_cache
+
+import orjson
+from fastapi import Response
+from pydantic import BaseModel
+
+
+class RowEncoder:
+    """Encodes rows whose leading columns are `fields`, in that order.
+
+    Trailing columns (e.g. a sort key selected only for the cursor) are
+    dropped.
+    """
+
+    def __init__(self, fields: tuple[str, ...]):
+        self.fields = fields
+
+    def dicts(self, rows) -> list[dict]:
+        fields = self.fields
+        return [dict(zip(fields, row)) for row in rows]
+
+    def __call__(self, rows) -> bytes:
+        return orjson.dumps(self.dicts(rows))
+
+
+@lru_cache(maxsize=256)
+def row_encoder(fields: tuple[str, ...]) -> RowEncoder:
+    return RowEncoder(fields)
+
+
+def model_fields(model: type[BaseModel]) -> tuple[str, ...]:
+    """Column names to select for `model`, in response order."""
+    return tuple(model.model_fields)
+
+
+def rows_response(
+    fields: tuple[str, ...], rows, headers: dict[str, str] | None = None
+) -> Response:
+    """JSON list response for column rows; bypasses `response_model`."""
+    return Response(
+        content=row_encoder(fields)(rows),
+        media_type="application/json",
+        headers=headers,
+    )
+
+
+def json_response(payload, headers: dict[str, str] | None = None) -> Response:
+    """orjson-encoded response for a payload built from `RowEncoder.dicts`."""
+    return Response(
+        content=orjson.dumps(payload), media_type="application/json", headers=headers
+    )
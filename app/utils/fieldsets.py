@@ -0,0 +1,26 @@
+"""Sparse fieldsets: `?fields=id,title,status` on list endpoints.
+
+The requested names are validated against the endpoint's response model; the
+repository then selects just those columns and `rows_response` encodes them.
+"""
+from pydantic import BaseModel
+
+from app.utils.fast_json import model_fields
+
+# Always returned so clients can address what they listed
+ALWAYS_INCLUDED = ("id",)
+
+
+def parse_fields(raw: str | None, model: type[BaseModel]) -> tuple[str, ...]:
+    """Requested fields in model order; every model field when `raw` is None.
+
+    Raises ValueError naming any field the model does not have.
+    """
+    if raw is None:
+        return model_fields(model)
+    requested = {name.strip() for name in raw.split(",") if name.strip()}
+    unknown = requested - model.model_fields.keys()
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(sorted(unknown))}")
+    requested.update(ALWAYS_INCLUDED)
+    return tuple(name for name in model.model_fields if name in requested)
@@ -0,0 +1,43 @@
+"""ETag / conditional GET helpers.
+
+ETags are computed from cheap version data (a task's `Task.version`, a
+project's change counters) read by one indexed lookup, so an unchanged
+resource can be answered with 304 before any rows are loaded or serialized.
+"""
+import hashlib
+
+from fastapi import Response
+
+# Responses are per-user (authorization) and must be revalidated every time
+CACHE_CONTROL = "private, no-cache"
+
+
+def make_etag(*parts) -> str:
+    """Strong ETag over the given version parts."""
+    digest = hashlib.sha1(":".join(str(part) for part in parts).encode())
+    return f'"{digest.hexdigest()[:32]}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """If-None-Match uses weak comparison: a W/ prefix is ignored."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (tag.strip() for tag in if_none_match.split(","))
+    return etag in (tag[2:] if tag.startswith("W/") else tag for tag in candidates)
+
+
+def if_match_satisfied(if_match: str, etag: str) -> bool:
+    """If-Match uses strong comparison: weak validators never match."""
+    if if_match.strip() == "*":
+        return True
+    return etag in (tag.strip() for tag in if_match.split(","))
+
+
+def cache_headers(etag: str) -> dict[str, str]:
+    return {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+
+
+def not_modified(etag: str) -> Response:
+    return Response(status_code=304, headers=cache_headers(etag))
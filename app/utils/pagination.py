@@ -0,0 +1,64 @@
+"""Keyset (cursor) pagination helpers.
+
+A page is addressed by the sort value and id of the last row already seen, so
+every page is an index range scan on (filter columns..., sort column, id)
+instead of an OFFSET that re-reads all earlier rows. Cursors are opaque to
+clients: base64url-encoded JSON.
+"""
+import base64
+import json
+from typing import Any
+
+from sqlalchemy import and_, literal, or_, tuple_
+from sqlalchemy.sql.elements import ColumnElement
+
+
+def encode_cursor(payload: dict[str, Any]) -> str:
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> dict[str, Any]:
+    """Decode a cursor produced by `encode_cursor`; ValueError if malformed."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (ValueError, TypeError) as exc:
+        raise ValueError("Invalid cursor") from exc
+    if not isinstance(payload, dict):
+        raise ValueError("Invalid cursor")
+    return payload
+
+
+def keyset_order(column, id_column, descending: bool) -> list:
+    """ORDER BY matching a (column, id) btree.
+
+    NULLS LAST ascending, NULLS FIRST descending.
+    """
+    if descending:
+        return [column.desc().nulls_first(), id_column.desc()]
+    return [column.asc().nulls_last(), id_column.asc()]
+
+
+def keyset_after(
+    column,
+    id_column,
+    value: Any,
+    last_id: int,
+    descending: bool,
+    nullable: bool = False,
+) -> ColumnElement[bool]:
+    """Rows strictly after (value, last_id) in `keyset_order` order.
+
+    Uses a row-value comparison so PostgreSQL turns it into a single index
+    range; the NULL branches only apply to nullable sort columns.
+    """
+    if value is None:
+        if descending:
+            return or_(and_(column.is_(None), id_column < last_id), column.isnot(None))
+        return and_(column.is_(None), id_column > last_id)
+    key = tuple_(literal(value, column.type), literal(last_id, id_column.type))
+    if descending:
+        return tuple_(column, id_column) < key
+    after = tuple_(column, id_column) > key
+    return or_(after, column.is_(None)) if nullable else after
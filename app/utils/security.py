@@ -1,3 +1,5 @@
+import hashlib
+import secrets
 from datetime import datetime, timedelta, timezone
 from typing import Any, Optional
 
@@ -6,7 +8,37 @@ from passlib.context import CryptContext
 
 from app.config import settings
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+PASSWORD_SCHEMES = ("bcrypt", "argon2")
+
+
+def build_pwd_context(
+    scheme: str = settings.password_hash_scheme,
+    bcrypt_rounds: int = settings.bcrypt_rounds,
+    argon2_time_cost: int = settings.argon2_time_cost,
+    argon2_memory_cost: int = settings.argon2_memory_cost,
+    argon2_parallelism: int = settings.argon2_parallelism,
+) -> CryptContext:
+    """Build the password context for the configured scheme and cost.
+
+    The other supported scheme stays verifiable but is marked deprecated, and
+    min/max costs are pinned to the configured value, so `needs_update` flags
+    any stored hash that differs from the current policy.
+    """
+    return CryptContext(
+        schemes=[scheme] + [s for s in PASSWORD_SCHEMES if s != scheme],
+        deprecated="auto",
+        bcrypt__rounds=bcrypt_rounds,
+        bcrypt__min_rounds=bcrypt_rounds,
+        bcrypt__max_rounds=bcrypt_rounds,
+        argon2__rounds=argon2_time_cost,
+        argon2__min_rounds=argon2_time_cost,
+        argon2__max_rounds=argon2_time_cost,
+        argon2__memory_cost=argon2_memory_cost,
+        argon2__parallelism=argon2_parallelism,
+    )
+
+
+pwd_context = build_pwd_context()
 
 ALGORITHM = settings.algorithm
 SECRET_KEY = settings.secret_key
@@ -14,23 +46,36 @@ ACCESS_TOKEN_EXPIRE_MINUTES = settings.access_token_expire_minutes
 
 
 def hash_password(password: str) -> str:
-    """Hash a plaintext password using bcrypt."""
+    """Hash a plaintext password using the configured scheme."""
     return pwd_context.hash(password)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """Verify a plaintext password against a bcrypt hash."""
+    """Verify a plaintext password against a stored hash."""
     return pwd_context.verify(plain_password, hashed_password)
 
 
+def verify_and_update_password(
+    plain_password: str, hashed_password: str
+) -> tuple[bool, str | None]:
+    """Verify a password; also return a rehash if the stored one is outdated."""
+    return pwd_context.verify_and_update(plain_password, hashed_password)
+
+
 def create_access_token(
-    *, sub: str, org_id: int, role: str, expires_delta: Optional[timedelta] = None
+    *,
+    sub: str,
+    org_id: int,
+    role: str,
+    ver: int = 0,
+    expires_delta: Optional[timedelta] = None,
 ) -> str:
     """Create a signed JWT access token with standard claims.
 
     sub: subject (user id as string)
     org_id: user's organization id
     role: user's role string (admin/manager/member)
+    ver: user's token_version at issue time (older versions are revoked)
     expires_delta: custom expiry duration; default from settings
     """
     now = datetime.now(timezone.utc)
@@ -39,7 +84,19 @@ def create_access_token(
         "sub": sub,
         "org_id": org_id,
         "role": role,
+        "ver": ver,
         "iat": int(now.timestamp()),
         "exp": int(expire.timestamp()),
     }
     return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+
+
+def generate_refresh_token() -> tuple[str, str]:
+    """Return a new opaque refresh token and the hash to store for it."""
+    raw = secrets.token_urlsafe(32)
+    return raw, hash_refresh_token(raw)
+
+
+def hash_refresh_token(raw: str) -> str:
+    """SHA-256 is enough here: refresh tokens are 256-bit random, not passwords."""
+    return hashlib.sha256(raw.encode()).hexdigest()
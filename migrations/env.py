@@ -32,6 +32,16 @@ config.set_main_option("sqlalchemy.url", settings.database_url)
 # target_metadata = mymodel.Base.metadata
 target_metadata = Base.metadata
 
+# Database-managed objects that are deliberately not on the models
+UNMAPPED_OBJECTS = {
+    ("column", "search_vector"),
+    ("index", "ix_tasks_search_vector"),
+}
+
+
+def include_object(object, name, type_, reflected, compare_to):
+    return not (reflected and (type_, name) in UNMAPPED_OBJECTS)
+
 
 def run_migrations_offline() -> None:
     """Run migrations in 'offline' mode.
@@ -51,6 +61,7 @@ def run_migrations_offline() -> None:
         target_metadata=target_metadata,
         literal_binds=True,
         compare_type=True,
+        include_object=include_object,
         dialect_opts={"paramstyle": "named"},
     )
 
@@ -76,6 +87,7 @@ def run_migrations_online() -> None:
             connection=connection,
             target_metadata=target_metadata,
             compare_type=True,
+            include_object=include_object,
         )
 
         with context.begin_transaction():
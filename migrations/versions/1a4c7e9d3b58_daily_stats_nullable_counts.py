@@ -0,0 +1,31 @@
+"""daily stats nullable counts
+
+Revision ID: 1a4c7e9d3b58
+Revises: 7d2e9b4c6a10
+Create Date: 2026-10-19 11:08:53.274640
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '1a4c7e9d3b58'
+down_revision: Union[str, None] = '7d2e9b4c6a10'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COUNT_COLUMNS = ('todo', 'in_progress', 'done', 'low', 'medium', 'high')
+
+
+def upgrade() -> None:
+    for name in COUNT_COLUMNS:
+        op.alter_column('project_daily_stats', name, existing_type=sa.Integer(), nullable=True, server_default=None, existing_server_default=sa.text('0'))
+
+
+def downgrade() -> None:
+    for name in COUNT_COLUMNS:
+        op.execute(f"UPDATE project_daily_stats SET {name} = 0 WHERE {name} IS NULL")
+        op.alter_column('project_daily_stats', name, existing_type=sa.Integer(), nullable=False, server_default='0')
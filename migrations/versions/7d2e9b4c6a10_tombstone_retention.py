@@ -0,0 +1,28 @@
+"""tombstone retention
+
+Revision ID: 7d2e9b4c6a10
+Revises: c3d8f1a6e094
+Create Date: 2026-10-19 09:42:17.503118
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7d2e9b4c6a10'
+down_revision: Union[str, None] = 'c3d8f1a6e094'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('projects', sa.Column('tombstone_seq', sa.Integer(), server_default='0', nullable=False))
+    op.create_index('ix_task_tombstones_deleted_at', 'task_tombstones', ['deleted_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_task_tombstones_deleted_at', table_name='task_tombstones')
+    op.drop_column('projects', 'tombstone_seq')
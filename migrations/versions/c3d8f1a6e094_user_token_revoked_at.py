@@ -0,0 +1,30 @@
+"""user token revoked at
+
+Revision ID: c3d8f1a6e094
+Revises: 5f9a3c7e1b28
+Create Date: 2026-10-18 23:10:42.381957
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3d8f1a6e094'
+down_revision: Union[str, None] = '5f9a3c7e1b28'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('users', sa.Column('token_revoked_at', sa.DateTime(), nullable=True))
+    # Users revoked before the column existed: found by the first full load
+    op.execute("UPDATE users SET token_revoked_at = CURRENT_TIMESTAMP WHERE token_version > 0")
+    op.create_index('ix_users_token_revoked_at', 'users', ['token_revoked_at'], unique=False, postgresql_where=sa.text('token_revoked_at IS NOT NULL'), sqlite_where=sa.text('token_revoked_at IS NOT NULL'))
+
+
+def downgrade() -> None:
+    op.drop_index('ix_users_token_revoked_at', table_name='users', postgresql_where=sa.text('token_revoked_at IS NOT NULL'), sqlite_where=sa.text('token_revoked_at IS NOT NULL'))
+    op.drop_column('users', 'token_revoked_at')
@@ -0,0 +1,55 @@
+"""
+Move tasks that have been done for a while into the archive tables.
+
+Tasks whose status is done and that were last written more than
+--older-than-days ago move, with their comments and attachment metadata, to
+tasks_archive / comments_archive / attachments_archive in batches of
+--batch-size, one transaction each. Safe to run repeatedly (e.g. nightly from
+cron) and alongside the API: rows locked by a writer are skipped until the
+next run.
+
+Usage: python scripts/archive_tasks.py [--older-than-days 90] [--batch-size 500]
+                                       [--max-batches N] [--pause 0.1]
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from app.config import settings
+from app.database import SessionLocal
+from app.services.archive_service import ArchiveService
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--older-than-days", type=int, default=settings.archive_after_days
+    )
+    parser.add_argument("--batch-size", type=int, default=settings.archive_batch_size)
+    parser.add_argument("--max-batches", type=int)
+    parser.add_argument(
+        "--pause", type=float, default=0.0, help="seconds to sleep between batches"
+    )
+    args = parser.parse_args()
+    logging.basicConfig(level=settings.log_level, format="[archive] %(message)s")
+
+    with SessionLocal() as db:
+        moved = ArchiveService.archive_done_tasks(
+            db,
+            older_than_days=args.older_than_days,
+            batch_size=args.batch_size,
+            max_batches=args.max_batches,
+            pause_seconds=args.pause,
+        )
+    print(f"[archive] moved {moved} tasks")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,297 @@
+"""
+Benchmark the workload indexes: query plans and latency before and after.
+
+Seeds a large synthetic dataset into a scratch database, runs the query shapes
+used by the repositories with only the original indexes present, then creates
+the workload indexes (see migration d7a3f1c0b942), runs ANALYZE and repeats.
+For each query it prints the plan (EXPLAIN ANALYZE on PostgreSQL, EXPLAIN
+QUERY PLAN on SQLite) and the median latency.
+
+The target database is dropped and recreated: never point it at real data.
+
+Usage: python scripts/bench_indexes.py [--database-url postgresql://.../bench]
+                                       [--tasks 200000] [--repeat 20]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from sqlalchemy import Index, create_engine, func, insert, select, text
+from sqlalchemy.engine import Connection, Engine
+
+import app.models  # registers every table on Base.metadata
+from app.database import Base
+from app.models.attachment import Attachment
+from app.models.comment import Comment
+from app.models.notification import Notification, NotificationType
+from app.models.organization import Organization
+from app.models.project import Project, ProjectMember
+from app.models.task import Task, TaskPriority, TaskStatus
+from app.models.user import User, UserRole
+
+WORKLOAD_INDEXES = {
+    "ix_tasks_project_status",
+    # ix_tasks_project_due_date_open in d7a3f1c0b942, keyed for paging by
+    # 0b7e4c2d9f61
+    "ix_tasks_project_overdue",
+    # ix_tasks_assignee_id in d7a3f1c0b942, widened by 2d9e6b4f8a13
+    "ix_tasks_assignee_status_due_date",
+    "ix_notifications_user_unread",
+    "ix_comments_task_created_at",
+    "ix_attachments_task_id",
+    "ix_project_members_user_id",
+}
+# What the initial schema had in place of ix_tasks_project_status
+CREATE_OLD_INDEX = "CREATE INDEX ix_tasks_status_project ON tasks (status, project_id)"
+DROP_OLD_INDEX = "DROP INDEX ix_tasks_status_project"
+CHUNK = 10_000
+
+
+def workload_indexes() -> list[Index]:
+    return [
+        index
+        for table in Base.metadata.sorted_tables
+        for index in table.indexes
+        if index.name in WORKLOAD_INDEXES
+    ]
+
+
+def chunked_insert(conn: Connection, table, rows) -> None:
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) == CHUNK:
+            conn.execute(insert(table), batch)
+            batch = []
+    if batch:
+        conn.execute(insert(table), batch)
+
+
+def seed(engine: Engine, args: argparse.Namespace) -> None:
+    rng = random.Random(42)
+    today = date.today()
+    now = datetime.utcnow()
+    users = range(1, args.users + 1)
+    projects = range(1, args.projects + 1)
+
+    with engine.begin() as conn:
+        conn.execute(insert(Organization), [{"id": 1, "name": "Bench"}])
+        chunked_insert(
+            conn,
+            User,
+            (
+                {
+                    "id": uid,
+                    "org_id": 1,
+                    "email": f"user{uid}@bench.example",
+                    "password_hash": "x",
+                    "role": UserRole.member,
+                }
+                for uid in users
+            ),
+        )
+        conn.execute(
+            insert(Project),
+            [{"id": pid, "org_id": 1, "name": f"P{pid}"} for pid in projects],
+        )
+        chunked_insert(
+            conn,
+            ProjectMember,
+            (
+                {"project_id": pid, "user_id": uid}
+                for pid in projects
+                for uid in rng.sample(users, min(args.members, len(users)))
+            ),
+        )
+        chunked_insert(
+            conn,
+            Task,
+            (
+                {
+                    "id": tid,
+                    "project_id": rng.choice(projects),
+                    "title": f"Task {tid}",
+                    "status": rng.choices(list(TaskStatus), weights=[3, 2, 5], k=1)[0],
+                    "priority": rng.choice(list(TaskPriority)),
+                    "due_date": today + timedelta(days=rng.randint(-60, 60)),
+                    "assignee_id": rng.choice(users),
+                    "created_at": now - timedelta(minutes=tid),
+                    "updated_at": now - timedelta(minutes=tid),
+                }
+                for tid in range(1, args.tasks + 1)
+            ),
+        )
+        chunked_insert(
+            conn,
+            Comment,
+            (
+                {
+                    "task_id": rng.randint(1, args.tasks),
+                    "user_id": rng.choice(users),
+                    "content": "comment",
+                    "created_at": now - timedelta(seconds=i),
+                }
+                for i in range(args.tasks * 2)
+            ),
+        )
+        chunked_insert(
+            conn,
+            Attachment,
+            (
+                {
+                    "task_id": rng.randint(1, args.tasks),
+                    "user_id": rng.choice(users),
+                    "file_name": "f.txt",
+                    "file_path": "/dev/null",
+                    "file_size": 1,
+                }
+                for _ in range(args.tasks // 2)
+            ),
+        )
+        chunked_insert(
+            conn,
+            Notification,
+            (
+                {
+                    "user_id": rng.choice(users),
+                    "type": NotificationType.assignment,
+                    "message": "assigned",
+                    "is_read": rng.random() < 0.8,
+                    "created_at": now - timedelta(seconds=i),
+                }
+                for i in range(args.tasks * 2)
+            ),
+        )
+
+
+def queries(args: argparse.Namespace) -> dict[str, object]:
+    """The statements the repositories issue, with representative parameters."""
+    project_id, user_id, task_id = args.projects // 2, args.users // 2, args.tasks // 2
+    return {
+        "tasks by project+status": select(Task)
+        .where(Task.project_id == project_id, Task.status == TaskStatus.in_progress)
+        .limit(100),
+        "status counts": select(Task.status, func.count(Task.id))
+        .where(Task.project_id == project_id)
+        .group_by(Task.status),
+        "overdue": select(Task)
+        .where(
+            Task.project_id == project_id,
+            Task.due_date < date.today(),
+            Task.status != TaskStatus.done,
+        )
+        .order_by(Task.due_date, Task.id)
+        .limit(100),
+        "tasks by assignee": select(Task).where(Task.assignee_id == user_id),
+        "open tasks by assignee": select(Task)
+        .where(Task.assignee_id == user_id, Task.status == TaskStatus.todo)
+        .order_by(Task.due_date, Task.id)
+        .limit(100),
+        "unread notifications": select(Notification)
+        .where(Notification.user_id == user_id, Notification.is_read == False)
+        .order_by(Notification.created_at.desc()),
+        "comments by task": select(Comment)
+        .where(Comment.task_id == task_id)
+        .order_by(Comment.created_at.asc()),
+        "attachments by task": select(Attachment).where(Attachment.task_id == task_id),
+        "projects of user": select(ProjectMember.project_id).where(
+            ProjectMember.user_id == user_id
+        ),
+    }
+
+
+def explain(conn: Connection, stmt) -> str:
+    sql = str(
+        stmt.compile(dialect=conn.dialect, compile_kwargs={"literal_binds": True})
+    )
+    if conn.dialect.name == "postgresql":
+        raw = conn.execute(text(f"EXPLAIN (ANALYZE, FORMAT JSON) {sql}")).scalar()
+        plan = (json.loads(raw) if isinstance(raw, str) else raw)[0]["Plan"]
+        nodes = []
+        while plan:
+            label = plan["Node Type"]
+            if "Index Name" in plan:
+                label += f" using {plan['Index Name']}"
+            nodes.append(label)
+            plan = (plan.get("Plans") or [None])[0]
+        return " -> ".join(nodes)
+    rows = conn.execute(text(f"EXPLAIN QUERY PLAN {sql}")).all()
+    return "; ".join(row[-1] for row in rows)
+
+
+def measure(engine: Engine, args: argparse.Namespace) -> dict[str, tuple[str, float]]:
+    results = {}
+    with engine.connect() as conn:
+        for name, stmt in queries(args).items():
+            plan = explain(conn, stmt)
+            timings = []
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                conn.execute(stmt).all()
+                timings.append((time.perf_counter() - start) * 1000)
+            results[name] = (plan, statistics.median(timings))
+    return results
+
+
+def analyze(engine: Engine) -> None:
+    with engine.begin() as conn:
+        conn.execute(text("ANALYZE"))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--database-url")
+    parser.add_argument("--tasks", type=int, default=200_000)
+    parser.add_argument("--users", type=int, default=2_000)
+    parser.add_argument("--projects", type=int, default=200)
+    parser.add_argument("--members", type=int, default=25)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    url = args.database_url
+    if url is None:
+        url = f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'bench_indexes.db')}"
+    engine = create_engine(url)
+    print(f"[bench] database: {engine.url.render_as_string(hide_password=True)}")
+
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    for index in workload_indexes():
+        index.drop(bind=engine)
+    with engine.begin() as conn:
+        conn.execute(text(CREATE_OLD_INDEX))
+
+    start = time.perf_counter()
+    seed(engine, args)
+    analyze(engine)
+    print(f"[bench] seeded {args.tasks} tasks in {time.perf_counter() - start:.1f}s")
+    before = measure(engine, args)
+
+    with engine.begin() as conn:
+        conn.execute(text(DROP_OLD_INDEX))
+    for index in workload_indexes():
+        index.create(bind=engine)
+    analyze(engine)
+    after = measure(engine, args)
+
+    for name in before:
+        (plan_before, ms_before), (plan_after, ms_after) = before[name], after[name]
+        print(f"\n{name}: {ms_before:.2f}ms -> {ms_after:.2f}ms")
+        print(f"  before: {plan_before}")
+        print(f"  after:  {plan_after}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
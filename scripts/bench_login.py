@@ -0,0 +1,145 @@
+"""
+Benchmark login latency with and without the password hashing process pool.
+
+Fires concurrent logins while a second stream of cheap authenticated requests
+(GET /users/me) runs alongside, and reports p50/p99 for both. The interesting
+number is the p99 of the cheap requests: without the pool they queue behind
+bcrypt in the request threadpool.
+
+Usage: python scripts/bench_login.py [--logins 200] [--concurrency 50]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from fastapi import Request
+from httpx import AsyncClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.config import settings
+
+settings.redis_cache_enabled = False
+
+from app.database import Base, get_db, request_session
+from app.main import app
+from app.services.password_hasher import password_hasher
+
+# A file-backed database with a real connection pool: concurrent logins each
+# get their own connection. One shared in-memory connection would interleave
+# their transactions ("cannot start a transaction within a transaction").
+# The busy timeout makes overlapping writers wait for SQLite's lock.
+engine = create_engine(
+    f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'bench_login.db')}",
+    connect_args={"check_same_thread": False, "timeout": 30},
+    pool_size=20,
+    max_overflow=40,
+)
+BenchSessionLocal = sessionmaker(
+    autocommit=False, autoflush=False, expire_on_commit=False, bind=engine
+)
+
+
+def override_get_db(request: Request):
+    yield from request_session(request, BenchSessionLocal)
+
+
+app.dependency_overrides[get_db] = override_get_db
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def timed(coro) -> float:
+    start = time.perf_counter()
+    resp = await coro
+    elapsed = (time.perf_counter() - start) * 1000
+    if resp.status_code != 200:
+        raise RuntimeError(f"{resp.request.url} -> {resp.status_code}: {resp.text}")
+    return elapsed
+
+
+async def run(workers: int, logins: int, concurrency: int) -> dict[str, list[float]]:
+    password_hasher.shutdown()
+    password_hasher.workers = workers
+    # Large enough that the benchmark measures queueing, not 429s
+    password_hasher.queue_depth = logins
+
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+
+    async with AsyncClient(app=app, base_url="http://bench") as client:
+        resp = await client.post(
+            "/api/v1/auth/register",
+            json={"org_name": "Bench", "email": "bench@example.com", "password": "pw"},
+        )
+        token = resp.json()["token"]["access_token"]
+        headers = {"Authorization": f"Bearer {token}"}
+        # Warm the pool so process start-up is not measured
+        await client.post(
+            "/api/v1/auth/login", json={"email": "bench@example.com", "password": "pw"}
+        )
+
+        gate = asyncio.Semaphore(concurrency)
+
+        async def login() -> float:
+            async with gate:
+                return await timed(
+                    client.post(
+                        "/api/v1/auth/login",
+                        json={"email": "bench@example.com", "password": "pw"},
+                    )
+                )
+
+        async def me() -> float:
+            return await timed(client.get("/api/v1/users/me", headers=headers))
+
+        login_tasks = [asyncio.create_task(login()) for _ in range(logins)]
+        me_samples = []
+        while not all(t.done() for t in login_tasks):
+            me_samples.append(await me())
+            await asyncio.sleep(0.005)
+        login_samples = await asyncio.gather(*login_tasks)
+
+    password_hasher.shutdown()
+    return {"login": list(login_samples), "users/me": me_samples}
+
+
+def report(label: str, results: dict[str, list[float]]) -> None:
+    for name, samples in results.items():
+        print(
+            f"{label:<14} {name:<9} n={len(samples):<5} "
+            f"p50={statistics.median(samples):8.1f}ms "
+            f"p99={percentile(samples, 99):8.1f}ms"
+        )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--logins", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--workers", type=int, default=settings.password_hash_workers)
+    args = parser.parse_args()
+
+    report("threadpool", asyncio.run(run(0, args.logins, args.concurrency)))
+    report(
+        f"pool({args.workers})",
+        asyncio.run(run(args.workers, args.logins, args.concurrency)),
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
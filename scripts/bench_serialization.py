@@ -0,0 +1,127 @@
+"""
+Benchmark list serialization: ORM + Pydantic response_model vs Core rows + orjson.
+
+Seeds one project with --tasks tasks in an in-memory SQLite database and, for
+each path, times query + encoding of the whole list and reports rows/sec:
+
+  orm+pydantic   select(Task) -> Task objects -> validate as list[TaskOut]
+                 -> jsonable_encoder -> json.dumps (what FastAPI does for a
+                 response_model)
+  core+orjson    select(columns) -> row tuples -> orjson (app.utils.fast_json)
+
+Usage: python scripts/bench_serialization.py [--tasks 20000] [--repeat 5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from datetime import date, datetime, timedelta
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+import app.models  # registers every table on Base.metadata
+from app.database import Base
+from app.models.organization import Organization
+from app.models.project import Project
+from app.models.task import Task, TaskPriority, TaskStatus
+from app.repositories.task_repository import TaskRepository
+from app.schemas.task import TaskOut
+from app.utils.fast_json import model_fields, row_encoder
+
+PROJECT_ID = 1
+
+engine = create_engine(
+    "sqlite:///:memory:",
+    connect_args={"check_same_thread": False},
+    poolclass=StaticPool,
+)
+BenchSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+def seed(tasks: int) -> None:
+    Base.metadata.create_all(bind=engine)
+    now = datetime.utcnow()
+    statuses, priorities = list(TaskStatus), list(TaskPriority)
+    with engine.begin() as conn:
+        conn.execute(insert(Organization), [{"id": 1, "name": "Bench"}])
+        conn.execute(insert(Project), [{"id": PROJECT_ID, "org_id": 1, "name": "P"}])
+        conn.execute(
+            insert(Task),
+            [
+                {
+                    "project_id": PROJECT_ID,
+                    "title": f"Task {i}",
+                    "description": "Lorem ipsum dolor sit amet. " * 8,
+                    "status": statuses[i % 3],
+                    "priority": priorities[i % 3],
+                    "due_date": date.today() + timedelta(days=i % 30)
+                    if i % 4
+                    else None,
+                    "created_at": now,
+                    "updated_at": now,
+                }
+                for i in range(tasks)
+            ],
+        )
+
+
+def orm_pydantic() -> bytes:
+    adapter = TypeAdapter(list[TaskOut])
+    with BenchSessionLocal() as db:
+        tasks = TaskRepository.list_by_project(db, PROJECT_ID)
+        models = adapter.validate_python(tasks, from_attributes=True)
+        return json.dumps(jsonable_encoder(models)).encode()
+
+
+def core_orjson() -> bytes:
+    columns = model_fields(TaskOut)
+    with BenchSessionLocal() as db:
+        rows = TaskRepository.list_by_project(db, PROJECT_ID, columns=columns)
+        return row_encoder(columns)(rows)
+
+
+def measure(fn, repeat: int) -> tuple[float, bytes]:
+    body = fn()  # warm-up, also returned for the equivalence check
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings), body
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tasks", type=int, default=20_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    seed(args.tasks)
+    slow, slow_body = measure(orm_pydantic, args.repeat)
+    fast, fast_body = measure(core_orjson, args.repeat)
+    if json.loads(slow_body) != json.loads(fast_body):
+        print("[bench] outputs differ!")
+        return 1
+
+    for label, seconds in [("orm+pydantic", slow), ("core+orjson", fast)]:
+        print(
+            f"{label:<13} {seconds * 1000:9.1f}ms  "
+            f"{args.tasks / seconds:12,.0f} rows/sec"
+        )
+    print(f"speedup       {slow / fast:9.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,131 @@
+"""
+Benchmark the status-count report: GROUP BY over tasks vs the counter row.
+
+Grows one project to each size in --sizes (default 10k, 100k and 1M tasks) in
+a scratch database and, at each size, times the old query (GROUP BY status
+over the project's tasks, using ix_tasks_project_status) against the
+project_task_stats primary-key read, reporting the median latency of each.
+
+The target database is dropped and recreated: never point it at real data.
+
+Usage: python scripts/bench_task_stats.py [--database-url postgresql://.../bench]
+                                          [--sizes 10000,100000,1000000]
+                                          [--repeat 20]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from sqlalchemy import create_engine, func, insert, select, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+import app.models  # registers every table on Base.metadata
+from app.database import Base
+from app.models.organization import Organization
+from app.models.project import Project
+from app.models.task import Task, TaskPriority, TaskStatus
+from app.repositories.project_task_stats_repository import \
+    ProjectTaskStatsRepository
+
+PROJECT_ID = 1
+CHUNK = 10_000
+
+
+def grow(engine: Engine, start: int, stop: int, rng: random.Random) -> None:
+    now = datetime.utcnow()
+    statuses, priorities = list(TaskStatus), list(TaskPriority)
+    with engine.begin() as conn:
+        for offset in range(start, stop, CHUNK):
+            conn.execute(
+                insert(Task),
+                [
+                    {
+                        "project_id": PROJECT_ID,
+                        "title": f"Task {i}",
+                        "status": rng.choice(statuses),
+                        "priority": rng.choice(priorities),
+                        "created_at": now,
+                        "updated_at": now,
+                    }
+                    for i in range(offset, min(offset + CHUNK, stop))
+                ],
+            )
+    with Session(engine) as db:
+        ProjectTaskStatsRepository.rebuild(db, [PROJECT_ID])
+        db.commit()
+    with engine.begin() as conn:
+        conn.execute(text("ANALYZE"))
+
+
+def group_by(db: Session) -> dict:
+    rows = db.execute(
+        select(Task.status, func.count(Task.id))
+        .where(Task.project_id == PROJECT_ID)
+        .group_by(Task.status)
+    )
+    return {status.name: count for status, count in rows}
+
+
+def counters(db: Session) -> dict:
+    stats = ProjectTaskStatsRepository.get(db, PROJECT_ID)
+    return {status.name: getattr(stats, status.name) for status in TaskStatus}
+
+
+def measure(engine: Engine, fn, repeat: int) -> tuple[float, dict]:
+    timings = []
+    with Session(engine) as db:
+        result = fn(db)  # warm-up, also returned for the equivalence check
+        for _ in range(repeat):
+            start = time.perf_counter()
+            fn(db)
+            timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings), result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--database-url")
+    parser.add_argument("--sizes", default="10000,100000,1000000")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    sizes = sorted(int(size) for size in args.sizes.split(","))
+
+    url = args.database_url
+    if url is None:
+        url = f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'bench_task_stats.db')}"
+    engine = create_engine(url)
+    print(f"[bench] database: {engine.url.render_as_string(hide_password=True)}")
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        conn.execute(insert(Organization), [{"id": 1, "name": "Bench"}])
+        conn.execute(insert(Project), [{"id": PROJECT_ID, "org_id": 1, "name": "P"}])
+
+    rng = random.Random(42)
+    seeded = 0
+    print(f"{'tasks':>9}  {'group by':>10}  {'counters':>10}  speedup")
+    for size in sizes:
+        grow(engine, seeded, size, rng)
+        seeded = size
+        slow, slow_result = measure(engine, group_by, args.repeat)
+        fast, fast_result = measure(engine, counters, args.repeat)
+        if slow_result != fast_result:
+            print(f"[bench] counts differ at {size} tasks!")
+            return 1
+        print(f"{size:>9,}  {slow:>8.2f}ms  {fast:>8.3f}ms  {slow / fast:7.0f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
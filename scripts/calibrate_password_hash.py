@@ -0,0 +1,106 @@
+"""
+Calibrate password hashing cost against a target verify latency on this host.
+
+Benchmarks bcrypt rounds and (if argon2-cffi is installed) argon2 parameters,
+then recommends the most expensive setting whose median verify time stays
+within the target. Put the printed values in `.env`; existing hashes are
+upgraded transparently on each user's next successful login.
+
+Usage: python scripts/calibrate_password_hash.py [--target-ms 250] [--samples 5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from passlib.exc import MissingBackendError
+
+from app.utils.security import build_pwd_context
+
+BCRYPT_ROUNDS = range(10, 16)
+# (time_cost, memory_cost KiB, parallelism)
+ARGON2_PARAMS = [
+    (2, 19456, 1),
+    (2, 65536, 4),
+    (3, 65536, 4),
+    (4, 65536, 4),
+    (3, 131072, 4),
+    (4, 262144, 4),
+]
+
+
+def median_verify_ms(context, samples: int) -> float:
+    stored = context.hash("calibration-password")
+    timings = []
+    for _ in range(samples):
+        start = time.perf_counter()
+        context.verify("calibration-password", stored)
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def candidates():
+    for rounds in BCRYPT_ROUNDS:
+        yield (
+            f"bcrypt rounds={rounds}",
+            {"PASSWORD_HASH_SCHEME": "bcrypt", "BCRYPT_ROUNDS": rounds},
+            build_pwd_context(scheme="bcrypt", bcrypt_rounds=rounds),
+        )
+    for time_cost, memory_cost, parallelism in ARGON2_PARAMS:
+        yield (
+            f"argon2 t={time_cost} m={memory_cost} p={parallelism}",
+            {
+                "PASSWORD_HASH_SCHEME": "argon2",
+                "ARGON2_TIME_COST": time_cost,
+                "ARGON2_MEMORY_COST": memory_cost,
+                "ARGON2_PARALLELISM": parallelism,
+            },
+            build_pwd_context(
+                scheme="argon2",
+                argon2_time_cost=time_cost,
+                argon2_memory_cost=memory_cost,
+                argon2_parallelism=parallelism,
+            ),
+        )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--target-ms", type=float, default=250.0)
+    parser.add_argument("--samples", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"[calibrate] target verify latency: {args.target_ms:.0f}ms")
+    best: dict[str, tuple[float, dict]] = {}
+    for label, env, context in candidates():
+        try:
+            ms = median_verify_ms(context, args.samples)
+        except MissingBackendError:
+            print(f"  {label:<32} skipped (backend not installed)")
+            continue
+        fits = ms <= args.target_ms
+        print(f"  {label:<32} {ms:9.1f}ms {'ok' if fits else 'over target'}")
+        scheme = env["PASSWORD_HASH_SCHEME"]
+        # Cost does not grow monotonically along the list (t=4 m=64MiB can
+        # take longer than t=3 m=128MiB), so keep the slowest one measured
+        if fits and (scheme not in best or ms > best[scheme][0]):
+            best[scheme] = (ms, env)
+
+    if not best:
+        print("[calibrate] nothing fits the target; raise --target-ms")
+        return 1
+    for scheme, (ms, env) in best.items():
+        print(f"\n[calibrate] recommended {scheme} ({ms:.1f}ms):")
+        for key, value in env.items():
+            print(f"{key}={value}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,46 @@
+"""
+Delete task tombstones older than the delta sync retention window.
+
+Tombstones tell delta sync clients which tasks were deleted. Those written
+more than --older-than-days ago are removed in batches of --batch-size, one
+transaction each; clients whose cursor predates them get 410 and do a full
+sync. Safe to run repeatedly (e.g. nightly from cron) and alongside the API.
+
+Usage: python scripts/prune_tombstones.py [--older-than-days 30] [--batch-size 500]
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from app.config import settings
+from app.database import SessionLocal
+from app.services.archive_service import ArchiveService
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--older-than-days",
+        type=int,
+        default=settings.task_tombstone_retention_days,
+    )
+    parser.add_argument("--batch-size", type=int, default=settings.archive_batch_size)
+    args = parser.parse_args()
+    logging.basicConfig(level=settings.log_level, format="[tombstones] %(message)s")
+
+    with SessionLocal() as db:
+        pruned = ArchiveService.prune_tombstones(
+            db, older_than_days=args.older_than_days, batch_size=args.batch_size
+        )
+    print(f"[tombstones] pruned {pruned} tombstones")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,50 @@
+"""
+Rebuild drifted per-project task counters (project_task_stats).
+
+Recounts every project's live and archived tasks in chunks of --chunk-size
+projects, one transaction each, and rewrites the counters that differ. Each
+chunk locks its project rows, which task writers also take, so it can run
+alongside the API. Prints the ids of projects whose counters had drifted.
+
+Usage: python scripts/reconcile_task_stats.py [--chunk-size 200]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from sqlalchemy import select
+
+from app.database import SessionLocal
+from app.models.project import Project
+from app.repositories.project_task_stats_repository import \
+    ProjectTaskStatsRepository
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--chunk-size", type=int, default=200)
+    args = parser.parse_args()
+
+    drifted: list[int] = []
+    with SessionLocal() as db:
+        project_ids = list(
+            db.execute(select(Project.id).order_by(Project.id)).scalars()
+        )
+        db.rollback()
+        for start in range(0, len(project_ids), args.chunk_size):
+            chunk = project_ids[start : start + args.chunk_size]
+            drifted += ProjectTaskStatsRepository.rebuild(db, chunk)
+            db.commit()
+    print(f"[reconcile] checked {len(project_ids)} projects, fixed {len(drifted)}")
+    if drifted:
+        print(f"[reconcile] drifted: {', '.join(map(str, drifted))}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,52 @@
+"""
+Write one day's per-project task aggregates for the burndown/throughput reports.
+
+For every project, stores the number of tasks created and completed during
+--day (a UTC date, default yesterday) in project_daily_stats, --chunk-size
+projects per transaction. For yesterday it also stores the status and
+priority counts as of the run; older days (backfills) keep the counts they
+have. Run it daily just after midnight UTC (e.g. from cron); re-running a day
+overwrites what it writes.
+
+Usage: python scripts/snapshot_task_stats.py [--day 2026-01-31] [--chunk-size 500]
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+import sys
+from datetime import date, datetime, timedelta, timezone
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from app.config import settings
+from app.database import SessionLocal
+from app.services.snapshot_service import SnapshotService
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--day",
+        type=date.fromisoformat,
+        default=datetime.now(timezone.utc).date() - timedelta(days=1),
+    )
+    parser.add_argument("--chunk-size", type=int, default=500)
+    args = parser.parse_args()
+    logging.basicConfig(level=settings.log_level, format="[snapshot] %(message)s")
+
+    with SessionLocal() as db:
+        try:
+            projects = SnapshotService.snapshot_day(
+                db, args.day, chunk_size=args.chunk_size
+            )
+        except ValueError as e:
+            parser.error(str(e))
+    print(f"[snapshot] {args.day}: wrote {projects} projects")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
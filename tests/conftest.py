@@ -2,16 +2,23 @@ import os
 import sys
 
 import pytest_asyncio
+from fastapi import Request
 from httpx import AsyncClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
-from app.database import Base, get_db
+from app.config import settings
+from app.core import token_revocation
+from app.core.cache import reset_caches
+from app.database import Base, get_db, request_session
 from app.main import app
 
+# Keep tests hermetic: caches use the in-process tier only
+settings.redis_cache_enabled = False
+
 # DB setup
 SQLALCHEMY_DATABASE_URL = "sqlite:///:memory:"
 engine = create_engine(
@@ -19,16 +26,14 @@ engine = create_engine(
     connect_args={"check_same_thread": False},
     poolclass=StaticPool,
 )
-TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+TestingSessionLocal = sessionmaker(
+    autocommit=False, autoflush=False, expire_on_commit=False, bind=engine
+)
 Base.metadata.create_all(bind=engine)
 
 
-def override_get_db():
-    db = TestingSessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
+def override_get_db(request: Request):
+    yield from request_session(request, TestingSessionLocal)
 
 
 app.dependency_overrides[get_db] = override_get_db
@@ -42,6 +47,44 @@ async def client():
     # Reset DB before each test
     Base.metadata.drop_all(bind=engine)
     Base.metadata.create_all(bind=engine)
+    reset_caches()
+    token_revocation.reset()
 
     async with AsyncClient(app=app, base_url="http://test") as c:
         yield c
+
+
+@pytest_asyncio.fixture(scope="function")
+async def db_session(client):
+    """Direct DB access for assertions, sharing the client's fresh database."""
+    db = TestingSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+class QueryCounter:
+    """Counts SQL statements sent to the test engine while active."""
+
+    def __init__(self):
+        self.count = 0
+        self.statements: list[str] = []
+
+    def __call__(self, conn, cursor, statement, parameters, context, executemany):
+        self.count += 1
+        self.statements.append(statement)
+
+    def reset(self):
+        self.count = 0
+        self.statements.clear()
+
+
+@pytest_asyncio.fixture(scope="function")
+async def query_counter(client):
+    counter = QueryCounter()
+    event.listen(engine, "before_cursor_execute", counter)
+    try:
+        yield counter
+    finally:
+        event.remove(engine, "before_cursor_execute", counter)
@@ -0,0 +1,101 @@
+from datetime import datetime, timedelta
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import update
+
+from app.models.task import Task
+from app.services.archive_service import ArchiveService
+
+
+@pytest.mark.asyncio
+async def test_archive_done_tasks(client: AsyncClient, db_session):
+    resp = await client.post(
+        "/api/v1/auth/register",
+        json={
+            "org_name": "OrgArchive",
+            "email": "archiver@example.com",
+            "password": "password123",
+        },
+    )
+    headers = {"Authorization": f"Bearer {resp.json()['token']['access_token']}"}
+    resp = await client.post(
+        "/api/v1/projects", json={"name": "ArchiveProj"}, headers=headers
+    )
+    project_id = resp.json()["id"]
+    ids = {}
+    for name, status in [("old", "done"), ("recent", "done"), ("open", "todo")]:
+        resp = await client.post(
+            f"/api/v1/projects/{project_id}/tasks",
+            json={"title": name},
+            headers=headers,
+        )
+        ids[name] = resp.json()["id"]
+        if status == "done":
+            await client.patch(
+                f"/api/v1/tasks/{ids[name]}", json={"status": "done"}, headers=headers
+            )
+    old_id = ids["old"]
+    await client.post(
+        f"/api/v1/tasks/{old_id}/comments", json={"content": "shipped"}, headers=headers
+    )
+    await client.post(
+        f"/api/v1/tasks/{old_id}/attachments",
+        files={"file": ("notes.txt", b"notes", "text/plain")},
+        headers=headers,
+    )
+    # Only "old" has been done long enough; "open" is old but not done
+    long_ago = datetime.utcnow() - timedelta(days=100)
+    db_session.execute(
+        update(Task)
+        .where(Task.id.in_([ids["old"], ids["open"]]))
+        .values(updated_at=long_ago)
+    )
+    db_session.commit()
+    changes_url = f"/api/v1/projects/{project_id}/tasks/changes"
+    cursor = (await client.get(changes_url, headers=headers)).json()["cursor"]
+
+    moved = ArchiveService.archive_done_tasks(
+        db_session, older_than_days=90, batch_size=1
+    )
+    assert moved == 1
+    assert (
+        ArchiveService.archive_done_tasks(db_session, older_than_days=90, batch_size=1)
+        == 0
+    )
+
+    # Delta sync clients are told to drop the archived task
+    resp = await client.get(changes_url, params={"since": cursor}, headers=headers)
+    assert resp.json()["tasks"] == []
+    assert resp.json()["deleted"] == [old_id]
+
+    url = f"/api/v1/projects/{project_id}/tasks"
+    resp = await client.get(url, headers=headers)
+    assert [t["id"] for t in resp.json()] == [ids["recent"], ids["open"]]
+    resp = await client.get(
+        url, params={"include_archived": "true", "limit": 2}, headers=headers
+    )
+    assert [t["id"] for t in resp.json()] == [ids["old"], ids["recent"]]
+    resp = await client.get(
+        url,
+        params={"include_archived": "true", "cursor": resp.headers["x-next-cursor"]},
+        headers=headers,
+    )
+    assert [t["id"] for t in resp.json()] == [ids["open"]]
+
+    task_url = f"/api/v1/tasks/{old_id}"
+    assert (await client.get(task_url, headers=headers)).status_code == 404
+    params = {"include_archived": "true"}
+    resp = await client.get(task_url, params=params, headers=headers)
+    assert resp.status_code == 200
+    assert resp.json()["title"] == "old" and resp.json()["status"] == "done"
+    resp = await client.get(f"{task_url}/comments", params=params, headers=headers)
+    assert [c["content"] for c in resp.json()] == ["shipped"]
+    resp = await client.get(f"{task_url}/attachments", params=params, headers=headers)
+    assert [a["file_name"] for a in resp.json()] == ["notes.txt"]
+
+    # Archived tasks still count in the project report
+    resp = await client.get(
+        f"/api/v1/projects/{project_id}/report/status-count", headers=headers
+    )
+    assert resp.json()["done"] == 2
@@ -1,5 +1,8 @@
+from datetime import datetime
+
 import pytest
 from httpx import AsyncClient
+from sqlalchemy import select
 
 
 @pytest.mark.asyncio
@@ -74,3 +77,182 @@ async def test_login_invalid_password(client: AsyncClient):
         json={"email": "wrongpass@example.com", "password": "wrongpassword"},
     )
     assert resp.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_login_rejected_when_hash_queue_full(client: AsyncClient, monkeypatch):
+    from app.services.password_hasher import password_hasher
+
+    await client.post(
+        "/api/v1/auth/register",
+        json={
+            "org_name": "BusyOrg",
+            "email": "busy@example.com",
+            "password": "password123",
+        },
+    )
+    # Simulate a saturated pool: every worker and queue slot is taken
+    monkeypatch.setattr(
+        password_hasher,
+        "_in_flight",
+        password_hasher.workers + password_hasher.queue_depth,
+    )
+    resp = await client.post(
+        "/api/v1/auth/login",
+        json={"email": "busy@example.com", "password": "password123"},
+    )
+    assert resp.status_code == 429
+    assert resp.headers["retry-after"] == "1"
+
+
+@pytest.mark.asyncio
+async def test_password_hasher_replaces_a_broken_pool(monkeypatch):
+    from concurrent.futures import Future
+    from concurrent.futures.process import BrokenProcessPool
+
+    from app.services import password_hasher as module
+
+    pools: list = []
+
+    class FakePool:
+        """First pool has lost a worker; later ones run the call inline."""
+
+        def __init__(self, **kwargs):
+            self.broken = not pools
+            self.shut_down = False
+            pools.append(self)
+
+        def submit(self, fn, *args):
+            future: Future = Future()
+            if self.broken:
+                future.set_exception(BrokenProcessPool("worker died"))
+            else:
+                future.set_result(fn(*args))
+            return future
+
+        def shutdown(self, wait=True, cancel_futures=False):
+            self.shut_down = True
+
+    monkeypatch.setattr(module, "ProcessPoolExecutor", FakePool)
+    monkeypatch.setattr(module, "hash_password", lambda password: f"hashed:{password}")
+    hasher = module.PasswordHasher(workers=1, queue_depth=1)
+
+    assert await hasher.hash("pw") == "hashed:pw"
+    assert len(pools) == 2
+    assert pools[0].shut_down
+    # The replacement pool is kept for later calls
+    assert await hasher.hash("pw2") == "hashed:pw2"
+    assert len(pools) == 2
+
+
+@pytest.mark.asyncio
+async def test_refresh_rotates_and_detects_reuse(client: AsyncClient):
+    await client.post(
+        "/api/v1/auth/register",
+        json={
+            "org_name": "RefreshOrg",
+            "email": "refresh@example.com",
+            "password": "password123",
+        },
+    )
+    resp = await client.post(
+        "/api/v1/auth/login",
+        json={"email": "refresh@example.com", "password": "password123"},
+    )
+    first = resp.json()["refresh_token"]
+    assert first
+
+    # Rotation: a new pair is issued and the old refresh token is spent
+    resp = await client.post("/api/v1/auth/refresh", json={"refresh_token": first})
+    assert resp.status_code == 200
+    second = resp.json()["refresh_token"]
+    assert second != first
+    resp_me = await client.get(
+        "/api/v1/users/me",
+        headers={"Authorization": f"Bearer {resp.json()['access_token']}"},
+    )
+    assert resp_me.status_code == 200
+
+    # Replaying the spent token revokes the whole family, including `second`
+    resp = await client.post("/api/v1/auth/refresh", json={"refresh_token": first})
+    assert resp.status_code == 401
+    resp = await client.post("/api/v1/auth/refresh", json={"refresh_token": second})
+    assert resp.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_refresh_losing_a_concurrent_rotation_revokes_family(
+    client: AsyncClient, db_session, monkeypatch
+):
+    from app.models.refresh_token import RefreshToken
+    from app.repositories.refresh_token_repository import RefreshTokenRepository
+
+    await client.post(
+        "/api/v1/auth/register",
+        json={
+            "org_name": "RaceOrg",
+            "email": "race@example.com",
+            "password": "password123",
+        },
+    )
+    resp = await client.post(
+        "/api/v1/auth/login",
+        json={"email": "race@example.com", "password": "password123"},
+    )
+    first = resp.json()["refresh_token"]
+    resp = await client.post("/api/v1/auth/refresh", json={"refresh_token": first})
+    second = resp.json()["refresh_token"]
+
+    # Another request rotates `second` between this one's lookup and its claim:
+    # the lookup still sees a live token, but the claim must lose
+    get_with_user = RefreshTokenRepository.get_with_user
+
+    def lookup_then_lose_race(db, token_hash):
+        found = get_with_user(db, token_hash)
+        assert found[0].revoked_at is None
+        assert RefreshTokenRepository.claim(db, found[0].id, datetime.utcnow())
+        return found
+
+    monkeypatch.setattr(RefreshTokenRepository, "get_with_user", lookup_then_lose_race)
+    resp = await client.post("/api/v1/auth/refresh", json={"refresh_token": second})
+    assert resp.status_code == 401
+
+    # Treated as reuse: the whole family is revoked
+    live = db_session.scalars(
+        select(RefreshToken).where(RefreshToken.revoked_at.is_(None))
+    ).all()
+    assert live == []
+
+
+@pytest.mark.asyncio
+async def test_refresh_invalid_token(client: AsyncClient):
+    resp = await client.post("/api/v1/auth/refresh", json={"refresh_token": "nope"})
+    assert resp.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_login_upgrades_outdated_hash(client: AsyncClient, db_session):
+    from app.config import settings
+    from app.models.user import User
+    from app.utils.security import build_pwd_context
+
+    await client.post(
+        "/api/v1/auth/register",
+        json={
+            "org_name": "RehashOrg",
+            "email": "rehash@example.com",
+            "password": "password123",
+        },
+    )
+    user = db_session.query(User).filter(User.email == "rehash@example.com").one()
+    user.password_hash = build_pwd_context(bcrypt_rounds=4).hash("password123")
+    db_session.commit()
+
+    resp = await client.post(
+        "/api/v1/auth/login",
+        json={"email": "rehash@example.com", "password": "password123"},
+    )
+    assert resp.status_code == 200
+
+    db_session.refresh(user)
+    assert user.password_hash.startswith(f"$2b${settings.bcrypt_rounds:02d}$")
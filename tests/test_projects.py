@@ -141,3 +141,182 @@ async def test_list_project_members(client: AsyncClient):
     assert resp_list.status_code == 200
     members = resp_list.json()
     assert any(m["email"] == "memberlist@example.com" for m in members)
+
+
+@pytest.mark.asyncio
+async def test_membership_memo_and_invalidation(client: AsyncClient, db_session):
+    from app.core.cache import get_stats
+    from app.repositories.project_member_repository import ProjectMemberRepository
+
+    token, admin_id = await register_and_login(
+        client, "memo@example.com", org_name="OrgMemo"
+    )
+    headers = {"Authorization": f"Bearer {token}"}
+    p1 = await client.post("/api/v1/projects", json={"name": "P1"}, headers=headers)
+    p2 = await client.post("/api/v1/projects", json={"name": "P2"}, headers=headers)
+    p1_id, p2_id = p1.json()["id"], p2.json()["id"]
+    resp_user = await client.post(
+        "/api/v1/users",
+        json={"email": "memo-member@example.com", "password": "password123"},
+        headers=headers,
+    )
+    member_id = resp_user.json()["id"]
+
+    stats = get_stats("membership")
+    stats.hits = stats.misses = 0
+    members = ProjectMemberRepository.members_of(db_session, [p1_id, p2_id])
+    assert members == {p1_id: {admin_id}, p2_id: {admin_id}}
+    assert stats.misses == 2
+
+    # Repeated checks in the same session are answered from the memo
+    assert ProjectMemberRepository.is_member(db_session, p1_id, admin_id)
+    assert not ProjectMemberRepository.is_member(db_session, p1_id, member_id)
+    assert stats.misses == 2
+    assert stats.hits == 2
+
+    ProjectMemberRepository.add_member(db_session, project_id=p1_id, user_id=member_id)
+    assert ProjectMemberRepository.is_member(db_session, p1_id, member_id)
+    assert stats.misses == 3
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.results: list = []
+
+    def smembers(self, key):
+        self.results.append(self.redis.sets.get(key, set()))
+
+    def execute(self):
+        return self.results
+
+
+class FakeRedis:
+    """Strings, sets and the membership cache's two scripts, run in Python."""
+
+    def __init__(self):
+        self.strings: dict[str, str] = {}
+        self.sets: dict[str, set[str]] = {}
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    def register_script(self, source):
+        from app.repositories import project_member_repository as repo
+
+        def store(keys, args, client=None):
+            if int(self.strings.get(keys[1], -1)) > int(args[0]):
+                return 0
+            self.sets[keys[0]] = {str(a) for a in args[2:]}
+            return 1
+
+        def invalidate(keys, args, client=None):
+            if int(args[0]) > int(self.strings.get(keys[1], -1)):
+                self.strings[keys[1]] = str(args[0])
+            self.sets.pop(keys[0], None)
+
+        return store if source == repo._STORE_SCRIPT else invalidate
+
+
+@pytest.mark.asyncio
+async def test_membership_cache_never_stores_a_superseded_set(
+    client: AsyncClient, db_session, monkeypatch
+):
+    from app.repositories import project_member_repository as repo
+    from app.repositories.project_member_repository import ProjectMemberRepository
+
+    fake = FakeRedis()
+    monkeypatch.setattr(repo, "redis_call", lambda op, default: op(fake))
+    token, admin_id = await register_and_login(
+        client, "gen@example.com", org_name="OrgGen"
+    )
+    headers = {"Authorization": f"Bearer {token}"}
+    resp = await client.post("/api/v1/projects", json={"name": "G"}, headers=headers)
+    project_id = resp.json()["id"]
+    resp_user = await client.post(
+        "/api/v1/users",
+        json={"email": "gen-member@example.com", "password": "password123"},
+        headers=headers,
+    )
+    member_id = resp_user.json()["id"]
+    key = f"project:{project_id}:members"
+
+    ProjectMemberRepository.members_of(db_session, [project_id])
+    assert fake.sets[key] == {"0", str(admin_id)}
+
+    # A committed change raises the generation and drops the cached set
+    resp = await client.post(
+        f"/api/v1/projects/{project_id}/members",
+        json={"user_ids": [member_id]},
+        headers=headers,
+    )
+    assert resp.status_code == 200
+    assert key not in fake.sets
+    generation = int(fake.strings[f"{key}:gen"])
+
+    # Another change commits between this load and its store: the set read
+    # at the older generation is not published
+    write_redis = repo._write_redis
+
+    def change_committed_meanwhile(sets):
+        fake.strings[f"{key}:gen"] = str(generation + 1)
+        write_redis(sets)
+
+    monkeypatch.setattr(repo, "_write_redis", change_committed_meanwhile)
+    db_session.info.clear()
+    ProjectMemberRepository.members_of(db_session, [project_id])
+    assert key not in fake.sets
+
+    # Once that change (here: the member's removal) has committed, sets read
+    # at its generation are stored again
+    monkeypatch.setattr(repo, "_write_redis", write_redis)
+    resp = await client.delete(
+        f"/api/v1/projects/{project_id}/members/{member_id}", headers=headers
+    )
+    assert resp.status_code == 204
+    assert int(fake.strings[f"{key}:gen"]) == generation + 1
+    db_session.info.clear()
+    ProjectMemberRepository.members_of(db_session, [project_id])
+    assert fake.sets[key] == {"0", str(admin_id)}
+
+
+@pytest.mark.asyncio
+async def test_bulk_add_members(client: AsyncClient, query_counter):
+    token, admin_id = await register_and_login(
+        client, "bulkadmin@example.com", org_name="OrgBulk"
+    )
+    headers = {"Authorization": f"Bearer {token}"}
+    resp_proj = await client.post(
+        "/api/v1/projects", json={"name": "BulkProj"}, headers=headers
+    )
+    project_id = resp_proj.json()["id"]
+    user_ids = []
+    for i in range(5):
+        resp_user = await client.post(
+            "/api/v1/users",
+            json={"email": f"bulk{i}@example.com", "password": "password123"},
+            headers=headers,
+        )
+        user_ids.append(resp_user.json()["id"])
+    _, other_id = await register_and_login(
+        client, "bulkother@example.com", org_name="OrgBulkOther"
+    )
+
+    query_counter.reset()
+    resp = await client.post(
+        f"/api/v1/projects/{project_id}/members",
+        # existing member, duplicates and a user from another org are skipped
+        json={"user_ids": [admin_id, *user_ids, user_ids[0], other_id]},
+        headers=headers,
+    )
+    assert resp.status_code == 200
+    assert [u["id"] for u in resp.json()] == user_ids
+    # project lookup, user validation, multi-row insert, member list ETag bump
+    assert query_counter.count == 4, query_counter.statements
+
+    resp = await client.post(
+        f"/api/v1/projects/{project_id}/members",
+        json={"user_ids": user_ids},
+        headers=headers,
+    )
+    assert resp.status_code == 400
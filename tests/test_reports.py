@@ -1,7 +1,17 @@
-from datetime import date
+import json
+from datetime import date, datetime, timedelta, timezone
 
 import pytest
 from httpx import AsyncClient
+from sqlalchemy import update
+
+from app.core import report_cache
+from app.models.project import Project
+from app.models.project_daily_stats import ProjectDailyStats
+from app.models.project_task_stats import ProjectTaskStats
+from app.models.task import Task
+from app.repositories.project_task_stats_repository import ProjectTaskStatsRepository
+from app.services.snapshot_service import SnapshotService
 
 
 async def setup_project_with_tasks(client: AsyncClient):
@@ -93,6 +103,12 @@ async def test_member_cannot_access_reports(client: AsyncClient):
     )
     assert resp_overdue.status_code == 403
 
+    resp_summary = await client.get(
+        "/api/v1/reports/org-summary",
+        headers={"Authorization": f"Bearer {member_token}"},
+    )
+    assert resp_summary.status_code == 403
+
 
 @pytest.mark.asyncio
 async def test_report_project_not_found(client: AsyncClient):
@@ -119,3 +135,410 @@ async def test_report_project_not_found(client: AsyncClient):
         headers={"Authorization": f"Bearer {admin_token}"},
     )
     assert resp_overdue.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_report_counters_follow_task_writes(
+    client: AsyncClient, db_session, query_counter
+):
+    admin_token, project_id = await setup_project_with_tasks(client)
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    status_url = f"/api/v1/projects/{project_id}/report/status-count"
+    priority_url = f"/api/v1/projects/{project_id}/report/priority-count"
+
+    # TaskCreate has no status, so both setup tasks start as todo
+    resp = await client.get(status_url, headers=headers)
+    assert resp.json() == {"todo": 2, "in_progress": 0, "done": 0}
+
+    resp = await client.post(
+        f"/api/v1/projects/{project_id}/tasks:batch",
+        json={"items": [{"title": "A", "priority": "high"}, {"title": "B"}]},
+        headers=headers,
+    )
+    a_id, b_id = [r["task"]["id"] for r in resp.json()["results"]]
+    await client.patch(
+        f"/api/v1/tasks/{a_id}", json={"status": "in-progress"}, headers=headers
+    )
+    await client.patch(
+        "/api/v1/tasks:batch",
+        json={"items": [{"id": b_id, "status": "done", "priority": "low"}]},
+        headers=headers,
+    )
+    await client.delete(f"/api/v1/tasks/{a_id}", headers=headers)
+
+    query_counter.reset()
+    resp = await client.get(status_url, headers=headers)
+    assert resp.json() == {"todo": 2, "in_progress": 0, "done": 1}
+    # Membership/project lookups aside, the counts are a single read
+    assert sum("project_task_stats" in s for s in query_counter.statements) == 1
+    assert not any("GROUP BY" in s for s in query_counter.statements)
+    resp = await client.get(priority_url, headers=headers)
+    assert resp.json() == {"low": 1, "medium": 2, "high": 0}
+
+    # A drifted row is put right by the reconciliation rebuild
+    db_session.execute(
+        update(ProjectTaskStats)
+        .where(ProjectTaskStats.project_id == project_id)
+        .values(todo=40, medium=0)
+    )
+    assert ProjectTaskStatsRepository.rebuild(db_session, [project_id]) == [project_id]
+    db_session.commit()
+    assert ProjectTaskStatsRepository.rebuild(db_session, [project_id]) == []
+    resp = await client.get(status_url, headers=headers)
+    assert resp.json() == {"todo": 2, "in_progress": 0, "done": 1}
+    resp = await client.get(priority_url, headers=headers)
+    assert resp.json() == {"low": 1, "medium": 2, "high": 0}
+
+
+class FakeRedis:
+    """Just enough of a Redis client (hashes, expiry, pipelines) for reports."""
+
+    def __init__(self):
+        self.hashes: dict[str, dict[str, str]] = {}
+        self.ttls: dict[str, int] = {}
+
+    def hget(self, key, field):
+        return self.hashes.get(key, {}).get(field)
+
+    def hset(self, key, field, value):
+        self.hashes.setdefault(key, {})[field] = value
+
+    def expire(self, key, seconds, nx=False):
+        if not (nx and key in self.ttls):
+            self.ttls[key] = seconds
+
+    def delete(self, *keys):
+        for key in keys:
+            self.hashes.pop(key, None)
+            self.ttls.pop(key, None)
+
+    def pipeline(self, transaction=True):
+        return self
+
+    def execute(self):
+        return []
+
+
+@pytest.mark.asyncio
+async def test_report_cache_invalidated_by_task_writes(
+    client: AsyncClient, db_session, monkeypatch
+):
+    fake = FakeRedis()
+    monkeypatch.setattr(report_cache, "redis_call", lambda op, default: op(fake))
+    admin_token, project_id = await setup_project_with_tasks(client)
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    status_url = f"/api/v1/projects/{project_id}/report/status-count"
+    overdue_url = f"/api/v1/projects/{project_id}/report/overdue-tasks"
+
+    async def stats():
+        return (await client.get("/metrics/cache")).json()["reports"]
+
+    resp = await client.get(status_url, headers=headers)
+    assert resp.json() == {"todo": 2, "in_progress": 0, "done": 0}
+    resp = await client.get(status_url, headers=headers)
+    assert resp.json() == {"todo": 2, "in_progress": 0, "done": 0}
+    assert await stats() == {"hits": 1, "misses": 1, "hit_ratio": 0.5}
+
+    # Overdue results are cached under today's date and expire by midnight
+    task_id = db_session.query(Task.id).filter_by(title="Task 1").scalar()
+    db_session.execute(
+        update(Task)
+        .where(Task.id == task_id)
+        .values(due_date=date.today() - timedelta(days=1))
+    )
+    db_session.commit()
+    resp = await client.get(overdue_url, headers=headers)
+    assert [t["id"] for t in resp.json()] == [task_id]
+    key = f"report:{project_id}"
+    task_seq = db_session.get(Project, project_id).task_seq
+    assert (
+        f"overdue_tasks:100:{date.today().isoformat()}:{task_seq}" in fake.hashes[key]
+    )
+    assert 0 < fake.ttls[key] <= 300
+    resp = await client.get(overdue_url, headers=headers)
+    assert resp.json()[0]["due_date"] == (date.today() - timedelta(days=1)).isoformat()
+    assert (await stats())["hits"] == 2
+
+    # A committed task write drops every cached report of the project
+    resp = await client.patch(
+        f"/api/v1/tasks/{task_id}", json={"status": "done"}, headers=headers
+    )
+    assert resp.status_code == 200
+    assert key not in fake.hashes
+    resp = await client.get(status_url, headers=headers)
+    assert resp.json() == {"todo": 1, "in_progress": 0, "done": 1}
+    resp = await client.get(overdue_url, headers=headers)
+    assert resp.json() == []
+    assert await stats() == {"hits": 2, "misses": 4, "hit_ratio": 0.3333}
+
+    # A rejected write leaves the cache alone
+    resp = await client.patch(
+        f"/api/v1/tasks/{task_id}", json={"status": "todo"}, headers=headers
+    )
+    assert resp.status_code >= 400
+    assert key in fake.hashes
+
+    # Results are keyed by the task counter: one stored by a reader that
+    # loaded before a write committed is never served after it, even if it
+    # lands after the invalidation; later fields do not extend the expiry
+    fake.ttls[key] = 1
+    stale = json.dumps({"todo": 9, "in_progress": 9, "done": 9})
+    fake.hset(key, f"status_count:{task_seq}", stale)
+    resp = await client.get(status_url, headers=headers)
+    assert resp.json() == {"todo": 1, "in_progress": 0, "done": 1}
+    assert fake.ttls[key] == 1
+
+
+@pytest.mark.asyncio
+async def test_org_summary_pages_projects_in_one_query(
+    client: AsyncClient, db_session, query_counter
+):
+    admin_token, first_id = await setup_project_with_tasks(client)
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    admin_id = (await client.get("/api/v1/users/me", headers=headers)).json()["id"]
+    ids = [first_id]
+    for name in ("Second", "Empty"):
+        resp = await client.post(
+            "/api/v1/projects", json={"name": name}, headers=headers
+        )
+        ids.append(resp.json()["id"])
+    for title, assignee_id in [("Mine", admin_id), ("Late", admin_id), ("Free", None)]:
+        await client.post(
+            f"/api/v1/projects/{ids[1]}/tasks",
+            json={"title": title, "assignee_id": assignee_id},
+            headers=headers,
+        )
+    db_session.execute(
+        update(Task)
+        .where(Task.title.in_(["Late", "Task 1"]))
+        .values(due_date=date.today() - timedelta(days=2))
+    )
+    db_session.commit()
+    # Another org's project never shows up
+    resp = await client.post(
+        "/api/v1/auth/register",
+        json={
+            "org_name": "OrgOther",
+            "email": "other@example.com",
+            "password": "password123",
+        },
+    )
+    other = {"Authorization": f"Bearer {resp.json()['token']['access_token']}"}
+    await client.post("/api/v1/projects", json={"name": "Theirs"}, headers=other)
+
+    url = "/api/v1/reports/org-summary"
+    await client.get(url, headers=headers)
+    query_counter.reset()
+    resp = await client.get(url, params={"limit": 2}, headers=headers)
+    assert resp.status_code == 200
+    assert query_counter.count == 1
+    assert resp.json() == [
+        {
+            "project_id": ids[0],
+            "name": "ReportProj",
+            "status_count": {"todo": 2, "in_progress": 0, "done": 0},
+            "overdue": 1,
+            "open_by_assignee": [{"assignee_id": None, "open": 2}],
+        },
+        {
+            "project_id": ids[1],
+            "name": "Second",
+            "status_count": {"todo": 3, "in_progress": 0, "done": 0},
+            "overdue": 1,
+            "open_by_assignee": [
+                {"assignee_id": admin_id, "open": 2},
+                {"assignee_id": None, "open": 1},
+            ],
+        },
+    ]
+
+    resp = await client.get(
+        url,
+        params={"limit": 2, "cursor": resp.headers["X-Next-Cursor"]},
+        headers=headers,
+    )
+    assert "X-Next-Cursor" not in resp.headers
+    assert resp.json() == [
+        {
+            "project_id": ids[2],
+            "name": "Empty",
+            "status_count": {"todo": 0, "in_progress": 0, "done": 0},
+            "overdue": 0,
+            "open_by_assignee": [],
+        }
+    ]
+
+    resp = await client.get(url, params={"cursor": "nope"}, headers=headers)
+    assert resp.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_overdue_tasks_paged_and_exported(client: AsyncClient, db_session):
+    admin_token, project_id = await setup_project_with_tasks(client)
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    resp = await client.post(
+        f"/api/v1/projects/{project_id}/tasks:batch",
+        json={"items": [{"title": f"Late {i}"} for i in range(4)]},
+        headers=headers,
+    )
+    late_ids = [r["task"]["id"] for r in resp.json()["results"]]
+    today = date.today()
+    # Two share a due date, so the id breaks the tie
+    for task_id, days in zip(late_ids, [3, 5, 3, 1]):
+        db_session.execute(
+            update(Task)
+            .where(Task.id == task_id)
+            .values(due_date=today - timedelta(days=days))
+        )
+    # Done or not yet due: not overdue
+    db_session.execute(
+        update(Task)
+        .where(Task.title == "Task 1")
+        .values(due_date=today - timedelta(days=9), status="done")
+    )
+    db_session.execute(
+        update(Task)
+        .where(Task.title == "Task 2")
+        .values(due_date=today + timedelta(days=1))
+    )
+    db_session.commit()
+    expected = [late_ids[1], late_ids[0], late_ids[2], late_ids[3]]
+
+    url = f"/api/v1/projects/{project_id}/report/overdue-tasks"
+    seen: list[int] = []
+    params: dict[str, int | str] = {"limit": 3}
+    while True:
+        resp = await client.get(url, params=params, headers=headers)
+        assert resp.status_code == 200
+        seen += [task["id"] for task in resp.json()]
+        if "X-Next-Cursor" not in resp.headers:
+            break
+        params["cursor"] = resp.headers["X-Next-Cursor"]
+    assert seen == expected
+    resp = await client.get(url, params={"cursor": "bogus"}, headers=headers)
+    assert resp.status_code == 400
+
+    resp = await client.get(url, params={"format": "csv"}, headers=headers)
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("text/csv")
+    lines = resp.text.splitlines()
+    assert lines[0] == "id,title,due_date,status"
+    assert [int(line.split(",")[0]) for line in lines[1:]] == expected
+    assert lines[1].endswith(f",{(today - timedelta(days=5)).isoformat()},todo")
+
+    resp = await client.get(url, params={"format": "ndjson"}, headers=headers)
+    assert resp.headers["content-type"] == "application/x-ndjson"
+    rows = [json.loads(line) for line in resp.text.splitlines()]
+    assert [row["id"] for row in rows] == expected
+    assert rows[0]["status"] == "todo"
+
+    resp = await client.get(url, params={"format": "xml"}, headers=headers)
+    assert resp.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_burndown_and_throughput_from_daily_snapshots(
+    client: AsyncClient, db_session
+):
+    admin_token, project_id = await setup_project_with_tasks(client)
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    resp = await client.post(
+        "/api/v1/projects", json={"name": "Other"}, headers=headers
+    )
+    other_id = resp.json()["id"]
+    task_ids = [
+        task["id"]
+        for task in (
+            await client.get(f"/api/v1/projects/{project_id}/tasks", headers=headers)
+        ).json()
+    ]
+    await client.patch(
+        f"/api/v1/tasks/{task_ids[0]}", json={"status": "done"}, headers=headers
+    )
+    today = datetime.now(timezone.utc).date()
+    yesterday = today - timedelta(days=1)
+    before = today - timedelta(days=2)
+    assert db_session.get(Task, task_ids[0]).completed_at is not None
+    assert db_session.get(Task, task_ids[1]).completed_at is None
+    # Both tasks were created yesterday and one was completed then
+    noon = datetime.combine(yesterday, datetime.min.time()) + timedelta(hours=12)
+    db_session.execute(
+        update(Task).where(Task.id.in_(task_ids)).values(created_at=noon)
+    )
+    db_session.execute(
+        update(Task).where(Task.id == task_ids[0]).values(completed_at=noon)
+    )
+    # The day before was snapshotted when it ended
+    db_session.add(
+        ProjectDailyStats(
+            project_id=project_id,
+            day=before,
+            todo=2,
+            in_progress=0,
+            done=0,
+            low=0,
+            medium=2,
+            high=0,
+            created=0,
+            completed=0,
+        )
+    )
+    db_session.commit()
+
+    assert SnapshotService.snapshot_day(db_session, yesterday, chunk_size=1) == 2
+    # A backfill of an older day rewrites created/completed but keeps the
+    # counts taken when that day ended
+    assert SnapshotService.snapshot_day(db_session, before, chunk_size=1) == 2
+    with pytest.raises(ValueError):
+        SnapshotService.snapshot_day(db_session, today, chunk_size=1)
+    # Re-running the day that just ended overwrites its rows
+    await client.patch(
+        "/api/v1/tasks:batch",
+        json={"items": [{"id": task_ids[1], "status": "in-progress"}]},
+        headers=headers,
+    )
+    SnapshotService.snapshot_day(db_session, yesterday, chunk_size=10)
+
+    url = f"/api/v1/projects/{project_id}/report"
+    params = {"start": (today - timedelta(days=5)).isoformat()}
+    resp = await client.get(f"{url}/burndown", params=params, headers=headers)
+    assert resp.status_code == 200
+    assert resp.json() == [
+        {
+            "day": before.isoformat(),
+            "todo": 2,
+            "in_progress": 0,
+            "done": 0,
+            "remaining": 2,
+        },
+        {
+            "day": yesterday.isoformat(),
+            "todo": 0,
+            "in_progress": 1,
+            "done": 1,
+            "remaining": 1,
+        },
+    ]
+    resp = await client.get(f"{url}/throughput", params=params, headers=headers)
+    assert resp.json() == [
+        {"day": before.isoformat(), "created": 0, "completed": 0},
+        {"day": yesterday.isoformat(), "created": 2, "completed": 1},
+    ]
+    # A backfilled day without a snapshot has throughput but no burndown point
+    resp = await client.get(
+        f"/api/v1/projects/{other_id}/report/burndown", params=params, headers=headers
+    )
+    assert [point["day"] for point in resp.json()] == [yesterday.isoformat()]
+
+    resp = await client.get(
+        f"{url}/throughput",
+        params={"start": today.isoformat(), "end": yesterday.isoformat()},
+        headers=headers,
+    )
+    assert resp.status_code == 400
+    resp = await client.get(
+        f"{url}/burndown",
+        params={"start": (today - timedelta(days=400)).isoformat()},
+        headers=headers,
+    )
+    assert resp.status_code == 400
@@ -1,3 +1,5 @@
+from datetime import date, timedelta
+
 import pytest
 from httpx import AsyncClient
 
@@ -131,3 +133,824 @@ async def test_update_status_forward_and_backward(client: AsyncClient):
         headers={"Authorization": f"Bearer {token}"},
     )
     assert resp_back.status_code == 400
+
+
+async def _task_scoped_setup(client: AsyncClient):
+    token, _ = await register_and_login(
+        client, "querycount@example.com", org_name="OrgQueries"
+    )
+    headers = {"Authorization": f"Bearer {token}"}
+    resp_proj = await client.post(
+        "/api/v1/projects", json={"name": "QueryProj"}, headers=headers
+    )
+    resp_task = await client.post(
+        f"/api/v1/projects/{resp_proj.json()['id']}/tasks",
+        json={"title": "Counted"},
+        headers=headers,
+    )
+    return headers, resp_task.json()["id"]
+
+
+@pytest.mark.asyncio
+async def test_task_scoped_endpoint_query_counts(client: AsyncClient, query_counter):
+    headers, task_id = await _task_scoped_setup(client)
+    # Authorization is one joined query (task + project + membership); the
+    # principal is already cached, so the rest is each endpoint's own work.
+    # Task writes also bump the project's task list ETag counter and stamp
+    # its new value on the task, both just before the commit. Writes are
+    # committed once per request, with nothing re-read after the commit.
+    expected = [
+        ("GET", f"/api/v1/tasks/{task_id}", None, 1),
+        ("PATCH", f"/api/v1/tasks/{task_id}", {"title": "Renamed"}, 4),
+        ("POST", f"/api/v1/tasks/{task_id}/comments", {"content": "hi"}, 2),
+        ("GET", f"/api/v1/tasks/{task_id}/comments", None, 2),
+        ("GET", f"/api/v1/tasks/{task_id}/attachments", None, 2),
+    ]
+    for method, url, body, queries in expected:
+        query_counter.reset()
+        resp = await client.request(method, url, json=body, headers=headers)
+        assert resp.status_code == 200, (method, url, resp.text)
+        assert query_counter.count == queries, (method, url, query_counter.statements)
+
+    query_counter.reset()
+    resp = await client.post(
+        f"/api/v1/tasks/{task_id}/attachments",
+        files={"file": ("note.txt", b"hello", "text/plain")},
+        headers=headers,
+    )
+    assert resp.status_code == 200
+    assert query_counter.count == 3, query_counter.statements
+
+
+@pytest.mark.asyncio
+async def test_list_tasks_keyset_pagination(client: AsyncClient):
+    token, _ = await register_and_login(
+        client, "pager@example.com", org_name="OrgPager"
+    )
+    headers = {"Authorization": f"Bearer {token}"}
+    resp_proj = await client.post(
+        "/api/v1/projects", json={"name": "PagerProj"}, headers=headers
+    )
+    project_id = resp_proj.json()["id"]
+    today = date.today()
+    specs = [
+        (3, "low"),
+        (None, "high"),
+        (1, "medium"),
+        (3, "high"),
+        (None, "low"),
+        (2, "medium"),
+        (1, "low"),
+    ]
+    for i, (days, priority) in enumerate(specs):
+        body = {"title": f"T{i}", "priority": priority}
+        if days is not None:
+            body["due_date"] = (today + timedelta(days=days)).isoformat()
+        await client.post(
+            f"/api/v1/projects/{project_id}/tasks", json=body, headers=headers
+        )
+
+    url = f"/api/v1/projects/{project_id}/tasks"
+    for sort in ["due_date", "priority", "created_at", "updated_at"]:
+        for order in ["asc", "desc"]:
+            params = {"sort": sort, "order": order}
+            full = await client.get(
+                url, params={**params, "limit": 500}, headers=headers
+            )
+            assert "x-next-cursor" not in full.headers
+            expected = [t["id"] for t in full.json()]
+
+            seen, cursor = [], None
+            while True:
+                page_params = {**params, "limit": 2}
+                if cursor:
+                    page_params["cursor"] = cursor
+                resp = await client.get(url, params=page_params, headers=headers)
+                assert resp.status_code == 200
+                assert len(resp.json()) <= 2
+                seen += [t["id"] for t in resp.json()]
+                cursor = resp.headers.get("x-next-cursor")
+                if not cursor:
+                    break
+            assert seen == expected, (sort, order)
+            assert len(seen) == len(specs)
+
+    # Due dates ascending, undated tasks last
+    resp = await client.get(url, params={"sort": "due_date"}, headers=headers)
+    due = [t["due_date"] for t in resp.json()]
+    assert due[-2:] == [None, None]
+    assert due[:-2] == sorted(due[:-2])
+
+
+@pytest.mark.asyncio
+async def test_list_tasks_rejects_bad_cursor(client: AsyncClient):
+    token, _ = await register_and_login(
+        client, "badcursor@example.com", org_name="OrgCursor"
+    )
+    headers = {"Authorization": f"Bearer {token}"}
+    resp_proj = await client.post(
+        "/api/v1/projects", json={"name": "CursorProj"}, headers=headers
+    )
+    project_id = resp_proj.json()["id"]
+    for i in range(2):
+        await client.post(
+            f"/api/v1/projects/{project_id}/tasks",
+            json={"title": f"C{i}"},
+            headers=headers,
+        )
+    url = f"/api/v1/projects/{project_id}/tasks"
+    resp = await client.get(url, params={"limit": 1}, headers=headers)
+    cursor = resp.headers["x-next-cursor"]
+
+    resp = await client.get(url, params={"cursor": "not-a-cursor"}, headers=headers)
+    assert resp.status_code == 400
+    # A cursor is only valid for the sort it was issued for
+    resp = await client.get(
+        url, params={"cursor": cursor, "sort": "due_date"}, headers=headers
+    )
+    assert resp.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_search_tasks_ranked_and_paged(client: AsyncClient):
+    token, _ = await register_and_login(
+        client, "search@example.com", org_name="OrgSearch"
+    )
+    headers = {"Authorization": f"Bearer {token}"}
+    project_ids = []
+    for name in ["SearchA", "SearchB"]:
+        resp = await client.post(
+            "/api/v1/projects", json={"name": name}, headers=headers
+        )
+        project_ids.append(resp.json()["id"])
+
+    async def make(project_id, title, description=None):
+        resp = await client.post(
+            f"/api/v1/projects/{project_id}/tasks",
+            json={"title": title, "description": description},
+            headers=headers,
+        )
+        return resp.json()["id"]
+
+    in_description = await make(project_ids[0], "Cleanup", "the login page is slow")
+    in_title = await make(project_ids[0], "Fix login redirect")
+    await make(project_ids[0], "Unrelated")
+    other_project = await make(project_ids[1], "Login audit")
+
+    # Another org's matching task is never visible
+    other_token, _ = await register_and_login(
+        client, "search2@example.com", org_name="OrgSearch2"
+    )
+    other_headers = {"Authorization": f"Bearer {other_token}"}
+    resp = await client.post(
+        "/api/v1/projects", json={"name": "Elsewhere"}, headers=other_headers
+    )
+    await client.post(
+        f"/api/v1/projects/{resp.json()['id']}/tasks",
+        json={"title": "login elsewhere"},
+        headers=other_headers,
+    )
+
+    resp = await client.get(
+        f"/api/v1/projects/{project_ids[0]}/tasks/search",
+        params={"q": "login"},
+        headers=headers,
+    )
+    assert resp.status_code == 200
+    # Title matches rank above description matches
+    assert [t["id"] for t in resp.json()] == [in_title, in_description]
+
+    seen, cursor = [], None
+    while True:
+        params = {"q": "login", "limit": 1}
+        if cursor:
+            params["cursor"] = cursor
+        resp = await client.get("/api/v1/tasks/search", params=params, headers=headers)
+        assert resp.status_code == 200
+        seen += [t["id"] for t in resp.json()]
+        cursor = resp.headers.get("x-next-cursor")
+        if not cursor:
+            break
+    assert sorted(seen) == sorted([in_description, in_title, other_project])
+    assert seen[-1] == in_description
+
+    resp = await client.get(
+        "/api/v1/tasks/search",
+        params={"q": "other", "cursor": cursor or "x"},
+        headers=headers,
+    )
+    assert resp.status_code == 400
+    resp = await client.get("/api/v1/tasks/search", params={"q": "  "}, headers=headers)
+    assert resp.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_batch_create_and_update_tasks(client: AsyncClient, db_session):
+    from app.models.notification import Notification
+
+    token, _ = await register_and_login(
+        client, "batch@example.com", org_name="OrgBatch"
+    )
+    headers = {"Authorization": f"Bearer {token}"}
+    resp_proj = await client.post(
+        "/api/v1/projects", json={"name": "BatchProj"}, headers=headers
+    )
+    project_id = resp_proj.json()["id"]
+    resp_user = await client.post(
+        "/api/v1/users",
+        json={"email": "batchee@example.com", "password": "pw123456", "role": "member"},
+        headers=headers,
+    )
+    member_id = resp_user.json()["id"]
+    url = f"/api/v1/projects/{project_id}/tasks:batch"
+
+    # One bad item rejects the whole batch with per-item errors
+    yesterday = (date.today() - timedelta(days=1)).isoformat()
+    resp = await client.post(
+        url,
+        json={
+            "items": [
+                {"title": "Ok"},
+                {"title": "Past", "due_date": yesterday},
+                {"title": "Ghost", "assignee_id": 999999},
+            ]
+        },
+        headers=headers,
+    )
+    assert resp.status_code == 422
+    body = resp.json()
+    assert body["applied"] is False
+    assert [r["ok"] for r in body["results"]] == [True, False, False]
+    assert "past" in body["results"][1]["error"]
+    assert body["results"][2]["error"] == "Assignee not found"
+    resp = await client.get(f"/api/v1/projects/{project_id}/tasks", headers=headers)
+    assert resp.json() == []
+
+    resp = await client.post(
+        url,
+        json={
+            "items": [
+                {"title": "First", "assignee_id": member_id},
+                {"title": "Second", "priority": "high"},
+                {"title": "Third", "assignee_id": member_id},
+            ]
+        },
+        headers=headers,
+    )
+    assert resp.status_code == 200
+    results = resp.json()["results"]
+    assert [r["task"]["title"] for r in results] == ["First", "Second", "Third"]
+    ids = [r["task"]["id"] for r in results]
+    assert db_session.query(Notification).filter_by(user_id=member_id).count() == 2
+
+    resp = await client.patch(
+        "/api/v1/tasks:batch",
+        json={
+            "items": [
+                {"id": ids[0], "status": "in-progress"},
+                {"id": ids[1], "assignee_id": member_id, "title": "Second!"},
+            ]
+        },
+        headers=headers,
+    )
+    assert resp.status_code == 200
+    tasks = [r["task"] for r in resp.json()["results"]]
+    assert tasks[0]["status"] == "in-progress"
+    assert tasks[1]["title"] == "Second!"
+    assert tasks[1]["assignee_id"] == member_id
+    # One status change and one new assignment
+    assert db_session.query(Notification).filter_by(user_id=member_id).count() == 4
+
+    resp = await client.patch(
+        "/api/v1/tasks:batch",
+        json={
+            "items": [
+                {"id": ids[0], "status": "todo"},
+                {"id": ids[2], "status": "done"},
+                {"id": ids[2], "status": "done"},
+                {"id": 999999, "title": "x"},
+            ]
+        },
+        headers=headers,
+    )
+    assert resp.status_code == 422
+    errors = [r["error"] for r in resp.json()["results"]]
+    assert errors == [
+        "Status cannot move backward",
+        None,
+        "Task appears more than once in the batch",
+        "Task not found",
+    ]
+    resp = await client.get(f"/api/v1/tasks/{ids[2]}", headers=headers)
+    assert resp.json()["status"] == "todo"
+
+
+@pytest.mark.asyncio
+async def test_batch_update_is_one_compare_and_swap_statement(
+    client: AsyncClient, db_session, query_counter
+):
+    from sqlalchemy import update
+    from sqlalchemy.orm import Session
+
+    from app.models.task import Task
+    from app.repositories.task_repository import TaskRepository
+
+    token, _ = await register_and_login(
+        client, "batchcas@example.com", org_name="OrgBatchCas"
+    )
+    headers = {"Authorization": f"Bearer {token}"}
+    resp = await client.post("/api/v1/projects", json={"name": "Cas"}, headers=headers)
+    resp = await client.post(
+        f"/api/v1/projects/{resp.json()['id']}/tasks:batch",
+        json={"items": [{"title": "A"}, {"title": "B"}, {"title": "C"}]},
+        headers=headers,
+    )
+    ids = [r["task"]["id"] for r in resp.json()["results"]]
+
+    query_counter.reset()
+    resp = await client.patch(
+        "/api/v1/tasks:batch",
+        json={
+            "items": [
+                {"id": ids[0], "status": "done"},
+                {"id": ids[1], "title": "B!", "priority": "high"},
+                {"id": ids[2], "version": 1, "status": "in-progress"},
+            ]
+        },
+        headers=headers,
+    )
+    assert resp.status_code == 200
+    tasks = [r["task"] for r in resp.json()["results"]]
+    assert [t["version"] for t in tasks] == [2, 2, 2]
+    assert tasks[0]["status"] == "done"
+    assert (tasks[1]["title"], tasks[1]["priority"]) == ("B!", "high")
+    # Every task is written by one statement (plus the commit-time change_seq
+    # stamp), not one versioned UPDATE per row
+    writes = [
+        s
+        for s in query_counter.statements
+        if s.lstrip().startswith(("UPDATE tasks", "WITH batch"))
+        and "change_seq=" not in s.replace(" ", "")
+    ]
+    assert len(writes) == 1
+    assert db_session.get(Task, ids[0]).completed_at is not None
+
+    # A task modified after it was loaded fails the whole compare-and-swap
+    first, second = db_session.get(Task, ids[0]), db_session.get(Task, ids[1])
+    other_session = Session(bind=db_session.get_bind())
+    try:
+        other_session.execute(
+            update(Task).where(Task.id == ids[1]).values(version=Task.version + 1)
+        )
+        other_session.commit()
+    finally:
+        other_session.close()
+    first.title, second.title = "A?", "B?"
+    assert not TaskRepository.update_many(db_session, [first, second])
+    db_session.rollback()
+
+
+@pytest.mark.asyncio
+async def test_list_tasks_sparse_fieldset(client: AsyncClient, query_counter):
+    token, _ = await register_and_login(
+        client, "sparse@example.com", org_name="OrgSparse"
+    )
+    headers = {"Authorization": f"Bearer {token}"}
+    resp_proj = await client.post(
+        "/api/v1/projects", json={"name": "SparseProj"}, headers=headers
+    )
+    project_id = resp_proj.json()["id"]
+    for i in range(3):
+        await client.post(
+            f"/api/v1/projects/{project_id}/tasks",
+            json={"title": f"S{i}", "description": "long text " * 50},
+            headers=headers,
+        )
+    url = f"/api/v1/projects/{project_id}/tasks"
+
+    query_counter.reset()
+    resp = await client.get(
+        url,
+        params={"fields": "title,status", "limit": 2, "sort": "due_date"},
+        headers=headers,
+    )
+    assert resp.status_code == 200
+    assert [set(t) for t in resp.json()] == [{"id", "title", "status"}] * 2
+    assert resp.json()[0]["title"] == "S0"
+    cursor = resp.headers["x-next-cursor"]
+    # Only the requested columns (plus id and the sort key) are selected
+    listing = [s for s in query_counter.statements if "FROM tasks" in s][-1]
+    assert "description" not in listing.split("FROM")[0]
+
+    resp = await client.get(
+        url,
+        params={"fields": "title,status", "sort": "due_date", "cursor": cursor},
+        headers=headers,
+    )
+    assert [t["title"] for t in resp.json()] == ["S2"]
+
+    resp = await client.get(url, params={"fields": "title,secret"}, headers=headers)
+    assert resp.status_code == 400
+
+    resp = await client.get(
+        "/api/v1/projects", params={"fields": "name"}, headers=headers
+    )
+    assert resp.json() == [{"id": project_id, "name": "SparseProj"}]
+
+
+@pytest.mark.asyncio
+async def test_conditional_get_with_etags(client: AsyncClient, query_counter):
+    token, _ = await register_and_login(client, "etag@example.com", org_name="OrgEtag")
+    headers = {"Authorization": f"Bearer {token}"}
+    resp_proj = await client.post(
+        "/api/v1/projects", json={"name": "EtagProj"}, headers=headers
+    )
+    project_id = resp_proj.json()["id"]
+    resp = await client.post(
+        f"/api/v1/projects/{project_id}/tasks", json={"title": "E1"}, headers=headers
+    )
+    task_id = resp.json()["id"]
+    list_url = f"/api/v1/projects/{project_id}/tasks"
+
+    resp = await client.get(list_url, headers=headers)
+    etag = resp.headers["etag"]
+    assert resp.headers["cache-control"] == "private, no-cache"
+
+    query_counter.reset()
+    resp = await client.get(list_url, headers={**headers, "If-None-Match": etag})
+    assert resp.status_code == 304
+    assert resp.headers["etag"] == etag
+    assert query_counter.count == 1, query_counter.statements
+    assert "FROM tasks" not in query_counter.statements[0]
+
+    # Other query parameters are a different representation
+    resp = await client.get(
+        list_url, params={"limit": 5}, headers={**headers, "If-None-Match": etag}
+    )
+    assert resp.status_code == 200
+
+    resp = await client.get(f"/api/v1/tasks/{task_id}", headers=headers)
+    task_etag = resp.headers["etag"]
+    resp = await client.get(
+        f"/api/v1/tasks/{task_id}", headers={**headers, "If-None-Match": task_etag}
+    )
+    assert resp.status_code == 304
+
+    await client.patch(
+        f"/api/v1/tasks/{task_id}", json={"status": "in-progress"}, headers=headers
+    )
+    resp = await client.get(
+        f"/api/v1/tasks/{task_id}", headers={**headers, "If-None-Match": task_etag}
+    )
+    assert resp.status_code == 200
+    assert resp.json()["status"] == "in-progress"
+    resp = await client.get(list_url, headers={**headers, "If-None-Match": etag})
+    assert resp.status_code == 200
+    assert resp.headers["etag"] != etag
+
+    members_url = f"/api/v1/projects/{project_id}/members"
+    resp = await client.get(members_url, headers=headers)
+    members_etag = resp.headers["etag"]
+    resp = await client.get(
+        members_url, headers={**headers, "If-None-Match": members_etag}
+    )
+    assert resp.status_code == 304
+    resp_user = await client.post(
+        "/api/v1/users",
+        json={"email": "etag2@example.com", "password": "pw123456", "role": "member"},
+        headers=headers,
+    )
+    await client.post(
+        members_url, json={"user_ids": [resp_user.json()["id"]]}, headers=headers
+    )
+    resp = await client.get(
+        members_url, headers={**headers, "If-None-Match": members_etag}
+    )
+    assert resp.status_code == 200
+    assert len(resp.json()) == 2
+
+
+@pytest.mark.asyncio
+async def test_update_task_if_match(client: AsyncClient):
+    headers, task_id = await _task_scoped_setup(client)
+    url = f"/api/v1/tasks/{task_id}"
+
+    resp = await client.get(url, headers=headers)
+    assert resp.json()["version"] == 1
+    etag = resp.headers["etag"]
+
+    resp = await client.patch(
+        url, json={"title": "v2"}, headers={**headers, "If-Match": etag}
+    )
+    assert resp.status_code == 200
+    assert resp.json()["version"] == 2
+    new_etag = resp.headers["etag"]
+    assert new_etag != etag
+
+    # A writer holding the old ETag lost the race
+    resp = await client.patch(
+        url, json={"status": "done"}, headers={**headers, "If-Match": etag}
+    )
+    assert resp.status_code == 412
+    resp = await client.patch(
+        url, json={"status": "done"}, headers={**headers, "If-Match": f"W/{new_etag}"}
+    )
+    assert resp.status_code == 412
+    resp = await client.patch(
+        url, json={"status": "done"}, headers={**headers, "If-Match": new_etag}
+    )
+    assert resp.status_code == 200
+
+    resp = await client.patch(
+        "/api/v1/tasks:batch",
+        json={"items": [{"id": task_id, "version": 2, "title": "stale"}]},
+        headers=headers,
+    )
+    assert resp.status_code == 422
+    assert resp.json()["results"][0]["error"] == "Task has been modified"
+
+
+@pytest.mark.asyncio
+async def test_task_update_is_compare_and_swap(client: AsyncClient, db_session):
+    from sqlalchemy.orm import Session
+    from sqlalchemy.orm.exc import StaleDataError
+
+    from app.models.task import Task, TaskStatus
+
+    headers, task_id = await _task_scoped_setup(client)
+    # Two writers read the same version...
+    first = db_session.get(Task, task_id)
+    other_session = Session(bind=db_session.get_bind())
+    try:
+        second = other_session.get(Task, task_id)
+        first.status = TaskStatus.done
+        db_session.commit()
+        # ...so the second write matches no row instead of overwriting
+        second.status = TaskStatus.in_progress
+        with pytest.raises(StaleDataError):
+            other_session.commit()
+    finally:
+        other_session.close()
+    db_session.refresh(first)
+    assert first.status == TaskStatus.done
+    assert first.version == 2
+
+
+@pytest.mark.asyncio
+async def test_fast_list_encoding_matches_response_model(
+    client: AsyncClient, db_session
+):
+    import json
+
+    from pydantic import TypeAdapter
+
+    from app.models.task import Task
+    from app.repositories.task_repository import TaskRepository
+    from app.schemas.task import TaskOut
+    from app.utils.fast_json import model_fields, rows_response
+
+    headers, task_id = await _task_scoped_setup(client)
+    await client.patch(
+        f"/api/v1/tasks/{task_id}",
+        json={"status": "in-progress", "due_date": date.today().isoformat()},
+        headers=headers,
+    )
+    project_id = db_session.get(Task, task_id).project_id
+    await client.post(
+        f"/api/v1/projects/{project_id}/tasks",
+        json={"title": "No due date", "priority": "high"},
+        headers=headers,
+    )
+
+    columns = model_fields(TaskOut)
+    rows = TaskRepository.list_by_project(db_session, project_id, columns=columns)
+    objects = TaskRepository.list_by_project(db_session, project_id)
+    expected = TypeAdapter(list[TaskOut]).dump_json(
+        TypeAdapter(list[TaskOut]).validate_python(objects, from_attributes=True)
+    )
+    assert json.loads(rows_response(columns, rows).body) == json.loads(expected)
+
+
+@pytest.mark.asyncio
+async def test_task_delta_sync(client: AsyncClient):
+    token, _ = await register_and_login(
+        client, "deltasync@example.com", org_name="OrgDelta"
+    )
+    headers = {"Authorization": f"Bearer {token}"}
+    resp = await client.post("/api/v1/projects", json={"name": "Sync"}, headers=headers)
+    project_id = resp.json()["id"]
+    url = f"/api/v1/projects/{project_id}/tasks/changes"
+    ids = []
+    for i in range(3):
+        resp = await client.post(
+            f"/api/v1/projects/{project_id}/tasks",
+            json={"title": f"T{i}"},
+            headers=headers,
+        )
+        ids.append(resp.json()["id"])
+
+    # Full sync, paged
+    resp = await client.get(url, params={"limit": 2}, headers=headers)
+    body = resp.json()
+    assert resp.status_code == 200
+    assert [t["id"] for t in body["tasks"]] == ids[:2]
+    assert body["has_more"] is True and body["deleted"] == []
+    resp = await client.get(
+        url, params={"limit": 2, "since": body["cursor"]}, headers=headers
+    )
+    body = resp.json()
+    assert [t["id"] for t in body["tasks"]] == ids[2:]
+    assert body["has_more"] is False
+    cursor = body["cursor"]
+
+    # Nothing changed since the cursor
+    resp = await client.get(url, params={"since": cursor}, headers=headers)
+    assert resp.json()["tasks"] == [] and resp.json()["deleted"] == []
+    assert resp.json()["cursor"] == cursor
+
+    # One update and one delete come back as the delta
+    await client.patch(
+        f"/api/v1/tasks/{ids[0]}", json={"title": "T0b"}, headers=headers
+    )
+    resp = await client.delete(f"/api/v1/tasks/{ids[1]}", headers=headers)
+    assert resp.status_code == 204
+    resp = await client.get(f"/api/v1/tasks/{ids[1]}", headers=headers)
+    assert resp.status_code == 404
+    resp = await client.get(url, params={"since": cursor}, headers=headers)
+    body = resp.json()
+    assert [(t["id"], t["title"]) for t in body["tasks"]] == [(ids[0], "T0b")]
+    assert body["deleted"] == [ids[1]]
+
+    resp = await client.get(url, params={"since": "garbage"}, headers=headers)
+    assert resp.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_task_delta_sync_after_tombstones_pruned(client: AsyncClient, db_session):
+    from app.services.archive_service import ArchiveService
+
+    token, _ = await register_and_login(
+        client, "prune@example.com", org_name="OrgPrune"
+    )
+    headers = {"Authorization": f"Bearer {token}"}
+    resp = await client.post("/api/v1/projects", json={"name": "P"}, headers=headers)
+    project_id = resp.json()["id"]
+    url = f"/api/v1/projects/{project_id}/tasks/changes"
+    ids = []
+    for i in range(2):
+        resp = await client.post(
+            f"/api/v1/projects/{project_id}/tasks",
+            json={"title": f"T{i}"},
+            headers=headers,
+        )
+        ids.append(resp.json()["id"])
+    old_cursor = (await client.get(url, headers=headers)).json()["cursor"]
+    await client.delete(f"/api/v1/tasks/{ids[0]}", headers=headers)
+    resp = await client.get(url, params={"since": old_cursor}, headers=headers)
+    assert resp.json()["deleted"] == [ids[0]]
+    new_cursor = resp.json()["cursor"]
+
+    # Past the retention window the tombstone goes; a cursor from before the
+    # deletion can no longer learn about it
+    pruned = ArchiveService.prune_tombstones(
+        db_session, older_than_days=-1, batch_size=10
+    )
+    assert pruned == 1
+    resp = await client.get(url, params={"since": old_cursor}, headers=headers)
+    assert resp.status_code == 410
+    resp = await client.get(url, params={"since": new_cursor}, headers=headers)
+    assert resp.status_code == 200
+    assert resp.json()["deleted"] == []
+
+
+@pytest.mark.asyncio
+async def test_list_my_tasks_across_projects(client: AsyncClient):
+    admin_token, _ = await register_and_login(
+        client, "mytasksadmin@example.com", org_name="OrgMine"
+    )
+    admin = {"Authorization": f"Bearer {admin_token}"}
+    resp = await client.post(
+        "/api/v1/users",
+        json={"email": "mytasks@example.com", "password": "password123"},
+        headers=admin,
+    )
+    user_id = resp.json()["id"]
+    resp = await client.post(
+        "/api/v1/auth/login",
+        json={"email": "mytasks@example.com", "password": "password123"},
+    )
+    mine = {"Authorization": f"Bearer {resp.json()['access_token']}"}
+
+    today = date.today()
+    project_ids, expected = [], []
+    for name in ("MineA", "MineB"):
+        resp = await client.post("/api/v1/projects", json={"name": name}, headers=admin)
+        project_id = resp.json()["id"]
+        project_ids.append(project_id)
+        await client.post(
+            f"/api/v1/projects/{project_id}/members",
+            json={"user_ids": [user_id]},
+            headers=admin,
+        )
+        for offset in (3, None, 1):
+            resp = await client.post(
+                f"/api/v1/projects/{project_id}/tasks",
+                json={
+                    "title": f"{name} {offset}",
+                    "assignee_id": user_id,
+                    "due_date": str(today + timedelta(days=offset)) if offset else None,
+                },
+                headers=admin,
+            )
+            expected.append((offset, resp.json()["id"]))
+        await client.post(
+            f"/api/v1/projects/{project_id}/tasks",
+            json={"title": "someone else's"},
+            headers=admin,
+        )
+    # Soonest due first, undated last, ties by id
+    expected = [
+        task_id for _, task_id in sorted(expected, key=lambda e: (e[0] or 99, e[1]))
+    ]
+
+    url = "/api/v1/users/me/tasks"
+    seen, cursor = [], None
+    while True:
+        params = {"limit": 4, **({"cursor": cursor} if cursor else {})}
+        resp = await client.get(url, params=params, headers=mine)
+        assert resp.status_code == 200
+        seen += [t["id"] for t in resp.json()]
+        cursor = resp.headers.get("x-next-cursor")
+        if not cursor:
+            break
+    assert seen == expected
+
+    resp = await client.get(
+        url, params={"due_to": str(today + timedelta(days=2))}, headers=mine
+    )
+    assert [t["id"] for t in resp.json()] == expected[:2]
+    resp = await client.get(url, params={"status": "done"}, headers=mine)
+    assert resp.json() == []
+
+    # Tasks of a project the user has left drop out
+    await client.delete(
+        f"/api/v1/projects/{project_ids[1]}/members/{user_id}", headers=admin
+    )
+    resp = await client.get(url, params={"fields": "id,project_id"}, headers=mine)
+    assert {t["project_id"] for t in resp.json()} == {project_ids[0]}
+    assert set(resp.json()[0]) == {"id", "project_id"}
+
+
+@pytest.mark.asyncio
+async def test_write_requests_commit_once(client: AsyncClient, db_session):
+    from sqlalchemy import event, func, select
+
+    from app.models.notification import Notification, NotificationType
+
+    token, admin_id = await register_and_login(
+        client, "unitofwork@example.com", org_name="OrgUow"
+    )
+    headers = {"Authorization": f"Bearer {token}"}
+    resp = await client.post("/api/v1/projects", json={"name": "Uow"}, headers=headers)
+    project_id = resp.json()["id"]
+    commits = []
+
+    def on_commit(conn):
+        commits.append(conn)
+
+    engine = db_session.get_bind()
+    event.listen(engine, "commit", on_commit)
+    try:
+        resp = await client.post(
+            f"/api/v1/projects/{project_id}/tasks",
+            json={"title": "Mine", "assignee_id": admin_id},
+            headers=headers,
+        )
+        task_id = resp.json()["id"]
+        assert len(commits) == 1
+        resp = await client.patch(
+            f"/api/v1/tasks/{task_id}",
+            json={"title": "Still mine", "status": "in-progress"},
+            headers=headers,
+        )
+        assert resp.status_code == 200
+        assert len(commits) == 2
+        # Reads are never committed
+        await client.get(f"/api/v1/tasks/{task_id}", headers=headers)
+        assert len(commits) == 2
+        # A failed request leaves nothing behind
+        resp = await client.patch(
+            f"/api/v1/tasks/{task_id}", json={"status": "todo"}, headers=headers
+        )
+        assert resp.status_code == 400
+        assert len(commits) == 2
+    finally:
+        event.remove(engine, "commit", on_commit)
+
+    status_changes = db_session.scalar(
+        select(func.count(Notification.id)).where(
+            Notification.task_id == task_id,
+            Notification.type == NotificationType.status_change,
+        )
+    )
+    assert status_changes == 1
@@ -1,5 +1,11 @@
+from datetime import datetime
+
 import pytest
 from httpx import AsyncClient
+from sqlalchemy import delete, update
+
+from app.config import settings
+from app.models.user import User
 
 
 async def _register_and_login(
@@ -53,3 +59,166 @@ async def test_change_password_fail_wrong_current(client: AsyncClient):
     )
     assert resp.status_code == 400
     assert resp.json()["detail"] == "Current password is incorrect"
+
+
+@pytest.mark.asyncio
+async def test_principal_cache_hits_and_invalidation(client: AsyncClient):
+    token = await _register_and_login(client, "cached@example.com", "oldpass")
+    headers = {"Authorization": f"Bearer {token}"}
+
+    await client.get("/api/v1/users/me", headers=headers)
+    await client.get("/api/v1/users/me", headers=headers)
+    stats = (await client.get("/metrics/cache")).json()["principal"]
+    assert stats["misses"] == 1
+    assert stats["hits"] == 1
+
+    # Password change commits a user update, which evicts the cached principal
+    await client.patch(
+        "/api/v1/users/me/password",
+        headers=headers,
+        json={"current_password": "oldpass", "new_password": "newpass123"},
+    )
+    resp = await client.get("/api/v1/users/me", headers=headers)
+    stats = (await client.get("/metrics/cache")).json()["principal"]
+    assert stats["misses"] == 2
+    # ...and revokes the tokens issued before it
+    assert resp.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_logout_all_revokes_claims_only_tokens(client: AsyncClient):
+    token = await _register_and_login(client, "revoke@example.com")
+    headers = {"Authorization": f"Bearer {token}"}
+
+    # require_roles trusts token claims and does not load the user
+    resp = await client.get("/api/v1/users", headers=headers)
+    assert resp.status_code == 200
+
+    resp = await client.post("/api/v1/auth/logout-all", headers=headers)
+    assert resp.status_code == 204
+
+    assert (await client.get("/api/v1/users", headers=headers)).status_code == 401
+    assert (await client.get("/api/v1/users/me", headers=headers)).status_code == 401
+
+    # A fresh login carries the new token version
+    resp = await client.post(
+        "/api/v1/auth/login",
+        json={"email": "revoke@example.com", "password": "password123"},
+    )
+    new_headers = {"Authorization": f"Bearer {resp.json()['access_token']}"}
+    assert (await client.get("/api/v1/users", headers=new_headers)).status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_revocation_refresh_reads_only_recent_bumps(
+    client: AsyncClient, db_session, query_counter, monkeypatch
+):
+    token = await _register_and_login(client, "elsewhere@example.com")
+    headers = {"Authorization": f"Bearer {token}"}
+    assert (await client.get("/api/v1/users", headers=headers)).status_code == 200
+
+    # Another process revokes the user; this one sees it on its next refresh
+    db_session.execute(
+        update(User)
+        .where(User.email == "elsewhere@example.com")
+        .values(
+            token_version=User.token_version + 1, token_revoked_at=datetime.utcnow()
+        )
+    )
+    db_session.commit()
+    monkeypatch.setattr(settings, "token_revocation_refresh_seconds", -1)
+    query_counter.reset()
+    assert (await client.get("/api/v1/users", headers=headers)).status_code == 401
+    (refresh,) = [s for s in query_counter.statements if "token_revoked_at" in s]
+    assert "token_revoked_at >=" in refresh
+
+
+@pytest.mark.asyncio
+async def test_deleted_user_gets_401_not_500(client: AsyncClient, db_session):
+    token = await _register_and_login(client, "gone@example.com")
+    headers = {"Authorization": f"Bearer {token}"}
+    # Caches the principal, which outlives the row deleted behind its back
+    assert (await client.get("/api/v1/users/me", headers=headers)).status_code == 200
+    db_session.execute(delete(User).where(User.email == "gone@example.com"))
+    db_session.commit()
+
+    resp = await client.post("/api/v1/auth/logout-all", headers=headers)
+    assert resp.status_code == 401
+    resp = await client.patch(
+        "/api/v1/users/me/password",
+        json={"current_password": "password123", "new_password": "password456"},
+        headers=headers,
+    )
+    assert resp.status_code == 401
+
+
+class FakePrincipalRedis:
+    """Strings plus the principal cache's store script, run in Python."""
+
+    def __init__(self):
+        self.strings: dict[str, str] = {}
+
+    def mget(self, keys):
+        return [self.strings.get(k) for k in keys]
+
+    def pipeline(self, transaction=True):
+        return self
+
+    def incr(self, key):
+        self.strings[key] = str(int(self.strings.get(key, "0")) + 1)
+
+    def expire(self, key, seconds):
+        pass
+
+    def delete(self, key):
+        self.strings.pop(key, None)
+
+    def execute(self):
+        pass
+
+    def register_script(self, source):
+        def store(keys, args, client=None):
+            if self.strings.get(keys[1], "0") != args[0]:
+                return 0
+            self.strings[keys[0]] = args[1]
+            return 1
+
+        return store
+
+
+@pytest.mark.asyncio
+async def test_principal_cache_never_stores_a_superseded_principal(
+    client: AsyncClient, db_session, monkeypatch
+):
+    from app.core import principal_cache
+
+    fake = FakePrincipalRedis()
+    monkeypatch.setattr(principal_cache, "redis_call", lambda op, default: op(fake))
+    await _register_and_login(client, "stale@example.com")
+    user = db_session.query(User).filter_by(email="stale@example.com").one()
+    key = f"principal:{user.id}"
+    principal_cache._local.delete(user.id)
+
+    # A write commits (and invalidates) while this miss is loading the row:
+    # the principal it read must not be published to either tier
+    get_by_id = principal_cache.UserRepository.get_by_id
+
+    def load_then_invalidate(db, user_id):
+        loaded = get_by_id(db, user_id)
+        principal_cache.invalidate(user_id)
+        return loaded
+
+    monkeypatch.setattr(
+        principal_cache.UserRepository,
+        "get_by_id",
+        staticmethod(load_then_invalidate),
+    )
+    assert principal_cache.get_principal(db_session, user.id) is not None
+    assert key not in fake.strings
+    assert principal_cache._local.get(user.id) is None
+
+    # The next miss reads the raised generation and stores normally
+    monkeypatch.setattr(principal_cache.UserRepository, "get_by_id", get_by_id)
+    principal_cache.get_principal(db_session, user.id)
+    assert key in fake.strings
+    assert principal_cache._local.get(user.id) is not None